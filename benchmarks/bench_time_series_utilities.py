@@ -0,0 +1,86 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+# Times the de-duplication and trimming helpers of T2Utilities against the list based versions they
+# replaced. Run with: python benchmarks/bench_time_series_utilities.py [number_of_samples]
+
+import sys
+import timeit
+import numpy as np
+from pytoughreact.utilities.t2_utilities import T2Utilities
+
+
+def remove_repetiting_lists(time_list, value_list):
+    final_time_list = []
+    final_value_list = []
+    for i in range(0, len(time_list)):
+        if time_list[i] not in final_time_list:
+            final_time_list.append(time_list[i])
+            final_value_list.append(value_list[i])
+    for i in range(len(final_time_list) - 1, 0, -1):
+        if final_time_list[i] - final_time_list[i - 1] < 1:
+            del final_time_list[i]
+            del final_value_list[i]
+    return final_time_list, final_value_list
+
+
+def trim_data_points_lists(time_data, result_data, slice_value):
+    for i in range(len(time_data) - 1, 0, -1):
+        if time_data[i] > slice_value:
+            del time_data[i]
+            del result_data[i]
+    return time_data, result_data
+
+
+def make_history(number_of_samples):
+    random_state = np.random.default_rng(0)
+    times = np.cumsum(random_state.uniform(0.0, 2.0, number_of_samples))
+    times = np.concatenate([times, times[::10]])
+    return times.tolist(), random_state.random(len(times)).tolist()
+
+
+def measure(function, lists, *args):
+    return min(timeit.repeat(lambda: function(*[list(items) for items in lists], *args), number=1, repeat=3))
+
+
+def main(number_of_samples):
+    utilities = T2Utilities()
+    small_times, small_values = make_history(20000)
+    times, values = make_history(number_of_samples)
+    slice_value = times[len(times) // 20]
+    size = str(len(times))
+    rows = [('remove_repetiting (list, 2e4)', measure(remove_repetiting_lists, [small_times, small_values])),
+            ('remove_repetiting (numpy, 2e4)', measure(utilities.remove_repetiting, [small_times, small_values])),
+            ('remove_repetiting (numpy, ' + size + ')', measure(utilities.remove_repetiting, [times, values])),
+            ('trim_data_points (list, ' + size + ')', measure(trim_data_points_lists, [times, values], slice_value)),
+            ('trim_data_points (numpy, ' + size + ')',
+             measure(utilities.trim_data_points, [times, values], slice_value)),
+            ('duplicate_index (numpy, ' + size + ')', measure(utilities.duplicate_index, [times]))]
+    for name, seconds in rows:
+        print(name.ljust(45) + '{:10.4f} s'.format(seconds))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -35,3 +35,6 @@ EXPERIMENT = 'experiment'
 RESTART_FILES = 'restart_files'
 GENERATION = 'generation'
 SIMULATION = 'simulation'
+HEADLESS = 'headless'
+DPI = 'dpi'
+GEOMETRY_CACHE = 'geometry_cache'
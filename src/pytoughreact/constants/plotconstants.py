@@ -55,6 +55,10 @@ VERTICAL = 'vertical'
 MY_STYLE = 'mystyle'
 CLASSIC = 'classic'
 TIGHT_BBOX = 'tight'
+DEFAULT_DPI = 600
+ANIMATION_DPI = 150
+ANIMATION_FPS = 4
+HEADLESS_BACKEND = 'Agg'
 LOC_BEST = 'best'
 LOC_LOWER_CENTER = 'lower center'
 PLAIN_STYLE = 'plain'
@@ -64,6 +68,8 @@ MINOR = 'minor'
 CMAP_COLOR = 'coolwarm'
 IMAGE_TYPE = '.png'
 METHOD = 'nearest'
+SHADING_NEAREST = 'nearest'
+ORIGIN_LOWER = 'lower'
 INTERPOLATION = 'none'
 ASPECT = 'auto'
 
@@ -0,0 +1,421 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+import matplotlib.pyplot as plt
+import pytoughreact.constants.generalconstants as gc
+import pytoughreact.constants.plotconstants as pc
+from pytoughreact.plotting.plot_tough_routine import PlotTough
+
+TIME_PLOT = 'time'
+RESTART_TIME_PLOT = 'time_restart'
+PARAM_PLOT = 'param'
+LAYER_PLOT = 'layer'
+PLAIN_2D_PLOT = '2d'
+GRID_2D_PLOT = '2d_grid'
+PLOT_KINDS = [TIME_PLOT, RESTART_TIME_PLOT, PARAM_PLOT, LAYER_PLOT, PLAIN_2D_PLOT, GRID_2D_PLOT]
+
+_worker_plotter = {}
+
+
+class PlotJob(object):
+    """ One figure to be rendered by the batch renderer """
+    def __init__(self, kind, param, grid_block_number=0, time=None, format_of_date=pc.YEAR, style=None,
+                 file_location=None, direction_x_axis=pc.X_CAPS, direction_y_axis=pc.Z_CAPS, layer_number=1,
+                 output_name=None):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        kind :  str
+            Type of plot: 'time', 'time_restart', 'param', 'layer', '2d' or '2d_grid'
+        param : str or list[str]
+            Parameter to be plotted. A pair (x parameter, y parameter) for 'param' plots and a list for
+            'layer' plots.
+        grid_block_number : int
+            Grid block of 'time', 'time_restart' and 'param' plots
+        time : float
+            Output time of 'layer', '2d' and '2d_grid' plots
+        format_of_date : str
+            The format of the date; could be minute, hour, day or year
+        style : str
+            Matplotlib style applied while the figure is drawn
+        file_location : str
+            Run directory. Can be left out when the renderer is given the run directories.
+        direction_x_axis : str
+            Direction on the x-axis of 'layer', '2d' and '2d_grid' plots
+        direction_y_axis : str
+            Direction on the y-axis of 'layer', '2d' and '2d_grid' plots
+        layer_number : int
+            Layer of 'layer' plots
+        output_name : str
+            Name of the image, without extension. Defaults to a name built from the kind, parameters,
+            grid block or time of the job, so that different jobs of a run do not overwrite each other.
+
+        Returns
+        --------
+
+        """
+        if kind not in PLOT_KINDS:
+            raise ValueError('kind can only be one of ' + ', '.join(PLOT_KINDS))
+        self.kind = kind
+        self.param = param
+        self.grid_block_number = grid_block_number
+        self.time = time
+        self.format_of_date = format_of_date
+        self.style = style
+        self.file_location = file_location
+        self.direction_x_axis = direction_x_axis
+        self.direction_y_axis = direction_y_axis
+        self.layer_number = layer_number
+        self.output_name = output_name
+
+    def __repr__(self):
+        return 'Plot job ' + self.kind + ' of ' + str(self.param) + ' in ' + str(self.file_location)
+
+    def with_location(self, file_location):
+        """ Copy of the job for another run directory
+
+        Parameters
+        -----------
+        file_location : str
+            Run directory
+
+        Returns
+        --------
+        job : PlotJob
+            Same plot for the given run
+
+        """
+        job = PlotJob(self.kind, self.param, self.grid_block_number, self.time, self.format_of_date, self.style,
+                      file_location, self.direction_x_axis, self.direction_y_axis, self.layer_number,
+                      self.output_name)
+        return job
+
+    def get_output_name(self):
+        """ Name of the image of the job, without extension
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        output_name : str
+            The given output name, or one built from the kind, parameters, grid block or time of the job
+
+        """
+        if self.output_name is not None:
+            return self.output_name
+        params = [self.param] if isinstance(self.param, str) else list(self.param)
+        output_name = self.kind + ' ' + ' '.join(str(param) for param in params)
+        if self.kind in [TIME_PLOT, RESTART_TIME_PLOT, PARAM_PLOT]:
+            return output_name + ' block ' + str(self.grid_block_number)
+        output_name = output_name + ' ' + self.direction_x_axis + self.direction_y_axis + ' time ' + str(self.time)
+        if self.kind == LAYER_PLOT:
+            output_name = output_name + ' layer ' + str(self.layer_number)
+        return output_name
+
+    def draw(self, plotter):
+        """ Draw the job with a plotter of its run
+
+        Parameters
+        -----------
+        plotter : PlotTough
+            Plotter of the run, created in headless mode
+
+        Returns
+        --------
+
+        """
+        if self.kind == TIME_PLOT:
+            plotter.plot_param_with_time(self.param, self.grid_block_number, self.format_of_date)
+        elif self.kind == RESTART_TIME_PLOT:
+            plotter.plot_param_with_time_restart(self.param, self.grid_block_number, self.format_of_date)
+        elif self.kind == PARAM_PLOT:
+            plotter.plot_param_with_param(self.param[0], self.param[1], self.grid_block_number)
+        elif self.kind == LAYER_PLOT:
+            plotter.plot_param_with_layer(self.direction_x_axis, self.direction_y_axis, list(self.param),
+                                          self.layer_number, self.time)
+        elif self.kind == PLAIN_2D_PLOT:
+            plotter.plot_2d_one(self.direction_y_axis, self.direction_x_axis, self.param, self.time)
+        else:
+            plotter.plot_2d_with_grid(self.direction_y_axis, self.direction_x_axis, self.param, self.time)
+
+
+def use_headless_backend():
+    """ Switch matplotlib of the current process to the non-interactive Agg backend
+
+    Parameters
+    -----------
+
+
+    Returns
+    --------
+
+    """
+    matplotlib.use(pc.HEADLESS_BACKEND, force=True)
+
+
+def clear_worker_plotter():
+    """ Close the plotter kept by this process so that its result files are released
+
+    Parameters
+    -----------
+
+
+    Returns
+    --------
+
+    """
+    for plotter in _worker_plotter.values():
+        plotter.close()
+    _worker_plotter.clear()
+
+
+def get_worker_plotter(simulator_type, file_location, file_title, dpi, plot_options):
+    """ Headless plotter of a run, kept for the next jobs of the same run sent to this process so that
+    the run is parsed once per worker
+
+    Parameters
+    -----------
+    simulator_type :  str
+        can either be toughreact, tmvoc or tough3
+    file_location : str
+        Run directory
+    file_title : str
+        Title of the result file, e.g. 'kdd_conc.tec' or 'OUTPUT_ELEME.csv'
+    dpi : int
+        Resolution of the saved images
+    plot_options : dict
+        Other keyword arguments of PlotTough, e.g. restart_files or experiment
+
+    Returns
+    --------
+    plotter : PlotTough
+        Plotter of the run
+
+    """
+    key = (simulator_type, file_location, file_title, dpi, repr(sorted(plot_options.items())))
+    if key not in _worker_plotter:
+        clear_worker_plotter()
+        options = dict(plot_options)
+        options[gc.HEADLESS] = True
+        options[gc.DPI] = dpi
+        _worker_plotter[key] = PlotTough(simulator_type, file_location, file_title, **options)
+    return _worker_plotter[key]
+
+
+def render_run_jobs(simulator_type, file_location, file_title, dpi, plot_options, jobs):
+    """ Render several jobs of one run with a single plotter, closing every figure a job leaves open
+
+    Parameters
+    -----------
+    simulator_type :  str
+        can either be toughreact, tmvoc or tough3
+    file_location : str
+        Run directory
+    file_title : str
+        Title of the result file
+    dpi : int
+        Resolution of the saved images
+    plot_options : dict
+        Other keyword arguments of PlotTough
+    jobs : list[PlotJob]
+        Jobs of the run
+
+    Returns
+    --------
+    file_paths : list[list[str]]
+        Images saved by each job
+
+    """
+    plotter = get_worker_plotter(simulator_type, file_location, file_title, dpi, plot_options)
+    file_paths = []
+    for job in jobs:
+        open_figures = set(plt.get_fignums())
+        first_file = len(plotter.saved_files)
+        plotter.output_name = job.get_output_name()
+        try:
+            if job.style is None:
+                job.draw(plotter)
+            else:
+                with plt.style.context(job.style):
+                    job.draw(plotter)
+        finally:
+            plotter.output_name = None
+            for figure_number in set(plt.get_fignums()) - open_figures:
+                plt.close(figure_number)
+        file_paths.append(plotter.saved_files[first_file:])
+    return file_paths
+
+
+class BatchRenderer(object):
+    """ Renders many plots of many runs without a display, spreading the runs over a process pool """
+    def __init__(self, simulator_type, file_title, max_workers=None, dpi=pc.DEFAULT_DPI, executor='process',
+                 **kwargs):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        simulator_type :  str
+            can either be toughreact, tmvoc or tough3
+        file_title : str
+            Title of the result file of every run, e.g. 'kdd_conc.tec' or 'OUTPUT_ELEME.csv'
+        max_workers : int
+            Number of worker processes. Defaults to the number of processors.
+        dpi : int
+            Resolution of the saved images
+        executor : str
+            'process' to render in a pool of processes on the Agg backend, or 'serial' to render in
+            the calling process
+        kwargs : dict
+            Other keyword arguments of PlotTough, e.g. restart_files or experiment
+
+        Returns
+        --------
+
+        """
+        if executor not in ['process', 'serial']:
+            raise ValueError("executor can either be 'process' or 'serial'")
+        self.simulator_type = simulator_type
+        self.file_title = file_title
+        self.max_workers = max_workers
+        self.dpi = dpi
+        self.executor = executor
+        self.plot_options = kwargs
+
+    def __repr__(self):
+        return 'Batch renderer of ' + self.file_title + ' for ' + self.simulator_type
+
+    def get_executor(self):
+        """ Pool of worker processes, each switched to the Agg backend
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        executor : concurrent.futures.ProcessPoolExecutor
+            Process pool of the requested size
+
+        """
+        return ProcessPoolExecutor(max_workers=self.max_workers, initializer=use_headless_backend)
+
+    @staticmethod
+    def check_output_names(jobs):
+        """ Make sure no two jobs of a run would save their images under the same name
+
+        Parameters
+        -----------
+        jobs : list[PlotJob]
+            Jobs with their run directory
+
+        Returns
+        --------
+
+        """
+        output_jobs = {}
+        for job in jobs:
+            key = (job.file_location, job.get_output_name())
+            if key in output_jobs:
+                raise ValueError(repr(output_jobs[key]) + ' and ' + repr(job) + ' would both be saved as ' +
+                                 key[1] + ', give them different output names')
+            output_jobs[key] = job
+
+    def split_jobs(self, jobs, worker_count):
+        """ Group jobs by run and cut the groups into tasks, so that a task parses its run once and
+        there are enough tasks to keep every worker busy
+
+        Parameters
+        -----------
+        jobs : list[PlotJob]
+            Jobs with their run directory
+        worker_count : int
+            Number of workers
+
+        Returns
+        --------
+        tasks : list[tuple]
+            (run directory, positions of the jobs in the input list) of each task
+
+        """
+        runs = {}
+        for position, job in enumerate(jobs):
+            if job.file_location is None:
+                raise ValueError('The run directory of ' + repr(job) + ' is not given')
+            runs.setdefault(job.file_location, []).append(position)
+        tasks_per_run = max(1, math.ceil(worker_count / max(len(runs), 1)))
+        tasks = []
+        for file_location, positions in runs.items():
+            chunk_size = max(1, math.ceil(len(positions) / tasks_per_run))
+            for start in range(0, len(positions), chunk_size):
+                tasks.append((file_location, positions[start:start + chunk_size]))
+        return tasks
+
+    def render(self, jobs, file_locations=None):
+        """ Render plot jobs and save them as images in their run directories
+
+        Parameters
+        -----------
+        jobs : list[PlotJob]
+            Jobs to be rendered
+        file_locations : list[str]
+            Run directories. If given, every job is rendered for every run.
+
+        Returns
+        --------
+        file_paths : list[list[str]]
+            Images saved by each job, in the order of the jobs (run by run if file_locations is given)
+
+        """
+        if file_locations is not None:
+            jobs = [job.with_location(file_location) for file_location in file_locations for job in jobs]
+        self.check_output_names(jobs)
+        file_paths = [None] * len(jobs)
+        if self.executor == 'serial':
+            tasks = self.split_jobs(jobs, 1)
+            try:
+                for file_location, positions in tasks:
+                    task_paths = render_run_jobs(self.simulator_type, file_location, self.file_title, self.dpi,
+                                                 self.plot_options, [jobs[position] for position in positions])
+                    for position, job_paths in zip(positions, task_paths):
+                        file_paths[position] = job_paths
+            finally:
+                clear_worker_plotter()
+            return file_paths
+        tasks = self.split_jobs(jobs, self.max_workers or os.cpu_count() or 1)
+        with self.get_executor() as executor:
+            futures = [executor.submit(render_run_jobs, self.simulator_type, file_location, self.file_title,
+                                       self.dpi, self.plot_options, [jobs[position] for position in positions])
+                       for file_location, positions in tasks]
+            for (file_location, positions), future in zip(tasks, futures):
+                for position, job_paths in zip(positions, future.result()):
+                    file_paths[position] = job_paths
+        return file_paths
@@ -0,0 +1,432 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib import animation
+from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.results.result_tough_react import ResultReact
+from pytoughreact.results.time_index import TimeIndex
+from pytoughreact.plotting.batch_renderer import use_headless_backend
+from pytoughreact.plotting.plot_geometry import get_plot_geometry
+from pytoughreact.utilities.t2_utilities import T2Utilities
+import pytoughreact.constants.generalconstants as gc
+import pytoughreact.constants.plotconstants as pc
+
+CELLS = 'cells'
+RASTER = 'raster'
+GIF_EXTENSION = '.gif'
+MP4_EXTENSION = '.mp4'
+
+
+class FieldFrames(object):
+    """ Frames of a 2D field over time, ready to be drawn into a figure that is built once """
+    def __init__(self, kind, frames, labels, param, horizontal, vertical, horizontal_axis=None, vertical_axis=None,
+                 mesh_raster=None, vmin=None, vmax=None):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        kind :  str
+            'cells' for values on the unique axes of a rectilinear grid, 'raster' for an interpolated image
+        frames : np.ndarray
+            For 'cells', array of shape (frame, row, column) with the rows in ascending vertical coordinate. For
+            'raster', array of shape (frame, element) that is interpolated one frame at a time when drawn.
+        labels : list[str]
+            Title of each frame
+        param : str
+            Plotted parameter
+        horizontal : str
+            Direction on the x axis
+        vertical : str
+            Direction on the y axis
+        horizontal_axis : np.ndarray
+            Cell centres along x, for 'cells'
+        vertical_axis : np.ndarray
+            Cell centres along y, for 'cells'
+        mesh_raster : MeshRaster
+            Interpolation of the element values onto the image, for 'raster'
+        vmin : float
+            Lower end of the colour scale. Defaults to the smallest value of all frames.
+        vmax : float
+            Upper end of the colour scale. Defaults to the largest value of all frames.
+
+        Returns
+        --------
+
+        """
+        self.kind = kind
+        self.frames = frames
+        self.labels = list(labels)
+        self.param = param
+        self.horizontal = horizontal
+        self.vertical = vertical
+        self.horizontal_axis = horizontal_axis
+        self.vertical_axis = vertical_axis
+        self.mesh_raster = mesh_raster
+        self.extent = None if mesh_raster is None else mesh_raster.extent
+        self.vmin = np.nanmin(frames) if vmin is None else vmin
+        self.vmax = np.nanmax(frames) if vmax is None else vmax
+
+    def __repr__(self):
+        return str(len(self.frames)) + ' frames of ' + self.param
+
+    def __len__(self):
+        return len(self.frames)
+
+    def subset(self, frame_numbers):
+        """ Frames of a part of the animation, keeping the colour scale of the whole animation
+
+        Parameters
+        -----------
+        frame_numbers : list[int]
+            Frames to be kept
+
+        Returns
+        --------
+        field_frames : FieldFrames
+            Selected frames
+
+        """
+        return FieldFrames(self.kind, self.frames[frame_numbers], [self.labels[i] for i in frame_numbers],
+                           self.param, self.horizontal, self.vertical, self.horizontal_axis, self.vertical_axis,
+                           self.mesh_raster, self.vmin, self.vmax)
+
+    def get_frame(self, frame_number):
+        """ Image data of one frame. Irregular meshes are interpolated here so that only one image is held at a time
+
+        Parameters
+        -----------
+        frame_number : int
+            Frame to be drawn
+
+        Returns
+        --------
+        frame : np.ndarray
+            Array of shape (row, column)
+
+        """
+        if self.kind == CELLS:
+            return self.frames[frame_number]
+        return self.mesh_raster.interpolate(self.frames[frame_number])
+
+    def build_figure(self):
+        """ Figure, colour bar and labels of the animation, drawn with the first frame
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        fig, artists : matplotlib.figure.Figure, list
+            Figure and the [field, title] artists that change between frames
+
+        """
+        fig, ax = plt.subplots(1, 1)
+        if self.kind == CELLS:
+            field = ax.pcolormesh(self.horizontal_axis, self.vertical_axis, self.get_frame(0),
+                                  shading=pc.SHADING_NEAREST, cmap=pc.CMAP_COLOR, vmin=self.vmin, vmax=self.vmax)
+        else:
+            field = ax.imshow(self.get_frame(0), extent=self.extent, origin=pc.ORIGIN_LOWER, cmap=pc.CMAP_COLOR,
+                              vmin=self.vmin, vmax=self.vmax, aspect=pc.ASPECT, interpolation=pc.INTERPOLATION)
+        colour_bar = fig.colorbar(field, pad=0.01)
+        try:
+            label = T2Utilities().param_label_full(self.param.upper())
+        except KeyError:
+            label = self.param
+        colour_bar.ax.set_ylabel(label, fontsize=12)
+        ax.set_xlabel(pc.HORIZONTAL_ADDED.capitalize() + ' ' + pc.DISTANCE.capitalize() + ' ' + pc.OPEN_BRACKET +
+                      pc.METER + pc.CLOSE_BRACKET, fontsize=12)
+        ax.set_ylabel(pc.VERTICAL_ADDED.capitalize() + ' ' + pc.DEPTH.capitalize() + ' ' + pc.OPEN_BRACKET +
+                      pc.METER + pc.CLOSE_BRACKET, fontsize=12)
+        title = ax.set_title(self.labels[0], fontsize=12)
+        fig.tight_layout()
+        return fig, [field, title]
+
+    def update(self, artists, frame_number):
+        """ Replace the image data and title of the figure by those of another frame
+
+        Parameters
+        -----------
+        artists : list
+            [field, title] artists returned by build_figure
+        frame_number : int
+            Frame to be shown
+
+        Returns
+        --------
+        artists : list
+            Changed artists, for blitting
+
+        """
+        field, title = artists
+        if self.kind == CELLS:
+            field.set_array(self.get_frame(frame_number))
+        else:
+            field.set_data(self.get_frame(frame_number))
+        title.set_text(self.labels[frame_number])
+        return artists
+
+
+def render_frame_chunk(field_frames, file_paths, dpi):
+    """ Write frames as PNG images from one figure, changing only its image data between frames
+
+    Parameters
+    -----------
+    field_frames : FieldFrames
+        Frames to be written
+    file_paths : list[str]
+        Image path of each frame
+    dpi : int
+        Resolution of the images
+
+    Returns
+    --------
+    file_paths : list[str]
+        Written images
+
+    """
+    fig, artists = field_frames.build_figure()
+    try:
+        for frame_number, file_path in enumerate(file_paths):
+            field_frames.update(artists, frame_number)
+            fig.savefig(file_path, dpi=dpi)
+    finally:
+        plt.close(fig)
+    return file_paths
+
+
+class FieldAnimation(object):
+    """ Time-lapse animation of a parameter on a 2D section, from a single parse of the result file """
+    def __init__(self, simulator_type, file_location, file_title, param, horizontal=pc.X_CAPS,
+                 vertical=pc.Z_CAPS, times=None, format_of_date=pc.YEAR, dpi=pc.ANIMATION_DPI, geometry_cache=None):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        simulator_type :  str
+            can either be toughreact, tmvoc or tough3
+        file_location : str
+            specifies the location of the file on the system
+        file_title : str
+            gives the title of the file e.g 'kdd_conc.tec' or 'OUTPUT_ELEME.csv'.
+        param : str
+            parameter to be animated, e.g. 'pH'
+        horizontal : str
+            direction on the x axis
+        vertical : str
+            direction on the y axis
+        times : list[float]
+            output times (in seconds) of the frames. Defaults to every output time of the file.
+        format_of_date : str
+            unit of the time shown in the title; could be minute, hour, day or year
+        dpi : int
+            resolution of the frames
+        geometry_cache : str
+            directory where the plot geometry of the mesh is cached between runs
+
+        Returns
+        --------
+
+        """
+        self.simulator_type = simulator_type
+        self.file_location = file_location
+        self.file_title = file_title
+        self.param = param
+        self.horizontal = horizontal
+        self.vertical = vertical
+        self.times = times
+        self.format_of_date = format_of_date
+        self.dpi = dpi
+        self.geometry_cache = geometry_cache
+        self._file_reader = None
+        self._field_frames = None
+
+    def __repr__(self):
+        return 'Animation of ' + self.param + ' from ' + os.path.join(self.file_location, self.file_title)
+
+    def read_file(self):
+        """ Result reader of the file, created once
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        file_reader : ResultTough3 or ResultReact
+            Reader of the result file
+
+        """
+        if self._file_reader is None:
+            if self.simulator_type.lower() == gc.TMVOC or self.simulator_type.lower() == gc.TOUGH3.lower():
+                self._file_reader = ResultTough3(self.simulator_type, self.file_location, self.file_title)
+            else:
+                self._file_reader = ResultReact(self.simulator_type, self.file_location, self.file_title)
+        return self._file_reader
+
+    def close(self):
+        """ Release the result file and the frames read from it. They are read again on the next use.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        if self._file_reader is not None:
+            self._file_reader.close()
+        self._file_reader = None
+        self._field_frames = None
+
+    def get_frames(self):
+        """ Values of every frame laid out on the section, computed once for all frames
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        field_frames : FieldFrames
+            Frames of the animation and their common colour scale
+
+        """
+        if self._field_frames is None:
+            file_reader = self.read_file()
+            time_axis = file_reader.get_time_axis()
+            if self.times is None:
+                time_indices = np.arange(len(time_axis))
+            else:
+                requested_times = np.asarray(self.times, dtype=np.float64)
+                time_indices = np.atleast_1d(TimeIndex(time_axis.seconds).lookup(requested_times))
+            values = np.asarray(file_reader.get_element_data(time_axis.seconds[time_indices], self.param),
+                                dtype=np.float64).reshape(len(time_indices), -1)
+            converted_times = time_axis.convert(self.format_of_date)[time_indices]
+            labels = [pc.TIME.capitalize() + ' = ' + '{:.4g}'.format(time) + ' ' + str(self.format_of_date)
+                      for time in converted_times]
+            grid = file_reader.get_grid()
+            positions = grid.get_plane_positions(self.horizontal, self.vertical)
+            if positions is not None:
+                horizontal_axis = grid.get_axis(self.horizontal)
+                vertical_axis = grid.get_axis(self.vertical)
+                frames = np.empty((len(time_indices), len(vertical_axis) * len(horizontal_axis)))
+                frames[:, positions] = values
+                frames = frames.reshape(len(time_indices), len(vertical_axis), len(horizontal_axis))
+                self._field_frames = FieldFrames(CELLS, frames, labels, self.param, self.horizontal, self.vertical,
+                                                 horizontal_axis=horizontal_axis, vertical_axis=vertical_axis)
+            else:
+                mesh_raster = get_plot_geometry(grid, self.horizontal, self.vertical,
+                                                self.geometry_cache).get_mesh_raster()
+                self._field_frames = FieldFrames(RASTER, values, labels, self.param, self.horizontal, self.vertical,
+                                                 mesh_raster=mesh_raster)
+        return self._field_frames
+
+    def save(self, file_path, fps=pc.ANIMATION_FPS):
+        """ Write the animation as a GIF or MP4 movie. The figure is built once and only its image data and
+        title change between frames.
+
+        Parameters
+        -----------
+        file_path : str
+            Full path of the movie. The extension selects the writer: '.gif' (Pillow) or '.mp4' (FFmpeg).
+        fps : int
+            Frames per second
+
+        Returns
+        --------
+        file_path : str
+            Full path of the written movie
+
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension == GIF_EXTENSION:
+            writer = animation.PillowWriter(fps=fps)
+        elif extension == MP4_EXTENSION:
+            if not animation.FFMpegWriter.isAvailable():
+                raise ValueError('FFmpeg is needed to write ' + file_path + ', write a .gif or PNG frames instead')
+            writer = animation.FFMpegWriter(fps=fps)
+        else:
+            raise ValueError('Animations can only be written as ' + GIF_EXTENSION + ' or ' + MP4_EXTENSION)
+        field_frames = self.get_frames()
+        fig, artists = field_frames.build_figure()
+        try:
+            movie = animation.FuncAnimation(fig, lambda frame_number: field_frames.update(artists, frame_number),
+                                            frames=len(field_frames), blit=True, repeat=False)
+            movie.save(file_path, writer=writer, dpi=self.dpi)
+        finally:
+            plt.close(fig)
+        return file_path
+
+    def save_frames(self, directory=None, prefix=None, max_workers=None, executor='process'):
+        """ Write every frame as a PNG image, splitting the frames into chunks rendered in parallel
+
+        Parameters
+        -----------
+        directory : str
+            Directory of the images. Defaults to the location of the result file.
+        prefix : str
+            Start of the image names, followed by the frame number. Defaults to the parameter.
+        max_workers : int
+            Number of worker processes. Defaults to the number of processors.
+        executor : str
+            'process' to render the chunks in a pool of processes, or 'serial' to render in the calling
+            process
+
+        Returns
+        --------
+        file_paths : list[str]
+            Images in frame order
+
+        """
+        if executor not in ['process', 'serial']:
+            raise ValueError("executor can either be 'process' or 'serial'")
+        if directory is None:
+            directory = self.file_location
+        if prefix is None:
+            prefix = self.param
+        field_frames = self.get_frames()
+        digits = len(str(max(len(field_frames) - 1, 0)))
+        file_paths = [os.path.join(directory, prefix + '_' + str(frame_number).zfill(digits) + pc.IMAGE_TYPE)
+                      for frame_number in range(len(field_frames))]
+        if executor == 'serial':
+            return render_frame_chunk(field_frames, file_paths, self.dpi)
+        worker_count = max_workers or os.cpu_count() or 1
+        chunk_size = max(1, math.ceil(len(field_frames) / worker_count))
+        chunks = [list(range(start, min(start + chunk_size, len(field_frames))))
+                  for start in range(0, len(field_frames), chunk_size)]
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=use_headless_backend) as pool:
+            futures = [pool.submit(render_frame_chunk, field_frames.subset(chunk),
+                                   [file_paths[frame_number] for frame_number in chunk], self.dpi)
+                       for chunk in chunks]
+            for future in futures:
+                future.result()
+        return file_paths
@@ -0,0 +1,113 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import os
+import matplotlib.pyplot as plt
+import pytoughreact.constants.generalconstants as gc
+import pytoughreact.constants.plotconstants as pc
+
+
+def finish_figure(fig, file_path=None, headless=False, dpi=pc.DEFAULT_DPI):
+    """ Show a finished figure and save it. In headless mode the figure is not shown but closed after saving,
+    so batch rendering neither needs a display nor keeps figures alive.
+
+    Parameters
+    -----------
+    fig :  matplotlib.figure.Figure
+        Finished figure
+    file_path : str
+        Full path of the image. The figure is not saved if None.
+    headless : boolean
+        Save and close the figure instead of showing it
+    dpi : int
+        Resolution of the saved image
+
+    Returns
+    --------
+    file_path : str
+        Full path of the saved image or None
+
+    """
+    if not headless:
+        plt.show()
+    try:
+        if file_path is not None:
+            fig.savefig(file_path, bbox_inches=pc.TIGHT_BBOX, dpi=dpi)
+    finally:
+        if headless:
+            plt.close(fig)
+    return file_path
+
+
+class FigureOutput(object):
+    """ Saving of finished figures shared by the plot classes. The keyword arguments read from the plot class are
+
+    headless : boolean
+        save and close figures without showing them, for batch rendering on the Agg backend
+    dpi : int
+        resolution of the saved images. Defaults to 600.
+    """
+    def set_figure_output(self, output_directory, kwargs):
+        """ Read the figure output options
+
+        Parameters
+        -----------
+        output_directory :  str
+            Directory in which images named by output_name are saved
+        kwargs : dict
+            Keyword arguments of the plot class
+
+        Returns
+        --------
+
+        """
+        self.output_directory = output_directory
+        self.headless = kwargs.get(gc.HEADLESS, False)
+        self.dpi = kwargs.get(gc.DPI, pc.DEFAULT_DPI)
+        self.saved_files = []
+        self.output_name = None
+
+    def _finish_figure(self, fig, file_path=None):
+        """ Show and save a finished figure, or save and close it in headless mode
+
+        Parameters
+        -----------
+        fig :  matplotlib.figure.Figure
+            Finished figure
+        file_path : str
+            Full path of the image. Replaced by output_name in the output directory when that is set.
+
+        Returns
+        --------
+        file_path : str
+            Full path of the saved image or None
+
+        """
+        if self.output_name is not None:
+            file_path = os.path.join(self.output_directory, self.output_name + pc.IMAGE_TYPE)
+        file_path = finish_figure(fig, file_path, self.headless, self.dpi)
+        if file_path is not None:
+            self.saved_files.append(file_path)
+        return file_path
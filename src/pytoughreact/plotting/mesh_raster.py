@@ -0,0 +1,124 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import numpy as np
+from scipy.spatial import Delaunay
+
+RASTER_COLUMNS = 800
+RASTER_ROWS = 600
+
+
+class MeshRaster(object):
+    """ Linear interpolation of scattered element values onto a fixed raster. The Delaunay triangulation and
+    the interpolation weights of every pixel are computed once per mesh, so each new field only costs a
+    weighted sum of three values per pixel. """
+    def __init__(self, x, y, columns=RASTER_COLUMNS, rows=RASTER_ROWS):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        x :  np.ndarray
+            Horizontal coordinate of each element
+        y :  np.ndarray
+            Vertical coordinate of each element
+        columns : int
+            Number of pixels of the raster along x
+        rows : int
+            Number of pixels of the raster along y
+
+        Returns
+        --------
+
+        """
+        points = np.column_stack([np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)])
+        self.extent = [points[:, 0].min(), points[:, 0].max(), points[:, 1].min(), points[:, 1].max()]
+        self.shape = (rows, columns)
+        pixel_x, pixel_y = np.meshgrid(np.linspace(self.extent[0], self.extent[1], columns),
+                                       np.linspace(self.extent[2], self.extent[3], rows))
+        pixels = np.column_stack([pixel_x.ravel(), pixel_y.ravel()])
+        triangulation = Delaunay(points)
+        simplices = triangulation.find_simplex(pixels)
+        self.inside = simplices >= 0
+        simplices = simplices[self.inside]
+        transform = triangulation.transform[simplices]
+        barycentric = np.einsum('ijk,ik->ij', transform[:, :2], pixels[self.inside] - transform[:, 2])
+        self.vertices = triangulation.simplices[simplices]
+        self.weights = np.column_stack([barycentric, 1 - barycentric.sum(axis=1)])
+
+    @classmethod
+    def from_arrays(cls, extent, shape, inside, vertices, weights):
+        """ Raster rebuilt from the arrays of an earlier triangulation, e.g. read back from a cache file
+
+        Parameters
+        -----------
+        extent : list[float]
+            [left, right, bottom, top] of the raster
+        shape : tuple
+            (rows, columns) of the raster
+        inside : np.ndarray
+            Flag of each pixel inside the convex hull of the elements
+        vertices : np.ndarray
+            Elements at the corners of the triangle of each inside pixel
+        weights : np.ndarray
+            Barycentric weight of each corner
+
+        Returns
+        --------
+        mesh_raster : MeshRaster
+            Raster using the given weights
+
+        """
+        mesh_raster = cls.__new__(cls)
+        mesh_raster.extent = [float(value) for value in extent]
+        mesh_raster.shape = (int(shape[0]), int(shape[1]))
+        mesh_raster.inside = np.asarray(inside, dtype=bool)
+        mesh_raster.vertices = np.asarray(vertices)
+        mesh_raster.weights = np.asarray(weights, dtype=np.float64)
+        return mesh_raster
+
+    def __repr__(self):
+        return 'Mesh raster of ' + str(self.shape[1]) + ' x ' + str(self.shape[0]) + ' pixels'
+
+    def interpolate(self, values):
+        """ Raster of element values
+
+        Parameters
+        -----------
+        values :  np.ndarray
+            Value of each element, in the order of the coordinates, along the last axis. Leading axes
+            (e.g. time) are kept.
+
+        Returns
+        --------
+        raster : np.ndarray
+            Array of shape (..., rows, columns) with the first row at the smallest y. Pixels outside the
+            convex hull of the elements are NaN.
+
+        """
+        values = np.asarray(values, dtype=np.float64)
+        leading = values.shape[:-1]
+        raster = np.full(leading + (self.shape[0] * self.shape[1],), np.nan)
+        raster[..., self.inside] = np.einsum('...ij,ij->...i', values[..., self.vertices], self.weights)
+        return raster.reshape(leading + self.shape)
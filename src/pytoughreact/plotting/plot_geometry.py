@@ -0,0 +1,261 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import hashlib
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from pytoughreact.plotting.mesh_raster import MeshRaster
+from pytoughreact.utilities.t2_utilities import T2Utilities
+
+GEOMETRY_PREFIX = 'plot_geometry_'
+GEOMETRY_EXTENSION = '.npz'
+GEOMETRY_CACHE_SIZE = 8
+_plot_geometries = {}
+
+
+class PlotGeometry(object):
+    """ Everything about a plane of the mesh that 2D plots need and that does not change between times or
+    parameters: grid levels, reshape dimensions, tick positions and labels, minor grid lines, extent and the
+    raster triangulation """
+    def __init__(self, horizontal_values, vertical_values, file_path=None):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        horizontal_values :  np.ndarray
+            Coordinate of each element along the x axis of the plot
+        vertical_values :  np.ndarray
+            Coordinate of each element along the y axis of the plot
+        file_path : str
+            Cache file the raster triangulation is written to once built. Not written if None.
+
+        Returns
+        --------
+
+        """
+        self.horizontal_values = np.asarray(horizontal_values, dtype=np.float64)
+        self.vertical_values = np.asarray(vertical_values, dtype=np.float64)
+        self.file_path = file_path
+        self.mesh_hash = get_mesh_hash(self.horizontal_values, self.vertical_values)
+        self.horizontal_levels = pd.unique(self.horizontal_values)
+        self.vertical_levels = pd.unique(self.vertical_values)
+        self.shape = (len(self.vertical_levels), len(self.horizontal_levels))
+        self.extent = [self.horizontal_values.min(), self.horizontal_values.max(),
+                       self.vertical_values.min(), self.vertical_values.max()]
+        self.figure_height = 10 if self.shape[0] > 5 else 4
+        self._find_ticks()
+        self._mesh_raster = None
+
+    def __repr__(self):
+        return 'Plot geometry of ' + str(len(self.horizontal_values)) + ' elements with ' + \
+            str(self.shape[0]) + ' x ' + str(self.shape[1]) + ' levels'
+
+    def _find_ticks(self):
+        """ Major tick positions and labels and minor tick positions of the gridded plot
+
+        """
+        modifier = T2Utilities()
+        slicer_x = len(self.horizontal_levels)
+        slicer_z = len(self.vertical_levels)
+        if slicer_z < 10:
+            slicer_z = 1
+        if slicer_x <= 10:
+            slicer_x = 1
+        while slicer_x > 10 or slicer_z > 10:
+            if slicer_x > 10:
+                slicer_x = np.round(slicer_x / 2)
+            if slicer_z > 10:
+                slicer_z = np.round(slicer_z / 2)
+        self.x_ticks = np.arange(0, self.shape[1], slicer_x)
+        self.z_ticks = np.arange(0, self.shape[0], slicer_z)
+        x_min, x_max, z_min, z_max = self.extent
+        depth = np.abs(self.vertical_values)
+        depth_step = (z_max - z_min) / max(len(self.z_ticks) - 1, 1)
+        if x_max < 1 or z_max < 1:
+            self.x_tick_labels = self.horizontal_levels[self.x_ticks.astype(int)]
+            self.z_tick_labels = np.round(modifier.crange(depth.min(), depth.max(), depth_step), 4)
+        else:
+            x_step = (x_max - x_min) / max(len(self.x_ticks) - 1, 1)
+            self.x_tick_labels = np.round(modifier.crange(x_min, x_max, x_step), 2)
+            self.z_tick_labels = np.round(modifier.crange(depth.min(), depth.max(), depth_step), 2)
+        self.x_minor_ticks = np.arange(-.5, self.shape[1], 1)
+        self.z_minor_ticks = np.arange(-.5, self.shape[0], 1)
+
+    def get_mesh_raster(self):
+        """ Raster interpolation of the element centres, triangulated once and written to the cache file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        mesh_raster : MeshRaster
+            Triangulation of the element centres and interpolation weights of each pixel
+
+        """
+        if self._mesh_raster is None:
+            self._mesh_raster = MeshRaster(self.horizontal_values, self.vertical_values)
+            if self.file_path is not None:
+                self.save(self.file_path)
+        return self._mesh_raster
+
+    def save(self, file_path):
+        """ Write the geometry and its raster triangulation, if built, to a cache file
+
+        Parameters
+        -----------
+        file_path :  str
+            Full path of the cache file
+
+        Returns
+        --------
+        file_path : str
+            Full path of the written cache file
+
+        """
+        arrays = {'horizontal_values': self.horizontal_values, 'vertical_values': self.vertical_values}
+        if self._mesh_raster is not None:
+            arrays.update({'extent': np.asarray(self._mesh_raster.extent),
+                           'shape': np.asarray(self._mesh_raster.shape),
+                           'inside': self._mesh_raster.inside,
+                           'vertices': self._mesh_raster.vertices,
+                           'weights': self._mesh_raster.weights})
+        directory = os.path.dirname(os.path.abspath(file_path))
+        file_descriptor, temporary_path = tempfile.mkstemp(suffix=GEOMETRY_EXTENSION, dir=directory)
+        try:
+            with os.fdopen(file_descriptor, 'wb') as geometry_file:
+                np.savez(geometry_file, **arrays)
+            os.replace(temporary_path, file_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        return file_path
+
+    @classmethod
+    def load(cls, file_path):
+        """ Read a geometry written by save
+
+        Parameters
+        -----------
+        file_path :  str
+            Full path of the cache file
+
+        Returns
+        --------
+        geometry : PlotGeometry
+            Geometry with its raster triangulation, if one was written
+
+        """
+        with np.load(file_path) as archive:
+            geometry = cls(archive['horizontal_values'], archive['vertical_values'], file_path)
+            if 'weights' in archive.files:
+                geometry._mesh_raster = MeshRaster.from_arrays(archive['extent'], archive['shape'],
+                                                               archive['inside'], archive['vertices'],
+                                                               archive['weights'])
+        return geometry
+
+
+def get_mesh_hash(horizontal_values, vertical_values):
+    """ Hash of the element coordinates of a plane, identifying the mesh independently of the run
+
+    Parameters
+    -----------
+    horizontal_values :  np.ndarray
+        Coordinate of each element along the x axis of the plot
+    vertical_values :  np.ndarray
+        Coordinate of each element along the y axis of the plot
+
+    Returns
+    --------
+    mesh_hash : str
+        Hexadecimal SHA-1 digest of the coordinates
+
+    """
+    digest = hashlib.sha1()
+    for values in [horizontal_values, vertical_values]:
+        digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def get_plot_geometry(grid, horizontal, vertical, cache_directory=None):
+    """ Plot geometry of a plane of the mesh, computed once per mesh and kept in memory. With a cache
+    directory it is also read from and written to disk, so other runs on the same mesh reuse it.
+
+    Parameters
+    -----------
+    grid :  StructuredGrid
+        Grid index of the results
+    horizontal :  str
+        Direction on the x axis
+    vertical :  str
+        Direction on the y axis
+    cache_directory : str
+        Directory of the cache files, or None to keep the geometry in memory only
+
+    Returns
+    --------
+    geometry : PlotGeometry
+        Geometry of the plane
+
+    """
+    horizontal_values = grid.coordinates[:, grid.get_direction_index(horizontal)]
+    vertical_values = grid.coordinates[:, grid.get_direction_index(vertical)]
+    mesh_hash = get_mesh_hash(horizontal_values, vertical_values)
+    file_path = None
+    if cache_directory is not None:
+        file_path = os.path.join(cache_directory, GEOMETRY_PREFIX + mesh_hash + GEOMETRY_EXTENSION)
+    if mesh_hash in _plot_geometries:
+        geometry = _plot_geometries.pop(mesh_hash)
+        if geometry.file_path is None and file_path is not None:
+            geometry.file_path = file_path
+            if geometry._mesh_raster is not None:
+                geometry.save(file_path)
+    else:
+        if file_path is not None and os.path.isfile(file_path):
+            geometry = PlotGeometry.load(file_path)
+        else:
+            geometry = PlotGeometry(horizontal_values, vertical_values, file_path)
+        if len(_plot_geometries) >= GEOMETRY_CACHE_SIZE:
+            _plot_geometries.pop(next(iter(_plot_geometries)))
+    _plot_geometries[mesh_hash] = geometry
+    return geometry
+
+
+def clear_plot_geometries():
+    """ Forget the plot geometries kept in memory
+
+    Parameters
+    -----------
+
+
+    Returns
+    --------
+
+    """
+    _plot_geometries.clear()
@@ -35,9 +35,10 @@ import pytoughreact.constants.plotconstants as pc
 import pytoughreact.constants.reactionconstants as rc
 
 from pytoughreact.utilities.t2_utilities import T2Utilities
+from pytoughreact.plotting.figure_output import FigureOutput
 
 
-class PlotMultiFiles(object):
+class PlotMultiFiles(FigureOutput):
     def __init__(self, simulator_type, file_locations, file_titles, props,
                  **kwargs):
         """
@@ -62,6 +63,8 @@ class PlotMultiFiles(object):
             if the plot should be made per file and not per property
         tile : str
             title of each of the plots
+        headless, dpi
+            figure output options, see FigureOutput
 
 
         Returns
@@ -75,29 +78,64 @@ class PlotMultiFiles(object):
         self.file_titles = file_titles
         self.simulator_type = simulator_type
         self.props = props
-        self.modifier = T2Utilities
+        self.modifier = T2Utilities()
         self.x_slice_value = kwargs.get(gc.X_SLICE_VALUE)
         self.per_file = kwargs.get(gc.PER_FILE)
         self.title = kwargs.get(gc.TITLE)
+        self.set_figure_output(file_locations[0], kwargs)
+        self._multi_tough = None
 
     def _validate_input(self):
-        """ Validate Inputs
+        """ Validate Inputs. The multiple-file reader is kept, so every plot of this object parses each file once.
         """
-        if self.simulator_type.lower() == gc.TOUGHREACT:
-            multi_tough = MultiResultReact(self.simulator_type,
-                                           self.file_locations,
-                                           self.file_titles,
-                                           self.props,
-                                           x_slice_value=self.x_slice_value)
-        elif self.simulator_type.lower() == gc.TMVOC:
-            multi_tough = MultiResultTough3(self.simulator_type,
-                                            self.file_locations,
-                                            self.file_titles,
-                                            self.props)
-        else:
-            print("Code only has capability for TOUGHREACT or TOUGH3 \
-                  (by extension TMVOC)")
-        return multi_tough
+        if self._multi_tough is None:
+            if self.simulator_type.lower() == gc.TOUGHREACT:
+                self._multi_tough = MultiResultReact(self.simulator_type,
+                                                     self.file_locations,
+                                                     self.file_titles,
+                                                     self.props,
+                                                     x_slice_value=self.x_slice_value)
+            elif self.simulator_type.lower() in [gc.TMVOC, gc.TOUGH3.lower()]:
+                self._multi_tough = MultiResultTough3(self.simulator_type,
+                                                      self.file_locations,
+                                                      self.file_titles,
+                                                      self.props)
+            else:
+                raise ValueError('Code only has capability for TOUGHREACT or TOUGH3 (by extension TMVOC)')
+        return self._multi_tough
+
+    def close(self):
+        """ Release the parsed results of every file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        if self._multi_tough is not None:
+            self._multi_tough.close()
+        self._multi_tough = None
+
+    @staticmethod
+    def _get_panel_rows(panel_count, minimum_rows=3):
+        """ Number of rows of a two-column grid of panels
+
+        Parameters
+        -----------
+        panel_count :  int
+            Number of panels
+        minimum_rows :  int
+            Smallest number of rows of the grid
+
+        Returns
+        --------
+        rows : int
+            Number of rows holding every panel
+        """
+        return max(minimum_rows, math.ceil(panel_count / 2))
 
     def _plot_raw_single(self, data, legend):
         """ Plot of Single File
@@ -112,23 +150,19 @@ class PlotMultiFiles(object):
         Returns
         --------
         """
-        prop_index = 0
+        values = data.to_numpy()
         fig, axs = plt.subplots(1, 1)
-        for i in range(0, len(data.columns), 2):
-            x_data = data.iloc[:, i]
-            y_data = data.iloc[:, i + 1]
-            axs.plot(x_data, y_data, marker=pc.CARET_SYMBOL)
-            axs.set_xlabel(pc.X_LABEL_TIME_YEAR, fontsize=14)
-            axs.set_ylabel(self.props[prop_index], fontsize=14)
-            axs.legend(legend, loc=pc.LOC_BEST)
-            axs.ticklabel_format(useOffset=False)
+        for i in range(0, values.shape[1], 2):
+            axs.plot(values[:, i], values[:, i + 1], marker=pc.CARET_SYMBOL)
+        axs.set_xlabel(pc.X_LABEL_TIME_YEAR, fontsize=14)
+        axs.set_ylabel(self.props[0], fontsize=14)
+        axs.legend(legend, loc=pc.LOC_BEST)
+        axs.ticklabel_format(useOffset=False)
         plt.setp(axs.get_xticklabels(), fontsize=14)
         plt.setp(axs.get_yticklabels(), fontsize=14)
-        os.chdir(self.file_locations[0])
         plt.tight_layout()
-        plt.show()
-        fig.savefig(self.props[0] + ' ' + pc.DIFFERENT_FILES_TAG + ' ' +
-                    pc.IMAGE_TYPE, bbox_inches=pc.TIGHT_BBOX, dpi=600)
+        self._finish_figure(fig, os.path.join(self.file_locations[0], self.props[0] + ' ' +
+                                              pc.DIFFERENT_FILES_TAG + ' ' + pc.IMAGE_TYPE))
 
     def _plot_raw_multi(self, data, legend):
         """ Plot of Multi File
@@ -144,34 +178,24 @@ class PlotMultiFiles(object):
         --------
         """
 
+        values = data.to_numpy()
         fig = plt.figure()
-        plot_counter = 1
-        start_point = 0
-        prop_index = 0
-        initial_length = len(self.props) * 2
-        for number in range(1, len(self.props)):
-            axs = plt.subplot(3, 2, plot_counter)
-            legend_index = 0
-            for i in range(start_point, initial_length, 2):
-                x_data = data.iloc[:, i]
-                y_data = data.iloc[:, i + 1]
-                axs.plot(x_data, y_data, marker=pc.CARET_SYMBOL,
-                         label=legend[legend_index])
-                axs.set_xlabel(pc.X_LABEL_TIME_YEAR)
-                axs.set_ylabel(self.props[prop_index])
-                legend_index = legend_index + 1
-            plot_counter = plot_counter + 1
-            start_point = start_point + (len(self.props) * 2)
-            initial_length = initial_length + (len(self.props) * 2)
-            prop_index = prop_index + 1
+        rows = self._get_panel_rows(len(self.props) - 1)
+        stride = len(self.props) * 2
+        for prop_index in range(0, len(self.props) - 1):
+            axs = fig.add_subplot(rows, 2, prop_index + 1)
+            start_point = prop_index * stride
+            for legend_index, i in enumerate(range(start_point, min(start_point + stride, values.shape[1]), 2)):
+                axs.plot(values[:, i], values[:, i + 1], marker=pc.CARET_SYMBOL, label=legend[legend_index])
+            axs.set_xlabel(pc.X_LABEL_TIME_YEAR)
+            axs.set_ylabel(self.props[prop_index])
         handles, labels = axs.get_legend_handles_labels()
         plt.setp(axs.get_xticklabels(), fontsize=14)
         plt.setp(axs.get_yticklabels(), fontsize=14)
         plt.figlegend(handles, labels, loc=pc.LOC_LOWER_CENTER, ncol=5,
                       labelspacing=0.)
-        plt.show()
-        fig.savefig(self.props[0] + ' ' + pc.DIFFERENT_FILES_TAG + ' ' +
-                    pc.IMAGE_TYPE, bbox_inches=pc.TIGHT_BBOX, dpi=600)
+        self._finish_figure(fig, os.path.join(self.file_locations[0], self.props[0] + ' ' +
+                                              pc.DIFFERENT_FILES_TAG + ' ' + pc.IMAGE_TYPE))
 
     def _set_tough_y_label(self, value):
         """ Convert the value in tough results to understandable values
@@ -217,46 +241,27 @@ class PlotMultiFiles(object):
         --------
 
         """
+        values = data.to_numpy()
         fig = plt.figure(figsize=(10, 10))
-        plot_counter = 1
-        start_point = 0
-        prop_index = 0
+        rows = math.ceil(len(self.props) / 2) + 1
+        stride = len(self.props) * 2
         markers = pc.ALL_MARKERS
-        for number in range(1, len(self.props) + 1):
-            if number == 4:
-                pass
-            axs = plt.subplot(math.ceil(len(self.props) / 2) + 1, 2,
-                              plot_counter)
-            legend_index = 0
-            for i in range(start_point, len(data.columns),
-                           (len(self.props) * 2)):
-                x_data = data.iloc[:, i]
-                y_data = data.iloc[:, i + 1]
-                axs.plot(x_data, y_data, marker=markers[legend_index],
+        for prop_index in range(0, len(self.props)):
+            axs = fig.add_subplot(rows, 2, prop_index + 1)
+            for legend_index, i in enumerate(range(prop_index * 2, values.shape[1], stride)):
+                axs.plot(values[:, i], values[:, i + 1], marker=markers[legend_index],
                          label=legend[legend_index])
-                axs.set_xlabel('Time ' + '(' + format_of_date + ')',
-                               fontsize=14)
-                axs.set_ylabel(self._set_tough_y_label(self.props[prop_index]),
-                               fontsize=14)
-                axs.ticklabel_format(useOffset=False)
-                legend_index = legend_index + 1
-            plot_counter = plot_counter + 1
-            start_point = start_point + 2
-            prop_index = prop_index + 1
+            axs.set_xlabel('Time ' + '(' + format_of_date + ')', fontsize=14)
+            axs.set_ylabel(self._set_tough_y_label(self.props[prop_index]), fontsize=14)
+            axs.ticklabel_format(useOffset=False)
             plt.setp(axs.get_xticklabels(), fontsize=14)
             plt.setp(axs.get_yticklabels(), fontsize=14)
         handles, labels = axs.get_legend_handles_labels()
         fig.tight_layout()
-        if len(self.props) > 3:
-            plt.figlegend(handles, labels, loc=pc.LOC_LOWER_CENTER, ncol=4,
-                          labelspacing=0.)
-        else:
-            plt.figlegend(handles, labels, loc=pc.LOC_LOWER_CENTER, ncol=4,
-                          labelspacing=0.)
-        plt.show()
-        os.chdir(self.file_locations[0])
-        fig.savefig(self.props[0] + ' ' + pc.DIFFERENT_FILES_TAG + ' ' +
-                    pc.IMAGE_TYPE, bbox_inches=pc.TIGHT_BBOX, dpi=600)
+        plt.figlegend(handles, labels, loc=pc.LOC_LOWER_CENTER, ncol=4,
+                      labelspacing=0.)
+        self._finish_figure(fig, os.path.join(self.file_locations[0], self.props[0] + ' ' +
+                                              pc.DIFFERENT_FILES_TAG + ' ' + pc.IMAGE_TYPE))
 
     def _plot_raw_multi_file_panel(self, data, panels, format_of_date):
         """ Plot of Multi File Per Panel
@@ -274,64 +279,26 @@ class PlotMultiFiles(object):
         --------
 
         """
-        fig = plt.figure(figsize=(10, 8))
+        values = data.to_numpy()
+        fig, axs = plt.subplots(2, 2, figsize=(10, 8))
         start_point = 0
-        # markers = pc.ALL_MARKERS
-        fig, axs = plt.subplots(2, 2)
-        number = 0
-        length_of_prop = len(list(panels[number].values())[0][0])
-        for i in range(0, len(panels)):
-            x_data = data.iloc[:, start_point]
-            y_data = data.iloc[:, start_point + 1:start_point + length_of_prop
-                               + 1]
-            number += 1
+        for i in range(0, min(len(panels), 4)):
+            panel = list(panels[i].values())[0]
+            length_of_prop = len(panel[0])
+            axsa = axs.flat[i]
+            axsa.plot(values[:, start_point], values[:, start_point + 1:start_point + length_of_prop + 1])
             start_point = start_point + length_of_prop + 1
-            try:
-                length_of_prop = len(list(panels[number].values())[0][0])
-            except IndexError:
-                pass
             if i == 0:
-                # marker = itertools.cycle((',', '+', '.', 'o', '*'))
-                axsa = axs[0, 0]
-                axsa.plot(x_data, y_data)
-                y_label = list(panels[0].values())[0][2][0]
                 axsa.set_xlabel('Time ' + format_of_date, fontsize=12)
-                axsa.set_ylabel(y_label, fontsize=12)
-                axsa.ticklabel_format(useOffset=False)
-                axsa.legend(list(panels[0].values())[0][1], fontsize=12,
-                            loc=pc.LOC_BEST, shadow=True, fancybox=True)
-            elif i == 1:
-                axsa = axs[0, 1]
-                axsa.plot(x_data, y_data)
-                y_label = list(panels[1].values())[0][2][0]
-                axsa.set_xlabel(pc.X_LABEL_TIME_YEAR, fontsize=12)
-                axsa.set_ylabel(y_label, fontsize=12)
-                axsa.ticklabel_format(useOffset=False)
-                axsa.legend(list(panels[1].values())[0][1], fontsize=12,
-                            loc=pc.LOC_BEST, shadow=True, fancybox=True)
-            elif i == 2:
-                axsa = axs[1, 0]
-                axsa.plot(x_data, y_data)
-                y_label = list(panels[2].values())[0][2][0]
+            else:
                 axsa.set_xlabel(pc.X_LABEL_TIME_YEAR, fontsize=12)
-                axsa.set_ylabel(y_label, fontsize=12)
-                axsa.ticklabel_format(useOffset=False)
-                axsa.legend(list(panels[2].values())[0][1], fontsize=12,
-                            loc=pc.LOC_BEST, shadow=True, fancybox=True)
-            elif i == 3:
-                axsa = axs[1, 1]
-                axsa.plot(x_data, y_data)
-                y_label = list(panels[3].values())[0][2][0]
-                axsa.set_xlabel(pc.X_LABEL_TIME_YEAR, fontsize=12)
-                axsa.set_ylabel(y_label, fontsize=12)
-                axsa.ticklabel_format(useOffset=False)
-                axsa.legend(list(panels[3].values())[0][1], fontsize=10,
-                            loc=pc.LOC_BEST, shadow=True, fancybox=True)
+            axsa.set_ylabel(panel[2][0], fontsize=12)
+            axsa.ticklabel_format(useOffset=False)
+            axsa.legend(panel[1], fontsize=10 if i == 3 else 12,
+                        loc=pc.LOC_BEST, shadow=True, fancybox=True)
         fig.tight_layout()
-        plt.show()
-        fig.savefig(list(panels[0].values())[0][0][0] +
-                    pc.MULTI_PLOTS_PER_PANEL + pc.IMAGE_TYPE,
-                    bbox_inches=pc.TIGHT_BBOX, dpi=600)
+        self._finish_figure(fig, os.path.join(self.file_locations[0], list(panels[0].values())[0][0][0] +
+                                              pc.MULTI_PLOTS_PER_PANEL + pc.IMAGE_TYPE))
 
     def _plot_raw_multi_file_per_file(self, data, legend):
         """ Plot of Multi File Per File
@@ -347,60 +314,37 @@ class PlotMultiFiles(object):
         --------
 
         """
+        values = data.to_numpy()
         fig = plt.figure(figsize=(10, 8))
-        plot_counter = 1
-        start_point = 0
-        prop_index = 0
+        rows = self._get_panel_rows(len(self.props))
+        stride = len(self.props) * 2
         markers = pc.ALL_MARKERS
-        for number in range(1, len(self.props) + 1):
-            axs = plt.subplot(3, 2, plot_counter)
-            legend_index = 0
-            for i in range(start_point, len(data.columns), (len(self.props)
-                                                            * 2)):
-                x_data = data.iloc[:, i]
-                y_data = data.iloc[:, i + 1]
-                if gc.POROSITY in data.columns[i]:
-                    axs.plot(x_data, y_data, marker=markers[legend_index],
-                             label=self._set_tough_y_label(legend[legend_index]))
-                    axs.set_xlabel(pc.X_LABEL_TIME_YEAR, fontsize=14)
-                    if self.simulator_type.lower() == gc.TMVOC:
-                        axs.set_ylabel(
-                            self.modifier.param_label_full(
-                                self.props[prop_index]), fontsize=14)
-                    else:
-                        axs.set_ylabel(rc.CHANGE_IN_VOLUME_FRACTION,
-                                       fontsize=14)
-                else:
-                    axs.plot(x_data, y_data, marker=markers[legend_index],
-                             label=self._set_tough_y_label(legend[legend_index]))
-                    axs.set_xlabel(pc.X_LABEL_TIME_YEAR, fontsize=14)
-                    if self.simulator_type.lower() == gc.TMVOC:
-                        param_value = self.modifier.param_label_full(
-                            self.props[prop_index].upper())
-                        axs.set_ylabel(param_value, fontsize=14)
-                    else:
-                        axs.set_ylabel(rc.CHANGE_IN_VOLUME_FRACTION,
-                                       fontsize=14)
-                axs.ticklabel_format(useOffset=False)
-                plt.setp(axs.get_xticklabels(), fontsize=14)
-                plt.setp(axs.get_yticklabels(), fontsize=14)
-                legend_index = legend_index + 1
-            # axs.set_title(self.title[prop_index], fontsize='14')
+        for prop_index in range(0, len(self.props)):
+            axs = fig.add_subplot(rows, 2, prop_index + 1)
+            for legend_index, i in enumerate(range(prop_index * 2, values.shape[1], stride)):
+                axs.plot(values[:, i], values[:, i + 1], marker=markers[legend_index],
+                         label=self._set_tough_y_label(legend[legend_index]))
+            axs.set_xlabel(pc.X_LABEL_TIME_YEAR, fontsize=14)
+            if self.simulator_type.lower() != gc.TMVOC:
+                axs.set_ylabel(rc.CHANGE_IN_VOLUME_FRACTION, fontsize=14)
+            else:
+                param = self.props[prop_index]
+                if gc.POROSITY not in data.columns[prop_index * 2]:
+                    param = param.upper()
+                try:
+                    axs.set_ylabel(self.modifier.param_label_full(param), fontsize=14)
+                except KeyError:
+                    axs.set_ylabel(self.props[prop_index], fontsize=14)
+            axs.ticklabel_format(useOffset=False)
+            plt.setp(axs.get_xticklabels(), fontsize=14)
+            plt.setp(axs.get_yticklabels(), fontsize=14)
             axs.set_title(self.props[prop_index], fontsize='14')
-            plot_counter = plot_counter + 1
-            start_point = start_point + 2
-            prop_index = prop_index + 1
         handles, labels = axs.get_legend_handles_labels()
-        # handles2, labels2 = ax2s.get_legend_handles_labels()
-        # handles.append(handles2[0])
-        # labels.append(labels2[0])
         plt.figlegend(handles, labels, loc=pc.LOC_LOWER_CENTER, ncol=4,
                       labelspacing=0.)
         fig.tight_layout()
-        plt.show()
-        os.chdir(self.file_locations[0])
-        fig.savefig(self.props[0] + ' ' + pc.DIFFERENT_FILES_TAG + ' '
-                    + pc.IMAGE_TYPE, bbox_inches=pc.TIGHT_BBOX, dpi=600)
+        self._finish_figure(fig, os.path.join(self.file_locations[0], self.props[0] + ' ' + pc.DIFFERENT_FILES_TAG + ' '
+                                              + pc.IMAGE_TYPE))
 
     def multi_file_single_plot(self, grid_block_number, legend):
         """ Plot of  Multiple Files with a single plot
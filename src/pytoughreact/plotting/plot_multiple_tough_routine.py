@@ -23,7 +23,6 @@ SOFTWARE.
 
 '''
 
-import itertools
 from pytoughreact.utilities.t2_utilities import T2Utilities
 import os
 import numpy as np
@@ -31,13 +30,15 @@ import matplotlib.pyplot as plt
 import pandas as pd
 from pytoughreact.results.result_tough_3 import ResultTough3
 from pytoughreact.results.result_tough_react import ResultReact
+from pytoughreact.results.restart_chain import RestartChain
 from pytoughreact.results.simple_experiment_data import Experiment
+from pytoughreact.plotting.figure_output import FigureOutput
 import pytoughreact.constants.generalconstants as gc
 import pytoughreact.constants.plotconstants as pc
 from pytoughreact.exceptions.custom_error import ParameterLessThanThreeError
 
 
-class PlotMultiTough(object):
+class PlotMultiTough(FigureOutput):
     def __init__(self, simulatortype, filelocations, filetitles, **kwargs):
         """
         Class for processing multiple file results
@@ -59,6 +60,8 @@ class PlotMultiTough(object):
             restart file location
         experiment : str
             experimental file location
+        headless, dpi
+            figure output options, see FigureOutput
 
 
         Returns
@@ -73,9 +76,10 @@ class PlotMultiTough(object):
         self.args = kwargs.get(gc.RESTART_FILES)
         self.expt = kwargs.get(gc.EXPERIMENT)
         self.x_slice_value = kwargs.get(gc.X_SLICE_VALUE)
+        self.set_figure_output(filelocations, kwargs)
+        self._restart_chain = None
 
     def read_file(self):
-        os.chdir(self.filelocations)
         if (self.simulatortype.lower() == gc.TMVOC or
                 self.simulatortype.lower() == gc.TOUGH3):
             file_reader = ResultTough3(self.simulatortype, self.filelocations,
@@ -86,7 +90,6 @@ class PlotMultiTough(object):
         return file_reader
 
     def read_file_multi(self, file, filetitle):
-        os.chdir(file)
         if (self.simulatortype.lower() == gc.TMVOC or
                 self.simulatortype.lower() == gc.TOUGH3):
             file_reader = ResultTough3(self.simulatortype, file, filetitle)
@@ -100,48 +103,18 @@ class PlotMultiTough(object):
         restart_files = restart_files + self.args
         return restart_files
 
+    def get_restart_chain(self):
+        if self._restart_chain is None:
+            self._restart_chain = RestartChain(self.simulatortype, self.get_restart_locations(), self.filetitles,
+                                               executor='thread')
+        return self._restart_chain
+
     def get_restart_data_time(self, format_of_date):
-        locations = self.get_restart_locations()
-        final_time = []
-        for i in range(0, len(locations)):
-            if (self.simulatortype.lower() == gc.TMVOC or
-                    self.simulatortype.lower() == gc.TOUGH3):
-                file_reader = ResultTough3(self.simulatortype, locations[i],
-                                           self.filetitle)
-            else:
-                file_reader = ResultReact(self.simulatortype, locations[i],
-                                          self.filetitles)
-            if i == 0:
-                time_year = file_reader.convert_times(format_of_date)
-                final_time.append(time_year)
-            else:
-                time_year = file_reader.convert_times(format_of_date)
-                time_year = time_year[1:]
-                final_time.append(time_year)
-        final_time = list(itertools.chain.from_iterable(final_time))
+        final_time = self.get_restart_chain().convert_times(format_of_date)
         return final_time
 
     def get_restart_data_element(self, param, gridblocknumber):
-        locations = self.get_restart_locations()
-        final_result = []
-        for i in range(0, len(locations)):
-            if (self.simulatortype.lower() == gc.TMVOC or
-                    self.simulatortype.lower() == gc.TOUGH3):
-                file_reader = ResultTough3(self.simulatortype, locations[i],
-                                           self.filetitles)
-            else:
-                file_reader = ResultReact(self.simulatortype, locations[i],
-                                          self.filetitles)
-            if i == 0:
-                result_array = file_reader.get_timeseries_data(param,
-                                                               gridblocknumber)
-                final_result.append(result_array)
-            else:
-                result_array = file_reader.get_timeseries_data(param,
-                                                               gridblocknumber)
-                result_array = result_array[1:]
-                final_result.append(result_array)
-        final_result = list(itertools.chain.from_iterable(final_result))
+        final_result = self.get_restart_chain().get_timeseries_data(param, gridblocknumber)
         return final_result
 
     def _raw_multi_plot_restart_horizontal(self, param, format_of_date,
@@ -193,9 +166,7 @@ class PlotMultiTough(object):
             plt.setp(axs[j].get_yticklabels(), fontsize=12)
             j = j + 1
         plt.tight_layout()
-        plt.show()
-        fig.savefig(pc.MULTI_PLOT_DESCRIPTION_LABEL, bbox_inches=pc.TIGHT_BBOX,
-                    dpi=600)
+        self._finish_figure(fig, os.path.join(self.filelocations, pc.MULTI_PLOT_DESCRIPTION_LABEL))
 
     def _raw_multi_plot_restart_vertical(self, param, gridblocknumber,
                                          format_of_date):
@@ -244,9 +215,7 @@ class PlotMultiTough(object):
             elif format_of_date.lower() == pc.MINUTE:
                 ax.set_xlabel(pc.X_LABEL_TIME_MINUTE, fontsize=12)
         plt.tight_layout()
-        plt.show()
-        fig.savefig(pc.MULTI_PLOT_DESCRIPTION_LABEL, bbox_inches=pc.TIGHT_BBOX,
-                    dpi=600)
+        self._finish_figure(fig, os.path.join(self.filelocations, pc.MULTI_PLOT_DESCRIPTION_LABEL))
 
     def multi_time_plot_restart(self, param, gridblocknumber, format_of_date,
                                 style=pc.HORIZONTAL):
@@ -368,9 +337,7 @@ class PlotMultiTough(object):
             plt.setp(axs[j].get_yticklabels(), fontsize=12)
             j = j + 1
         plt.tight_layout()
-        plt.show()
-        fig.savefig(pc.MULTI_PLOT_DESCRIPTION_LABEL, bbox_inches=pc.TIGHT_BBOX,
-                    dpi=600)
+        self._finish_figure(fig, os.path.join(self.filelocations, pc.MULTI_PLOT_DESCRIPTION_LABEL))
 
     def _raw_multi_plot_horizontal_with_expt(self, param,
                                              format_of_date, gridblocknumber,
@@ -434,10 +401,7 @@ class PlotMultiTough(object):
             plt.setp(axs[j].get_yticklabels(), fontsize=12)
             j = j + 1
         plt.tight_layout()
-        plt.show()
-        os.chdir(self.filelocations)
-        fig.savefig(pc.MULTI_PLOT_DESCRIPTION_LABEL, bbox_inches=pc.TIGHT_BBOX,
-                    dpi=600)
+        self._finish_figure(fig, os.path.join(self.filelocations, pc.MULTI_PLOT_DESCRIPTION_LABEL))
 
     def _raw_multi_plot_restart_horizontal_with_expt(self,
                                                      param,
@@ -505,10 +469,7 @@ class PlotMultiTough(object):
             axs[j].legend()
             j = j + 1
         plt.tight_layout()
-        plt.show()
-        os.chdir(self.filelocations)
-        fig.savefig(pc.MULTI_PLOT_EXPERIMENT_RESTART_LABEL,
-                    bbox_inches=pc.TIGHT_BBOX, dpi=600)
+        self._finish_figure(fig, os.path.join(self.filelocations, pc.MULTI_PLOT_EXPERIMENT_RESTART_LABEL))
 
     def _raw_multi_plot_vertical(self, param, format_of_date, gridblocknumber):
         """ Line Plots of a multiple parameter in the results file as a
@@ -558,9 +519,7 @@ class PlotMultiTough(object):
                 ax.set_xlabel(pc.X_LABEL_TIME_MIN, fontsize=12)
             j = j + 1
         plt.tight_layout()
-        plt.show()
-        fig.savefig(pc.MULTI_PLOT_DESCRIPTION_LABEL, bbox_inches=pc.TIGHT_BBOX,
-                    dpi=600)
+        self._finish_figure(fig, os.path.join(self.filelocations, pc.MULTI_PLOT_DESCRIPTION_LABEL))
 
     def _raw_multi_plot_vertical_with_expt(self, param, format_of_date,
                                            grid_block_number,
@@ -621,9 +580,7 @@ class PlotMultiTough(object):
                 ax.set_xlabel(pc.X_LABEL_TIME_MIN, fontsize=12)
             j = j + 1
         plt.tight_layout()
-        plt.show()
-        fig.savefig(pc.MULTI_PLOT_DESCRIPTION_LABEL, bbox_inches=pc.TIGHT_BBOX,
-                    dpi=600)
+        self._finish_figure(fig, os.path.join(self.filelocations, pc.MULTI_PLOT_DESCRIPTION_LABEL))
 
     def multi_time_plot(self, param, gridblocknumber, format_of_date,
                         style=pc.HORIZONTAL):
@@ -791,10 +748,8 @@ class PlotMultiTough(object):
                 plt.setp(axs.get_yticklabels(), fontsize=14)
                 plt.legend()
                 plt.tight_layout()
-                plt.show()
-                fig.savefig(pc.MULTIPLE_PARAM + ' ' + pc.VERSUS + ' ' +
-                            pc.TIME + pc.IMAGE_TYPE, bbox_inches=pc.TIGHT_BBOX,
-                            dpi=600)
+                self._finish_figure(fig, os.path.join(self.filelocations, pc.MULTIPLE_PARAM + ' ' + pc.VERSUS + ' ' +
+                                                      pc.TIME + pc.IMAGE_TYPE))
         else:
             with plt.style.context(pc.CLASSIC):
                 fig, axs = plt.subplots(1, 1)
@@ -823,11 +778,9 @@ class PlotMultiTough(object):
                 plt.setp(axs.get_yticklabels(), fontsize=14)
                 plt.legend(loc=pc.LOC_BEST)
                 plt.tight_layout()
-                plt.show()
                 plt.tick_params(axis=pc.X, which=pc.MAJOR, labelsize=3)
-                fig.savefig(param[0] + pc.MULTIPLE_PARAM_OUTPUT
-                            + ' ' + pc.VERSUS + ' ' + pc.TIME + pc.IMAGE_TYPE,
-                            bbox_inches=pc.TIGHT_BBOX, dpi=600)
+                self._finish_figure(fig, os.path.join(self.filelocations, param[0] + pc.MULTIPLE_PARAM_OUTPUT
+                                                      + ' ' + pc.VERSUS + ' ' + pc.TIME + pc.IMAGE_TYPE))
 
     def multi_param_multi_file_plot(self, param, gridblocknumber, labels,
                                     format_of_date=pc.YEAR,
@@ -858,7 +811,6 @@ class PlotMultiTough(object):
         --------
 
         """
-        fig = plt.figure(figsize=(width, height))
         file_reader = self.read_file_multi(self.filelocations[0],
                                            self.filetitles[0])
         time_year = file_reader.convert_times(format_of_date)
@@ -870,7 +822,7 @@ class PlotMultiTough(object):
         subplot_i = 2
         k = 0
         subplot_j = 2
-        fig, axs = plt.subplots(subplot_i, subplot_j)
+        fig, axs = plt.subplots(subplot_i, subplot_j, figsize=(width, height))
         for number in range(subplot_i):
             for i in range(subplot_j):
                 for j in range(len(self.filelocations)):
@@ -892,4 +844,4 @@ class PlotMultiTough(object):
             k = k + 1
         plt.subplots_adjust(left=0.125, wspace=0.4, top=0.95)
         plt.tight_layout()
-        plt.show()
+        self._finish_figure(fig)
@@ -22,7 +22,6 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 
 '''
-import os
 from pytoughreact.plotting.plot_tough_routine import PlotTough
 from pytoughreact.plotting.plot_multiple_tough_routine import PlotMultiTough
 import pytoughreact.constants.generalconstants as gc
@@ -35,8 +34,6 @@ class PlotSingle(object):
         :type simulatortype: object
         """
         self.filelocation = filelocation
-        if isinstance(self.filelocation, str):
-            os.chdir(self.filelocation)
         self.filetitle = filetitle
         self.simulatortype = simulatortype
         self.generation = kwargs.get(gc.GENERATION)
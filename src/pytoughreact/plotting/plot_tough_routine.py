@@ -23,24 +23,24 @@ SOFTWARE.
 
 '''
 
-import itertools
 import math
 import os
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
-from scipy.interpolate import griddata
 from pytoughreact.utilities.t2_utilities import T2Utilities
 from pytoughreact.results.result_tough_3 import ResultTough3
 from pytoughreact.results.result_tough_react import ResultReact
+from pytoughreact.results.restart_chain import RestartChain
 from pytoughreact.results.simple_experiment_data import Experiment
+from pytoughreact.plotting.figure_output import FigureOutput
+from pytoughreact.plotting.plot_geometry import get_plot_geometry
 import pytoughreact.constants.generalconstants as gc
 import pytoughreact.constants.plotconstants as pc
 import pytoughreact.constants.grid_constants as grc
-import pandas as pd
 
 
-class PlotTough(object):
+class PlotTough(FigureOutput):
     def __init__(self, simulator_type, file_location, file_title, **kwargs):
         """
         Class for processing multiple file results
@@ -62,6 +62,10 @@ class PlotTough(object):
             restart file location
         experiment : str
             experimental file location
+        headless, dpi
+            figure output options, see FigureOutput
+        geometry_cache : str
+            directory where the plot geometry of the mesh is cached between runs
 
 
         Returns
@@ -69,26 +73,47 @@ class PlotTough(object):
 
         """
         self.file_location = file_location
-        os.chdir(self.file_location)
         self.filetitle = file_title
         self.simulatortype = simulator_type
         self.modifier = T2Utilities()
         self.generation = kwargs.get(gc.GENERATION)
         self.args = kwargs.get(gc.RESTART_FILES)
         self.expt = kwargs.get(gc.EXPERIMENT)
+        self.set_figure_output(file_location, kwargs)
+        self._restart_chain = None
+        self._file_reader = None
+        self.geometry_cache = kwargs.get(gc.GEOMETRY_CACHE)
 
     def _read_file(self):
-        """ Read in the input files
+        """ Read in the input files. The reader is kept, so every plot of this object shares one parse.
 
         """
-        if (self.simulatortype.lower() == gc.TMVOC or
-                self.simulatortype.lower() == gc.TOUGH3):
-            file_reader = ResultTough3(self.simulatortype, self.file_location,
-                                       self.filetitle, generation=self.generation)
-        else:
-            file_reader = ResultReact(self.simulatortype, self.file_location,
-                                      self.filetitle)
-        return file_reader
+        if self._file_reader is None:
+            if (self.simulatortype.lower() == gc.TMVOC or
+                    self.simulatortype.lower() == gc.TOUGH3.lower()):
+                self._file_reader = ResultTough3(self.simulatortype, self.file_location,
+                                                 self.filetitle, generation=self.generation)
+            else:
+                self._file_reader = ResultReact(self.simulatortype, self.file_location,
+                                                self.filetitle)
+        return self._file_reader
+
+    def close(self):
+        """ Release the result file and the restart chain read for the plots. They are read again by the
+        next plot.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        if self._file_reader is not None:
+            self._file_reader.close()
+        self._file_reader = None
+        self._restart_chain = None
 
     def _plot_raw(self, param, grid_block_number,
                   format_of_date, restart=False):
@@ -142,14 +167,12 @@ class PlotTough(object):
         plt.setp(axs.get_xticklabels(), fontsize=12)
         plt.setp(axs.get_yticklabels(), fontsize=12)
         plt.tight_layout()
-        plt.show()
         if restart is True:
-            fig.savefig(param + ' ' + pc.VERSUS + ' ' + pc.TIME + ' '
-                        + pc.RESTART + pc.IMAGE_TYPE,
-                        bbox_inches=pc.TIGHT_BBOX, dpi=600)
+            self._finish_figure(fig, os.path.join(self.file_location, param + ' ' + pc.VERSUS + ' ' + pc.TIME + ' '
+                                                  + pc.RESTART + pc.IMAGE_TYPE))
         else:
-            fig.savefig(param + ' ' + pc.VERSUS + ' ' + pc.TIME
-                        + pc.IMAGE_TYPE, bbox_inches=pc.TIGHT_BBOX, dpi=600)
+            self._finish_figure(fig, os.path.join(self.file_location, param + ' ' + pc.VERSUS + ' ' + pc.TIME
+                                                  + pc.IMAGE_TYPE))
 
     def plot_param_with_time(self, param, grid_block_number, format_of_date):
         """ Line Plots of a parameter in the results file as a function of time
@@ -193,6 +216,51 @@ class PlotTough(object):
         restart_files = restart_files + self.args
         return restart_files
 
+    def _get_restart_chain(self):
+        """ Get the results of the restarted runs stitched into one timeline, parsed once per plot object
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        restart_chain : RestartChain
+            Chain of this run followed by the restart runs
+
+        """
+        if self._restart_chain is None:
+            self._restart_chain = RestartChain(self.simulatortype, self._get_restart_locations(), self.filetitle,
+                                               executor='thread')
+        return self._restart_chain
+
+    def _get_restart_positions(self):
+        """ Positions on the stitched timeline that are plotted. TOUGH3 and TMVOC runs keep every output
+        time. TOUGHREACT runs are reduced run by run to about 15 points, as ResultReact reduces a single run.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        positions : np.ndarray
+            Positions of the plotted times in the stitched timeline
+
+        """
+        restart_chain = self._get_restart_chain()
+        positions = np.arange(len(restart_chain.get_store().times))
+        if (self.simulatortype.lower() == gc.TMVOC or
+                self.simulatortype.lower() == gc.TOUGH3.lower()):
+            return positions
+        sampled_positions = []
+        for segment_number in range(len(restart_chain.file_locations)):
+            segment_positions = positions[restart_chain.segments == segment_number].tolist()
+            if len(segment_positions) > 15:
+                segment_positions = self.modifier.chop_list(segment_positions, 15)
+            sampled_positions.extend(segment_positions)
+        return np.asarray(sampled_positions, dtype=np.intp)
+
     def _get_restart_data_time(self, format_of_date):
         """ Get Restart Time Data
 
@@ -207,24 +275,8 @@ class PlotTough(object):
             restart time data in a list
 
         """
-        locations = self._get_restart_locations()
-        restart_time = []
-        for i in range(0, len(locations)):
-            if (self.simulatortype.lower() == gc.TMVOC or
-                    self.simulatortype.lower() == gc.TOUGH3):
-                file_reader = ResultTough3(self.simulatortype, locations[i],
-                                           self.filetitle)
-            else:
-                file_reader = ResultReact(self.simulatortype, locations[i],
-                                          self.filetitle)
-            if i == 0:
-                time_year = file_reader.convert_times(format_of_date)
-                restart_time.append(time_year)
-            else:
-                time_year = file_reader.convert_times(format_of_date)
-                time_year = time_year[1:]
-                restart_time.append(time_year)
-        restart_time = list(itertools.chain.from_iterable(restart_time))
+        restart_time = self._get_restart_chain().get_store().get_time_axis().convert(format_of_date)
+        restart_time = restart_time[self._get_restart_positions()].tolist()
         return restart_time
 
     def _get_restart_data_element(self, param, grid_block_number):
@@ -243,26 +295,8 @@ class PlotTough(object):
             restart data in a list
 
         """
-        locations = self._get_restart_locations()
-        restart_result = []
-        for i in range(0, len(locations)):
-            if (self.simulatortype.lower() == gc.TMVOC or
-                    self.simulatortype.lower() == gc.TOUGH3):
-                file_reader = ResultTough3(self.simulatortype, locations[i],
-                                           self.filetitle)
-            else:
-                file_reader = ResultReact(self.simulatortype, locations[i],
-                                          self.filetitle)
-            if i == 0:
-                result_array = file_reader.get_timeseries_data(
-                    param, grid_block_number)
-                restart_result.append(result_array)
-            else:
-                result_array = file_reader.get_timeseries_data(
-                    param, grid_block_number)
-                result_array = result_array[1:]
-                restart_result.append(result_array)
-        restart_result = list(itertools.chain.from_iterable(restart_result))
+        restart_result = self._get_restart_chain().get_store().get_column(param)[:, grid_block_number]
+        restart_result = restart_result[self._get_restart_positions()].tolist()
         return restart_result
 
     def _plot_raw_with_expt(self, param, grid_block_number, format_of_date,
@@ -329,17 +363,12 @@ class PlotTough(object):
         plt.setp(axs.get_xticklabels(), fontsize=12)
         plt.setp(axs.get_yticklabels(), fontsize=12)
         plt.tight_layout()
-        plt.show()
         if restart is True:
-            os.chdir(self.file_location)
-            fig.savefig(param + ' ' + pc.VERSUS + ' ' + pc.TIME + ' '
-                        + pc.RESTART + ' ' + pc.EXPERIMENT + pc.IMAGE_TYPE,
-                        bbox_inches=pc.TIGHT_BBOX, dpi=600)
+            self._finish_figure(fig, os.path.join(self.file_location, param + ' ' + pc.VERSUS + ' ' + pc.TIME + ' '
+                                                  + pc.RESTART + ' ' + pc.EXPERIMENT + pc.IMAGE_TYPE))
         else:
-            os.chdir(self.file_location)
-            fig.savefig(param + ' ' + pc.VERSUS + ' '
-                        + pc.TIME + ' ' + pc.EXPERIMENT + pc.IMAGE_TYPE,
-                        bbox_inches=pc.TIGHT_BBOX, dpi=600)
+            self._finish_figure(fig, os.path.join(self.file_location, param + ' ' + pc.VERSUS + ' '
+                                                  + pc.TIME + ' ' + pc.EXPERIMENT + pc.IMAGE_TYPE))
 
     def plot_param_with_time_restart(self, param, grid_block_number,
                                      format_of_date):
@@ -412,11 +441,8 @@ class PlotTough(object):
                            + pc.METER + pc.CLOSE_BRACKET)
             axs.set_ylabel(self.modifier.param_label_full(param[0].upper()))
             plt.tight_layout()
-            plt.show()
-            os.chdir(self.file_location)
-            fig.savefig(param[0] + ' ' + pc.LAYER_FOR_LAYER
-                        + ' ' + str(layer_num) + pc.IMAGE_TYPE,
-                        bbox_inches=pc.TIGHT_BBOX, dpi=600)
+            self._finish_figure(fig, os.path.join(self.file_location, param[0] + ' ' + pc.LAYER_FOR_LAYER
+                                                  + ' ' + str(layer_num) + pc.IMAGE_TYPE))
         else:
             fig = plt.figure(figsize=(10, 8))
             plot_counter = 1
@@ -439,7 +465,7 @@ class PlotTough(object):
                 plt.setp(axs.get_xticklabels(), fontsize=14)
                 plt.setp(axs.get_yticklabels(), fontsize=14)
             fig.tight_layout()
-            plt.show()
+            self._finish_figure(fig)
 
     def plot_param_with_param(self, param1, param2, grid_block_number):
         """ Line Plot of two parameters in the results file
@@ -470,10 +496,8 @@ class PlotTough(object):
                 axs.set_xlabel(self.modifier.param_label_full(param1.upper()))
                 axs.set_ylabel(self.modifier.param_label_full(param2.upper()))
                 plt.tight_layout()
-                plt.show()
-                fig.savefig(param2 + ' ' + pc.VERSUS + ' '
-                            + param1 + pc.IMAGE_TYPE,
-                            bbox_inches=pc.TIGHT_BBOX, dpi=600)
+                self._finish_figure(fig, os.path.join(self.file_location, param2 + ' ' + pc.VERSUS + ' '
+                                                      + param1 + pc.IMAGE_TYPE))
         except Exception:
             with plt.style.context(pc.CLASSIC):
                 file_reader = self._read_file()
@@ -487,10 +511,8 @@ class PlotTough(object):
                 axs.set_xlabel(self.modifier.param_label_full(param1.upper()))
                 axs.set_ylabel(self.modifier.param_label_full(param2.upper()))
                 plt.tight_layout()
-                plt.show()
-                fig.savefig(param2 + ' ' + pc.VERSUS + ' '
-                            + param1 + pc.IMAGE_TYPE,
-                            bbox_inches=pc.TIGHT_BBOX, dpi=600)
+                self._finish_figure(fig, os.path.join(self.file_location, param2 + ' ' + pc.VERSUS + ' '
+                                                      + param1 + pc.IMAGE_TYPE))
 
     def plot_param_with_layer(self, direction_x_axis, direction_y_axis,
                               param, layer_num, time):
@@ -525,7 +547,8 @@ class PlotTough(object):
 
     def plot_2d_one(self, direction_y_axis, direction_x_axis, param, timer):
         """ 2D mesh plot (ungridded) to show the evolution of a particular
-        parameter across a the entire domain at a particular time
+        parameter across a the entire domain at a particular time. Rectilinear grids are drawn cell by
+        cell, other grids are shaded over a triangulation of the element centres.
 
         Parameters
         -----------
@@ -544,14 +567,20 @@ class PlotTough(object):
         """
         file_reader = self._read_file()
         fig, ax = plt.subplots(1, 1)
-        x = file_reader.get_coord_data(direction_y_axis, timer)
-        z = file_reader.get_coord_data(direction_x_axis, timer)
-        data = file_reader.get_element_data(timer, param)
-        xi, yi = np.meshgrid(x, z)
-        data1 = griddata((x, z), data, (xi, yi), method=pc.METHOD)
-        cs2 = plt.contourf(xi, yi, data1, 800, cmap=pc.CMAP_COLOR,
-                           vmin=min(data), vmax=max(data))
-        vmin = min(data)
+        grid = file_reader.get_grid()
+        data = np.asarray(file_reader.get_element_data(timer, param), dtype=np.float64)
+        vmin = np.nanmin(data)
+        vmax = np.nanmax(data)
+        plane_data = grid.get_plane(data, direction_y_axis, direction_x_axis)
+        if plane_data is not None:
+            cs2 = ax.pcolormesh(grid.get_axis(direction_y_axis), grid.get_axis(direction_x_axis), plane_data,
+                                shading=pc.SHADING_NEAREST, cmap=pc.CMAP_COLOR, vmin=vmin, vmax=vmax)
+        else:
+            mesh_raster = get_plot_geometry(grid, direction_y_axis, direction_x_axis,
+                                            self.geometry_cache).get_mesh_raster()
+            cs2 = ax.imshow(mesh_raster.interpolate(data), extent=mesh_raster.extent, origin=pc.ORIGIN_LOWER,
+                            cmap=pc.CMAP_COLOR, vmin=vmin, vmax=vmax, aspect=pc.ASPECT,
+                            interpolation=pc.INTERPOLATION)
         if vmin < 1 or vmin > 1000:
             cbar = fig.colorbar(cs2, pad=0.01,
                                 format=ticker.FuncFormatter(self.modifier.fmt))
@@ -573,9 +602,7 @@ class PlotTough(object):
         plt.tick_params(axis=pc.X, labelsize=12)
         plt.tick_params(axis=pc.Y, labelsize=12)
         plt.tight_layout()
-        plt.show()
-        fig.savefig('2D plain' + str(timer) + param + pc.IMAGE_TYPE,
-                    bbox_inches=pc.TIGHT_BBOX, dpi=600)
+        self._finish_figure(fig, os.path.join(self.file_location, '2D plain' + str(timer) + param + pc.IMAGE_TYPE))
 
     def plot_2d_with_grid(self, direction_y_axis, direction_x_axis,
                           param, timer):
@@ -598,70 +625,19 @@ class PlotTough(object):
 
         """
         file_reader = self._read_file()
-        x = file_reader.get_coord_data(direction_y_axis, timer)
-        z = file_reader.get_coord_data(direction_x_axis, timer)
-        df = pd.DataFrame(index=range(len(x)))
-        df[pc.X_CAPS] = x
-        df[pc.Z_CAPS] = z
-        z_values, z_total = self.modifier.get_grid_number(df, pc.Z_CAPS)
-        x_values, x_total = self.modifier.get_grid_number(df, pc.X_CAPS)
-        xi, yi = np.meshgrid(x, z)
-        orig_data = file_reader.get_element_data(timer, param)
-        data = np.asarray(orig_data)
-        data = data.reshape(z_total, x_total)
-        if z_total > 5:
-            height = 10
-        else:
-            height = 4
-        fig, ax = plt.subplots(1, 1, figsize=(10, height))
-        # data1 = griddata((X, Z), orig_data, (xi, yi), method=pc.METHOD)
-        # extent = [min(X), max(X), min(Z), max(Z)]
-        cs2 = plt.imshow(np.reshape(data, newshape=(z_total, x_total)),
-                         cmap=pc.CMAP_COLOR, interpolation=pc.INTERPOLATION,
-                         aspect=pc.ASPECT)
-        ax = plt.gca()
-        slicer_x = len(x_values)
-        slicer_z = len(z_values)
-        if slicer_z < 10:
-            slicer_z = 1
-        if slicer_x <= 10:
-            slicer_x = 1
-        while slicer_x > 10 or slicer_z > 10:
-            if slicer_x > 10:
-                slicer_x = np.round(slicer_x / 2)
-            if slicer_z > 10:
-                slicer_z = np.round(slicer_z / 2)
-        x_tick = np.arange(0, x_total, slicer_x)
-        z_tick = np.arange(0, z_total, slicer_z)
-        z_array = np.asarray(z)
-        z_array = np.abs(z_array)
-        ax.set_xticks(x_tick)
-        num_tick_x = len(x_tick)
-        num_tick_z = len(z_tick)
-        ax.set_yticks(z_tick)
+        geometry = get_plot_geometry(file_reader.get_grid(), direction_y_axis, direction_x_axis,
+                                     self.geometry_cache)
+        data = np.asarray(file_reader.get_element_data(timer, param)).reshape(geometry.shape)
+        fig, ax = plt.subplots(1, 1, figsize=(10, geometry.figure_height))
+        cs2 = ax.imshow(data, cmap=pc.CMAP_COLOR, interpolation=pc.INTERPOLATION, aspect=pc.ASPECT)
+        ax.set_xticks(geometry.x_ticks)
+        ax.set_yticks(geometry.z_ticks)
         # Labels for major ticks
-        tick_x = max(x) - min(x)
-        tick_z = max(z) - min(z)
-        x_tick = x_tick.astype(int)
-        if max(x) < 1 or max(z) < 1:
-            magoosh = [x_values[i] for i in x_tick]
-            magoosh = np.asarray(magoosh)
-            ax.set_xticklabels(magoosh, fontsize=12)
-            ax.set_yticklabels(np.round(self.modifier.crange(min(z_array),
-                                                             max(z_array),
-                                                             tick_z / (
-                                                                 num_tick_z -
-                                                                 1)), 4),
-                               fontsize=12)
-        else:
-            ax.set_xticklabels(np.round(self.modifier.crange(
-                min(x), max(x), tick_x / (num_tick_x - 1)), 2), fontsize=12)
-            ax.set_yticklabels(np.round(self.modifier.crange(
-                min(z_array), max(z_array), tick_z / (num_tick_z - 1)), 2),
-                fontsize=12)
+        ax.set_xticklabels(geometry.x_tick_labels, fontsize=12)
+        ax.set_yticklabels(geometry.z_tick_labels, fontsize=12)
         # Minor ticks
-        ax.set_xticks(np.arange(-.5, x_total, 1), minor=True)
-        ax.set_yticks(np.arange(-.5, z_total, 1), minor=True)
+        ax.set_xticks(geometry.x_minor_ticks, minor=True)
+        ax.set_yticks(geometry.z_minor_ticks, minor=True)
         # Gridlines based on minor ticks
         ax.grid(which='minor', color='k', linestyle='-', linewidth=1)
         cbar = fig.colorbar(cs2, ax=ax, pad=0.3, orientation=pc.HORIZONTAL)
@@ -677,6 +653,5 @@ class PlotTough(object):
                    + pc.DEPTH.capitalize() + ' ' + pc.OPEN_BRACKET
                    + pc.METER + pc.CLOSE_BRACKET, fontsize=12)
         plt.tight_layout()
-        plt.show()
-        fig.savefig(grc.GRID_NAME.capitalize() + str(timer) + param
-                    + pc.IMAGE_TYPE, bbox_inches=pc.TIGHT_BBOX, dpi=600)
+        self._finish_figure(fig, os.path.join(self.file_location, grc.GRID_NAME.capitalize() + str(timer) + param
+                                              + pc.IMAGE_TYPE))
@@ -0,0 +1,228 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.results.result_tough_react import ResultReact
+from pytoughreact.results.result_store import ResultStore
+
+
+def load_run_timeseries(simulator_type, file_location, file_title, props, grid_block_number):
+    """ Parse one run once and pull the time series of every requested property from that parse
+
+    Parameters
+    -----------
+    simulator_type :  string
+        Type of simulator being run. Can either be 'tmvoc', 'toughreact' or 'tough3'
+    file_location : string
+        Location of results file on system
+    file_title : string
+        Title or name of the file. Example is 'kddconc.tec' or 'OUTPUT_ELEME.csv'
+    props : list[string]
+        Properties to be retrieved
+    grid_block_number :  int
+        The grid block number for which to retrieve the results
+
+    Returns
+    --------
+    output : dict
+        Output times under 'time' and one array per property
+
+    """
+    if simulator_type.lower() in ['tmvoc', 'tough3']:
+        reader = ResultTough3(simulator_type, file_location, file_title)
+    else:
+        reader = ResultReact(simulator_type, file_location, file_title)
+    try:
+        store = reader.get_store()
+        output = {'time': np.array(store.times, dtype=np.float64)}
+        for prop in props:
+            output[prop] = np.array(store.get_column(prop)[:, grid_block_number], dtype=np.float64)
+    finally:
+        reader.close()
+    return output
+
+
+def load_run_store(simulator_type, file_location, file_title):
+    """ Parse one run once into an in-memory result store that can be sent between processes
+
+    Parameters
+    -----------
+    simulator_type :  string
+        Type of simulator being run. Can either be 'tmvoc', 'toughreact' or 'tough3'
+    file_location : string
+        Location of results file on system
+    file_title : string
+        Title or name of the file. Example is 'kddconc.tec' or 'OUTPUT_ELEME.csv'
+
+    Returns
+    --------
+    store : ResultStore
+        Store holding every time, element and parameter of the run
+
+    """
+    if simulator_type.lower() in ['tmvoc', 'tough3']:
+        reader = ResultTough3(simulator_type, file_location, file_title)
+    else:
+        reader = ResultReact(simulator_type, file_location, file_title)
+    try:
+        store = reader.get_store()
+        return ResultStore(store.file_path, np.array(store.times, dtype=np.float64), list(store.elements),
+                           list(store.headers), store.key_count, np.ascontiguousarray(store.values), store.signature,
+                           keys=store.keys)
+    finally:
+        reader.close()
+
+
+def stack_columns(labels, columns):
+    """ Table of columns of possibly different lengths, filled into one preallocated array
+
+    Parameters
+    -----------
+    labels : list[string]
+        Label of each column
+    columns : list
+        Values of each column. Shorter columns are padded with NaN.
+
+    Returns
+    --------
+    data_table : pd.Dataframe
+        Table with one column per label
+
+    """
+    row_count = max([len(column) for column in columns], default=0)
+    table = np.full((row_count, len(columns)), np.nan)
+    for column_number, column in enumerate(columns):
+        table[:len(column), column_number] = column
+    return pd.DataFrame(table, columns=labels)
+
+
+class MultiResultLoader(object):
+    """ Loads many run directories in parallel, parsing each of them exactly once """
+    def __init__(self, simulator_type, file_location, file_title, max_workers=None, executor='process'):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        simulator_type :  string
+            Type of simulator being run. Can either be 'tmvoc', 'toughreact' or 'tough3'
+        file_location : list[string]
+            List of location of results file on system
+        file_title : list[string]
+            List of title or name of the file. A single title is used for every location.
+        max_workers : int
+            Size of the pool. Defaults to the number of processors.
+        executor : string
+            'process' for a process pool or 'thread' for a thread pool
+
+        Returns
+        --------
+
+        """
+        assert isinstance(file_location, list)
+        if isinstance(file_title, str):
+            file_title = [file_title] * len(file_location)
+        if len(file_title) != len(file_location):
+            raise ValueError('file_title should have one entry for each file location')
+        if executor not in ['process', 'thread']:
+            raise ValueError("executor can either be 'process' or 'thread'")
+        self.simulator_type = simulator_type
+        self.file_location = file_location
+        self.file_title = file_title
+        self.max_workers = max_workers
+        self.executor = executor
+
+    def __repr__(self):
+        return 'Parallel loader for ' + str(len(self.file_location)) + ' runs of ' + self.simulator_type
+
+    def get_executor(self):
+        """ Pool used to load the runs
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        executor : concurrent.futures.Executor
+            Process or thread pool of the requested size
+
+        """
+        if self.executor == 'thread':
+            return ThreadPoolExecutor(max_workers=self.max_workers)
+        return ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def load_timeseries(self, props, grid_block_number):
+        """ Time series of several properties for one grid block in every run
+
+        Parameters
+        -----------
+        props : list[string]
+            Properties to be retrieved
+        grid_block_number :  int
+            The grid block number for which to retrieve the results
+
+        Returns
+        --------
+        data_table : pd.Dataframe
+            Tidy table with one row per run and output time, the columns 'run', 'file_location' and
+            'time' (seconds) and one column per property
+
+        """
+        with self.get_executor() as executor:
+            futures = [executor.submit(load_run_timeseries, self.simulator_type, location, title, props,
+                                       grid_block_number)
+                       for location, title in zip(self.file_location, self.file_title)]
+            runs = [future.result() for future in futures]
+        tables = []
+        for run_number, (location, run) in enumerate(zip(self.file_location, runs)):
+            table = pd.DataFrame(run)
+            table.insert(0, 'file_location', location)
+            table.insert(0, 'run', run_number)
+            tables.append(table)
+        if len(tables) == 0:
+            return pd.DataFrame(columns=['run', 'file_location', 'time'] + list(props))
+        return pd.concat(tables, ignore_index=True)
+
+    def load_stores(self):
+        """ Parse every run once, in parallel
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        stores : list[ResultStore]
+            One store per run, in the order of the file locations
+
+        """
+        with self.get_executor() as executor:
+            futures = [executor.submit(load_run_store, self.simulator_type, location, title)
+                       for location, title in zip(self.file_location, self.file_title)]
+            stores = [future.result() for future in futures]
+        return stores
@@ -23,9 +23,9 @@ SOFTWARE.
 
 '''
 
-import os
 import pandas as pd
 from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.results.multi_result_loader import MultiResultLoader, stack_columns
 
 
 class MultiResultTough3(object):
@@ -57,10 +57,46 @@ class MultiResultTough3(object):
         self.file_title = file_title
         self.simulator_type = simulator_type
         self.prop = prop
+        self._readers = {}
 
     def __repr__(self):
         return 'Multiple Results from provided file locations and provided files for' + self.simulator_type
 
+    def get_reader(self, location_index, file_title):
+        """ Reader of one result file, created once so that every query on the file shares one parse
+
+        Parameters
+        -----------
+        location_index :  int
+            Index of the file location
+        file_title : string
+            Title or name of the file. Example is 'OUTPUT_ELEME.csv'
+
+        Returns
+        --------
+        tough_data : ResultTough3
+            Reader of the file
+        """
+        key = (self.file_location[location_index], file_title)
+        if key not in self._readers:
+            self._readers[key] = ResultTough3(self.simulator_type, key[0], key[1])
+        return self._readers[key]
+
+    def close(self):
+        """ Release the parsed results of every file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        for tough_data in self._readers.values():
+            tough_data.close()
+        self._readers = {}
+
     def retrieve_data_multi_timeseries(self, grid_block_number, format_of_date='year'):
         """ Function that retrieves time and timeseries results from file
 
@@ -76,17 +112,14 @@ class MultiResultTough3(object):
         data_table : pd.Dataframe
             Dataframe with requested output
         """
-        data_table = pd.DataFrame()
+        labels = []
+        columns = []
         for i in range(0, len(self.file_location)):
-            tough_data = ResultTough3(self.simulator_type, self.file_location[i], self.file_title[i])
-            os.chdir(self.file_location[i])
-            result_data = tough_data.get_timeseries_data(self.prop[0], grid_block_number)
-            time_data = tough_data.convert_times(format_of_date='year')
-            time_data_label = 'time' + str(i)
-            result_data_label = 'result' + str(i)
-            data_table[time_data_label] = pd.Series(time_data)
-            data_table[result_data_label] = pd.Series(result_data)
-        return data_table
+            tough_data = self.get_reader(i, self.file_title[i])
+            labels.extend(['time' + str(i), 'result' + str(i)])
+            columns.extend([tough_data.convert_times(format_of_date='year'),
+                            tough_data.get_timeseries_data(self.prop[0], grid_block_number)])
+        return stack_columns(labels, columns)
 
     def retrieve_data_multi_file_fixed_time(self, direction, time):
         """ DataFrame to retrieve time and coordinate results from file
@@ -103,18 +136,14 @@ class MultiResultTough3(object):
         data_table : pd.Dataframe
             Dataframe with requested output
         """
-        data_table = pd.DataFrame()
+        labels = []
+        columns = []
         for i in range(0, len(self.file_location)):
-            tough_data = ResultTough3(self.simulator_type, self.file_location[i], self.file_title[i])
-            os.chdir(self.file_location[i])
-            x_data = tough_data.get_coord_data(direction, time)
-            result_data = tough_data.get_element_data(time, self.prop[i])
-            x_data_label = 'x' + str(i)
-            result_data_label = 'result' + str(i)
-            data_table[x_data_label] = pd.Series(x_data)
-            data_table[result_data_label] = pd.Series(result_data)
-            print(tough_data.get_x_depth_data(1, self.prop[i], time))
-        return data_table
+            tough_data = self.get_reader(i, self.file_title[i])
+            labels.extend(['x' + str(i), 'result' + str(i)])
+            columns.extend([tough_data.get_coord_data(direction, time),
+                            tough_data.get_element_data(time, self.prop[i])])
+        return stack_columns(labels, columns)
 
     def retrieve_data_multi_file_fixed_time_layer(self, direction, time, layer_num):
         """ DataFrame to retrieve distance and results from file
@@ -133,17 +162,14 @@ class MultiResultTough3(object):
         data_table : pd.Dataframe
             Dataframe with requested output
         """
-        data_table = pd.DataFrame()
+        labels = []
+        columns = []
         for i in range(0, len(self.file_location)):
-            tough_data = ResultTough3(self.simulator_type, self.file_location[i], self.file_title[i])
-            os.chdir(self.file_location[i])
-            x_data = tough_data.get_coord_data(direction, time)
-            result_data = tough_data.get_layer_data(direction, layer_num, time, self.prop[i])
-            x_data_label = 'x' + str(i)
-            result_data_label = 'result' + str(i)
-            data_table[x_data_label] = pd.Series(x_data)
-            data_table[result_data_label] = pd.Series(result_data)
-        return data_table
+            tough_data = self.get_reader(i, self.file_title[i])
+            labels.extend(['x' + str(i), 'result' + str(i)])
+            columns.extend([tough_data.get_coord_data(direction, time),
+                            tough_data.get_layer_data(direction, layer_num, time, self.prop[i])])
+        return stack_columns(labels, columns)
 
     def get_multi_element_data(self, grid_block_number, format_of_date):
         """ DataFrame to retrieve multi element time and results from file
@@ -160,19 +186,16 @@ class MultiResultTough3(object):
         data_table : pd.Dataframe
             Dataframe with requested output
         """
-        data_table = pd.DataFrame()
         pd.set_option('float_format', lambda x: '%.9f' % x)
+        labels = []
+        columns = []
         for i in range(0, len(self.file_location)):
+            tough_data = self.get_reader(i, self.file_title[i])
+            time_data = tough_data.convert_times(format_of_date)
             for j in range(0, len(self.prop)):
-                os.chdir(self.file_location[i])
-                tough_data = ResultTough3(self.simulator_type, self.file_location[i], self.file_title[i])
-                result_data = tough_data.get_timeseries_data(self.prop[j], grid_block_number)
-                time_data = tough_data.convert_times(format_of_date)
-                time_data_label = self.prop[j] + 'time' + str(i) + str(j)
-                result_data_label = self.prop[j] + 'result' + str(i) + str(j)
-                data_table[time_data_label] = pd.Series(time_data)
-                data_table[result_data_label] = pd.Series(result_data)
-        return data_table
+                labels.extend([self.prop[j] + 'time' + str(i) + str(j), self.prop[j] + 'result' + str(i) + str(j)])
+                columns.extend([time_data, tough_data.get_timeseries_data(self.prop[j], grid_block_number)])
+        return stack_columns(labels, columns)
 
     def get_multi_element_data_per_panel(self, grid_block_number, panels, format_of_date):
         """ DataFrame to retrieve multi element time and results from file per panel
@@ -191,17 +214,35 @@ class MultiResultTough3(object):
         data_table : pd.Dataframe
             Dataframe with requested output
         """
-        data_table = pd.DataFrame()
         pd.set_option('float_format', lambda x: '%.9f' % x)
+        labels = []
+        columns = []
         for i in range(0, len(panels)):
             properties = list(panels[i].values())[0][0]
-            os.chdir(self.file_location[i])
-            tough_data = ResultTough3(self.simulator_type, self.file_location[i], self.file_title[i])
-            time_data = tough_data.convert_times(format_of_date)
-            time_data_label = properties[0] + 'time' + str(i) + str(0)
-            data_table[time_data_label] = pd.Series(time_data)
+            tough_data = self.get_reader(i, self.file_title[i])
+            labels.append(properties[0] + 'time' + str(i) + str(0))
+            columns.append(tough_data.convert_times(format_of_date))
             for j in range(0, len(properties)):
-                result_data = tough_data.get_timeseries_data(properties[j], grid_block_number)
-                result_data_label = properties[j] + 'result' + str(i) + str(j)
-                data_table[result_data_label] = pd.Series(result_data)
-        return data_table
+                labels.append(properties[j] + 'result' + str(i) + str(j))
+                columns.append(tough_data.get_timeseries_data(properties[j], grid_block_number))
+        return stack_columns(labels, columns)
+
+    def load_timeseries(self, grid_block_number, max_workers=None, executor='process'):
+        """ Load the time series of every property in prop for all runs in parallel. Each run is parsed once.
+
+        Parameters
+        -----------
+        grid_block_number :  int
+            The grid block number for which to retrieve the results
+        max_workers : int
+            Size of the pool. Defaults to the number of processors.
+        executor : string
+            'process' for a process pool or 'thread' for a thread pool
+
+        Returns
+        --------
+        data_table : pd.Dataframe
+            Tidy table with the columns 'run', 'file_location', 'time' and one column per property
+        """
+        loader = MultiResultLoader(self.simulator_type, self.file_location, self.file_title, max_workers, executor)
+        return loader.load_timeseries(self.prop, grid_block_number)
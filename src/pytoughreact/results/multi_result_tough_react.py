@@ -23,10 +23,9 @@ SOFTWARE.
 
 '''
 
-import os
 from pytoughreact.utilities.t2_utilities import T2Utilities
-import pandas as pd
 from pytoughreact.results.result_tough_react import ResultReact
+from pytoughreact.results.multi_result_loader import MultiResultLoader, stack_columns
 
 
 class MultiResultReact(object):
@@ -62,10 +61,46 @@ class MultiResultReact(object):
         self.simulator_type = simulator_type
         self.prop = prop
         self.x_slice_value = kwargs.get('x_slice_value')
+        self._readers = {}
 
     def __repr__(self):
         return 'Multiple Results from provided file locations and provided files for' + self.simulator_type
 
+    def get_reader(self, location_index, file_title):
+        """ Reader of one result file, created once so that every query on the file shares one parse
+
+        Parameters
+        -----------
+        location_index :  int
+            Index of the file location
+        file_title : string
+            Title or name of the file. Example is 'kddconc.tec'
+
+        Returns
+        --------
+        tough_data : ResultReact
+            Reader of the file
+        """
+        key = (self.file_location[location_index], file_title)
+        if key not in self._readers:
+            self._readers[key] = ResultReact(self.simulator_type, key[0], key[1])
+        return self._readers[key]
+
+    def close(self):
+        """ Release the parsed results of every file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        for tough_data in self._readers.values():
+            tough_data.close()
+        self._readers = {}
+
     def retrieve_data_multi_timeseries(self, grid_block_number, format_of_date='year'):
         """ Function that retrieves time and timeseries results from file
 
@@ -81,18 +116,14 @@ class MultiResultReact(object):
         data_table : pd.Dataframe
             Dataframe with requested output
         """
-        data_table = pd.DataFrame()
+        labels = []
+        columns = []
         for i in range(0, len(self.file_location)):
-            tough_data = ResultReact(self.simulator_type, self.file_location[i], self.file_title[i])
-            print(self.file_location[i])
-            os.chdir(self.file_location[i])
-            result_data = tough_data.get_timeseries_data(self.prop[0], grid_block_number)
-            time_data = tough_data.convert_times(format_of_date=format_of_date)
-            time_data_label = 'time' + str(i)
-            result_data_label = 'result' + str(i)
-            data_table[time_data_label] = pd.Series(time_data)
-            data_table[result_data_label] = pd.Series(result_data)
-        return data_table
+            tough_data = self.get_reader(i, self.file_title[i])
+            labels.extend(['time' + str(i), 'result' + str(i)])
+            columns.extend([tough_data.convert_times(format_of_date=format_of_date),
+                            tough_data.get_timeseries_data(self.prop[0], grid_block_number)])
+        return stack_columns(labels, columns)
 
     def retrieve_data_multi_file_fixed_time(self, direction, time):
         """ DataFrame to retrieve time and coordinate results from file
@@ -109,18 +140,14 @@ class MultiResultReact(object):
         data_table : pd.Dataframe
             Dataframe with requested output
         """
-        data_table = pd.DataFrame()
+        labels = []
+        columns = []
         for i in range(0, len(self.file_location)):
-            tough_data = ResultReact(self.simulator_type, self.file_location[i], self.file_title[i])
-            os.chdir(self.file_location[i])
-            x_data = tough_data.get_coord_data(direction, time)
-            result_data = tough_data.get_element_data(time, self.prop[i])
-            x_data_label = 'x' + str(i)
-            result_data_label = 'result' + str(i)
-            data_table[x_data_label] = pd.Series(x_data)
-            data_table[result_data_label] = pd.Series(result_data)
-            print(tough_data.get_x_depth_data(1, self.prop[i], time))
-        return data_table
+            tough_data = self.get_reader(i, self.file_title[i])
+            labels.extend(['x' + str(i), 'result' + str(i)])
+            columns.extend([tough_data.get_coord_data(direction, time),
+                            tough_data.get_element_data(time, self.prop[i])])
+        return stack_columns(labels, columns)
 
     def retrieve_data_multi_file_fixed_time_layer(self, direction, time, layer_num):
         """ DataFrame to retrieve distance and results from file
@@ -139,17 +166,14 @@ class MultiResultReact(object):
         data_table : pd.Dataframe
             Dataframe with requested output
         """
-        data_table = pd.DataFrame()
+        labels = []
+        columns = []
         for i in range(0, len(self.file_location)):
-            tough_data = ResultReact(self.simulator_type, self.file_location[i], self.file_title[i])
-            os.chdir(self.file_location[i])
-            x_data = tough_data.get_coord_data(direction, time)
-            result_data = tough_data.get_layer_data(direction, layer_num, time, self.prop[i])
-            x_data_label = 'x' + str(i)
-            result_data_label = 'result' + str(i)
-            data_table[x_data_label] = pd.Series(x_data)
-            data_table[result_data_label] = pd.Series(result_data)
-        return data_table
+            tough_data = self.get_reader(i, self.file_title[i])
+            labels.extend(['x' + str(i), 'result' + str(i)])
+            columns.extend([tough_data.get_coord_data(direction, time),
+                            tough_data.get_layer_data(direction, layer_num, time, self.prop[i])])
+        return stack_columns(labels, columns)
 
     def get_multi_prop_distance(self, direction_x, direction_y, time, layer_num):
         """ DataFrame to retrieve multi element time and results from file for properties
@@ -170,21 +194,19 @@ class MultiResultReact(object):
         data_table : pd.Dataframe
             Dataframe with requested output
         """
-        data_table = pd.DataFrame()
+        labels = []
+        columns = []
         for i in range(0, len(self.file_location)):
             for j in range(0, len(self.prop)):
-                os.chdir(self.file_location[i])
-                tough_data = ResultReact(self.simulator_type, self.file_location[i], self.file_title[j])
+                tough_data = self.get_reader(i, self.file_title[j])
                 x_data = tough_data.get_unique_coord_data(direction_x, time)
                 result_data = tough_data.get_layer_data(direction_y, layer_num, time, self.prop[j])
                 if self.x_slice_value is not None:
                     inter = T2Utilities()
                     time_data, result_data = inter.trim_data_points(x_data, result_data, self.x_slice_value)
-                time_data_label = self.prop[j] + 'time' + str(i) + str(j)
-                result_data_label = self.prop[j] + 'result' + str(i) + str(j)
-                data_table[time_data_label] = pd.Series(x_data)
-                data_table[result_data_label] = pd.Series(result_data)
-        return data_table
+                labels.extend([self.prop[j] + 'time' + str(i) + str(j), self.prop[j] + 'result' + str(i) + str(j)])
+                columns.extend([x_data, result_data])
+        return stack_columns(labels, columns)
 
     def get_multi_file_distance(self, direction_x, direction_y, time, layer_num):
         """ DataFrame to retrieve multi element time and results from multiple files
@@ -205,22 +227,20 @@ class MultiResultReact(object):
         data_table : pd.Dataframe
             Dataframe with requested output
         """
-        data_table = pd.DataFrame()
+        labels = []
+        columns = []
         for i in range(0, len(self.prop)):
             for j in range(0, len(self.file_location)):
-                os.chdir(self.file_location[j])
-                tough_data = ResultReact(self.simulator_type, self.file_location[j], self.file_title[j])
+                tough_data = self.get_reader(j, self.file_title[j])
                 x_data = tough_data.get_unique_coord_data(direction_x, time)
                 result_data = tough_data.get_layer_data(direction_y, layer_num, time, self.prop[i])
                 if self.x_slice_value is not None:
                     utilities_instance = T2Utilities()
                     time_data, result_data = utilities_instance.trim_data_points(x_data, result_data,
                                                                                  self.x_slice_value)
-                time_data_label = self.prop[i] + 'time' + str(i) + str(j)
-                result_data_label = self.prop[i] + 'result' + str(i) + str(j)
-                data_table[time_data_label] = pd.Series(x_data)
-                data_table[result_data_label] = pd.Series(result_data)
-        return data_table
+                labels.extend([self.prop[i] + 'time' + str(i) + str(j), self.prop[i] + 'result' + str(i) + str(j)])
+                columns.extend([x_data, result_data])
+        return stack_columns(labels, columns)
 
     def get_multi_element_data(self, grid_block_number, format_of_date='year'):
         """ DataFrame to retrieve multi element time and results from file
@@ -237,19 +257,37 @@ class MultiResultReact(object):
         data_table : pd.Dataframe
             Dataframe with requested output
         """
-        data_table = pd.DataFrame()
+        labels = []
+        columns = []
         for i in range(0, len(self.file_location)):
             for j in range(0, len(self.prop)):
-                os.chdir(self.file_location[i])
-                tough_data = ResultReact(self.simulator_type, self.file_location[i], self.file_title[j])
+                tough_data = self.get_reader(i, self.file_title[j])
                 result_data = tough_data.get_timeseries_data(self.prop[j], grid_block_number)
                 time_data = tough_data.convert_times(format_of_date)
                 if self.x_slice_value is not None:
                     utilities_instance = T2Utilities()
                     time_data, result_data = utilities_instance.trim_data_points(time_data, result_data,
                                                                                  self.x_slice_value)
-                time_data_label = self.prop[j] + 'time' + str(i) + str(j)
-                result_data_label = self.prop[j] + 'result' + str(i) + str(j)
-                data_table[time_data_label] = pd.Series(time_data)
-                data_table[result_data_label] = pd.Series(result_data)
-        return data_table
+                labels.extend([self.prop[j] + 'time' + str(i) + str(j), self.prop[j] + 'result' + str(i) + str(j)])
+                columns.extend([time_data, result_data])
+        return stack_columns(labels, columns)
+
+    def load_timeseries(self, grid_block_number, max_workers=None, executor='process'):
+        """ Load the time series of every property in prop for all runs in parallel. Each run is parsed once.
+
+        Parameters
+        -----------
+        grid_block_number :  int
+            The grid block number for which to retrieve the results
+        max_workers : int
+            Size of the pool. Defaults to the number of processors.
+        executor : string
+            'process' for a process pool or 'thread' for a thread pool
+
+        Returns
+        --------
+        data_table : pd.Dataframe
+            Tidy table with the columns 'run', 'file_location', 'time' and one column per property
+        """
+        loader = MultiResultLoader(self.simulator_type, self.file_location, self.file_title, max_workers, executor)
+        return loader.load_timeseries(self.prop, grid_block_number)
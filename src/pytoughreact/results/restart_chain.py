@@ -0,0 +1,311 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import os
+import numpy as np
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.utilities.downsampling import get_downsampled_timeseries, LTTB
+from pytoughreact.results.multi_result_loader import MultiResultLoader
+from pytoughreact.results.time_index import NEAREST
+
+
+class RestartChain(object):
+    """ Results of a simulation split over several restarted runs, stitched into a single timeline """
+    def __init__(self, simulator_type, file_locations, file_title, max_workers=None, executor='process'):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        simulator_type :  string
+            Type of simulator being run. Can either be 'tmvoc', 'toughreact' or 'tough3'
+        file_locations : list[string]
+            Run directories in the order the simulation was restarted
+        file_title : string or list[string]
+            Title or name of the file. Example is 'kddconc.tec' or 'OUTPUT_ELEME.csv'. A single title is
+            used for every location.
+        max_workers : int
+            Size of the pool used to parse the runs. Defaults to the number of processors.
+        executor : string
+            'process' for a process pool or 'thread' for a thread pool
+
+        Returns
+        --------
+
+        """
+        self.loader = MultiResultLoader(simulator_type, list(file_locations), file_title, max_workers, executor)
+        self.simulatortype = simulator_type
+        self.file_locations = self.loader.file_location
+        self.file_titles = self.loader.file_title
+        self.segments = None
+        self._store = None
+        self._signatures = None
+
+    def __repr__(self):
+        return 'Restart chain of ' + str(len(self.file_locations)) + ' runs for ' + self.simulatortype
+
+    def is_stale(self):
+        """ Check if any run of the chain changed since it was parsed
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        stale : boolean
+            True if the chain has not been parsed yet or one of its files changed
+
+        """
+        if self._signatures is None:
+            return True
+        return self._current_signatures() != self._signatures
+
+    def _current_signatures(self):
+        """ Signatures of the result file of every run
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        signatures : list[tuple]
+            Modification time and size of each file, None for a missing file
+
+        """
+        signatures = []
+        for location, title in zip(self.file_locations, self.file_titles):
+            try:
+                signatures.append(ResultStore.file_signature(os.path.join(location, title)))
+            except OSError:
+                signatures.append(None)
+        return signatures
+
+    def get_store(self):
+        """ Get the stitched result store, parsing each run once
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        store : ResultStore
+            Store over the stitched timeline. A time written by several runs is kept from the first of them.
+
+        """
+        if self._store is None or self.is_stale():
+            signatures = self._current_signatures()
+            self._store = self.stitch(self.loader.load_stores())
+            self._signatures = signatures
+        return self._store
+
+    def stitch(self, stores):
+        """ Join the stores of consecutive runs, dropping the times each run repeats from the runs before it
+
+        Parameters
+        -----------
+        stores : list[ResultStore]
+            Store of each run in restart order
+
+        Returns
+        --------
+        store : ResultStore
+            Store over the stitched timeline
+
+        """
+        if len(stores) == 0:
+            raise ValueError('A restart chain needs at least one run')
+        first_store = stores[0]
+        times = []
+        values = []
+        segments = []
+        last_time = -np.inf
+        for segment_number, store in enumerate(stores):
+            if list(store.elements) != list(first_store.elements):
+                raise ValueError(store.file_path + ' does not have the same elements as ' + first_store.file_path)
+            if store.parameters != first_store.parameters:
+                raise ValueError(store.file_path + ' does not have the same parameters as ' + first_store.file_path)
+            keep = np.asarray(store.times) > last_time
+            times.append(np.asarray(store.times)[keep])
+            values.append(store.values[keep])
+            segments.append(np.full(np.count_nonzero(keep), segment_number, dtype=np.intp))
+            if np.any(keep):
+                last_time = times[-1].max()
+        self.segments = np.concatenate(segments)
+        return ResultStore(first_store.file_path, np.concatenate(times), list(first_store.elements),
+                           list(first_store.headers), first_store.key_count, np.concatenate(values),
+                           keys=first_store.keys)
+
+    def get_times(self):
+        """ Get times of the stitched timeline
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        time_data : list
+            Output times in seconds
+
+        """
+        time_data = self.get_store().times.tolist()
+        return time_data
+
+    def convert_times(self, format_of_date):
+        """ Convert time to desirable format e.g day, month, year
+
+        Parameters
+        -----------
+        format_of_date : str
+            Provides information to the method on format of the date. For example. year, hour, min or seconds
+
+        Returns
+        --------
+        processed_time_data  : list
+            List of converted time
+
+        """
+        processed_time_data = self.get_store().get_time_axis().convert(format_of_date).tolist()
+        return processed_time_data
+
+    def get_elements(self):
+        """ Get elements from the simulation
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        elements : list
+            Elements present in the result file.
+
+        """
+        elements = list(self.get_store().elements)
+        return elements
+
+    def get_parameters(self):
+        """ Remove space from parameters
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        parameter_list : list
+            Parameters with blanks removed.
+
+        """
+        parameter_list = [heading.replace(" ", "") for heading in self.get_store().headers]
+        return parameter_list
+
+    def get_timeseries_data(self, param, grid_block_number):
+        """ Get Time series data over the stitched timeline
+
+        Parameters
+        -----------
+        param: string
+            Parameter to be derive data
+        grid_block_number :  int
+            The grid block number for which to retrieve the results
+
+        Returns
+        --------
+        final_timeseries_data : list
+            Time series data for particular parameter.
+
+        """
+        final_timeseries_data = self.get_store().get_column(param)[:, grid_block_number].tolist()
+        return final_timeseries_data
+
+    def get_downsampled_timeseries(self, param, grid_block_number, max_points, method=LTTB):
+        """ Get a time series reduced to a number of points that keeps its shape, e.g. for plotting long runs
+
+        Parameters
+        -----------
+        param: string
+            Parameter to be derive data
+        grid_block_number :  int
+            The grid block number for which to retrieve the results
+        max_points : int
+            Largest number of points to keep
+        method : string
+            'lttb' for Largest-Triangle-Three-Buckets or 'minmax' for the extremes of each bucket
+
+        Returns
+        --------
+        times, values : np.ndarray, np.ndarray
+            Kept output times in seconds and the parameter values at those times
+
+        """
+        return get_downsampled_timeseries(self.get_store(), param, grid_block_number, max_points, method)
+
+    def get_timeseries_batch(self, elements, params, as_dataframe=False):
+        """ Get time series of several parameters for several grid blocks at once
+
+        Parameters
+        -----------
+        elements : list[int or string]
+            Grid block numbers or names
+        params : list[string]
+            Parameters to be derived from data
+        as_dataframe : boolean
+            Return a table indexed by (time, element) instead of an array
+
+        Returns
+        --------
+        timeseries_data : np.ndarray or pd.Dataframe
+            Array of shape (time, element, parameter) or the equivalent table
+
+        """
+        store = self.get_store()
+        timeseries_data = store.get_timeseries_batch(elements, params)
+        if as_dataframe:
+            return ResultStore.batch_to_dataframe(store.times, elements, params, timeseries_data)
+        return timeseries_data
+
+    def get_element_data(self, time, param, policy=NEAREST):
+        """ Get Data for elements
+
+        Parameters
+        -----------
+        time : float or list[float] or np.ndarray
+            Time in which the data should be retrieved. Several times can be given at once.
+        param: string
+            Parameter to be derive data
+        policy : string
+            How the output time is matched, 'nearest', 'floor', 'ceil' or 'exact'
+
+        Returns
+        --------
+        final_element_data : np.ndarray
+            Data for each of the elements. For several times a (time x element) array is returned.
+
+        """
+        final_element_data = self.get_store().get_element_values(time, param, policy).copy()
+        return final_element_data
@@ -0,0 +1,345 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import os
+import numpy as np
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.results.time_index import NEAREST
+
+
+class ResultConnections(object):
+    """ Class for processing connection results (e.g. OUTPUT_CONNE.csv) from Tough3 """
+    def __init__(self, simulatortype, filelocation, filetitle='OUTPUT_CONNE.csv', **kwargs):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        simulator_type :  string
+            Type of simulator being run. Can either be 'tmvoc', 'toughreact' or 'tough3'.
+        file_location : string
+            Location of results file on system
+        file_title : string
+            Title or name of the file. Defaults to 'OUTPUT_CONNE.csv'
+        kwargs: dict
+            1) use_sidecar (boolean) - read from the binary sidecar written by export() when it is
+               newer than the text output. Defaults to True.
+            2) usecols (list[string]) - parameters to be decoded from the file, e.g. ['FLOW_G', 'FLOW_L'].
+
+
+        Returns
+        --------
+
+        """
+        if filelocation is None:
+            self.filelocation = os.getcwd()
+        else:
+            self.filelocation = filelocation
+        self.filetitle = filetitle
+        self.simulatortype = simulatortype
+        self.use_sidecar = kwargs.get('use_sidecar', True)
+        self.usecols = kwargs.get('usecols')
+        self._reader = ResultTough3(simulatortype, self.filelocation, filetitle, use_sidecar=self.use_sidecar,
+                                    usecols=self.usecols)
+        self._connection_store = None
+        self._connections = None
+        self._connection_index = None
+
+    def __repr__(self):
+        return 'Connection results from ' + self.filelocation + ' in ' + self.filetitle + ' for ' + \
+            self.simulatortype
+
+    def get_store(self):
+        """ Get the parsed result store, parsing the file only on first use or after it changed on disk. The store
+        is kept by a ResultTough3 reader of the same file.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        store : ResultStore
+            NumPy-backed (time x connection x parameter) store of the file
+
+        """
+        store = self._reader.get_store()
+        if store is not self._connection_store:
+            self._connection_store = store
+            self._connections = None
+            self._connection_index = None
+        return store
+
+    def close(self):
+        """ Release the parsed results and any open sidecar. The file is parsed again on the next query.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        self._reader.close()
+        self._connection_store = None
+        self._connections = None
+        self._connection_index = None
+
+    def export(self, sidecar_path=None):
+        """ Convert the text output once into a binary sidecar that later readers open instead
+
+        Parameters
+        -----------
+        sidecar_path : string
+            Full path of the sidecar. Defaults to the result file name with '.npz' appended.
+
+        Returns
+        --------
+        sidecar_path : string
+            Full path of the written sidecar
+
+        """
+        return self._reader.export(sidecar_path)
+
+    def get_times(self):
+        """ Get times stored for duration of the simulation
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        time_data : list
+            Time data directly from file without processing.
+
+        """
+        time_data = self.get_store().times.tolist()
+        return time_data
+
+    def get_parameters(self):
+        """ Remove space from parameters
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        parameter_list : list
+            Parameters with blanks removed.
+
+        """
+        parameter_list = [heading.replace(" ", "") for heading in self.get_store().headers]
+        return parameter_list
+
+    def get_connections(self):
+        """ Get the connections of the simulation
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        connections : list[tuple]
+            (ELEM1, ELEM2) of each connection in file order
+
+        """
+        store = self.get_store()
+        if self._connections is None:
+            self._connections = [tuple(key.strip() for key in row_keys[:2]) for row_keys in store.keys]
+            self._connection_index = {}
+            for connection_index, connection in enumerate(self._connections):
+                self._connection_index.setdefault(connection, connection_index)
+        return list(self._connections)
+
+    def get_connection_indices(self, connections):
+        """ Rows and orientations of connections given by index or by (ELEM1, ELEM2)
+
+        Parameters
+        -----------
+        connections : list[int or tuple]
+            Connection indices or (ELEM1, ELEM2) pairs. A pair given as (ELEM2, ELEM1) is matched to the
+            connection in the file with its flows reversed.
+
+        Returns
+        --------
+        connection_indices, signs : np.ndarray, np.ndarray
+            Row of each connection and +1 or -1 for its orientation
+
+        """
+        self.get_connections()
+        connection_indices = []
+        signs = []
+        for connection in connections:
+            if isinstance(connection, tuple):
+                connection = tuple(element.strip() for element in connection)
+                if connection in self._connection_index:
+                    connection_indices.append(self._connection_index[connection])
+                    signs.append(1.0)
+                elif connection[::-1] in self._connection_index:
+                    connection_indices.append(self._connection_index[connection[::-1]])
+                    signs.append(-1.0)
+                else:
+                    raise ValueError(str(connection) + ' is not a connection of ' + self.filetitle)
+            else:
+                connection_indices.append(int(connection))
+                signs.append(1.0)
+        return np.asarray(connection_indices, dtype=np.intp), np.asarray(signs, dtype=np.float64)
+
+    def get_timeseries_data(self, param, connection):
+        """ Get Time series data
+
+        Parameters
+        -----------
+        param: string
+            Parameter to be derive data
+        connection : int or tuple
+            Connection index or (ELEM1, ELEM2)
+
+        Returns
+        --------
+        final_timeseries_data : list
+            Time series data for particular parameter.
+
+        """
+        connection_indices, signs = self.get_connection_indices([connection])
+        timeseries_data = self.get_store().get_column(param)[:, connection_indices[0]] * signs[0]
+        final_timeseries_data = timeseries_data.tolist()
+        return final_timeseries_data
+
+    def get_timeseries_batch(self, connections, params, as_dataframe=False):
+        """ Get time series of several parameters for several connections at once
+
+        Parameters
+        -----------
+        connections : list[int or tuple]
+            Connection indices or (ELEM1, ELEM2) pairs
+        params : list[string]
+            Parameters to be derived from data
+        as_dataframe : boolean
+            Return a table indexed by (time, connection) instead of an array
+
+        Returns
+        --------
+        timeseries_data : np.ndarray or pd.Dataframe
+            Array of shape (time, connection, parameter) or the equivalent table
+
+        """
+        store = self.get_store()
+        connection_indices, signs = self.get_connection_indices(connections)
+        timeseries_data = store.get_timeseries_batch(connection_indices, params) * signs[:, np.newaxis]
+        if as_dataframe:
+            return ResultStore.batch_to_dataframe(store.times, connections, params, timeseries_data)
+        return timeseries_data
+
+    def get_connection_data(self, time, param, policy=NEAREST):
+        """ Get data for all connections
+
+        Parameters
+        -----------
+        time : float or list[float] or np.ndarray
+            Time in which the data should be retrieved. Several times can be given at once.
+        param: string
+            Parameter to be derive data
+        policy : string
+            How the output time is matched, 'nearest', 'floor', 'ceil' or 'exact'
+
+        Returns
+        --------
+        connection_data : np.ndarray
+            Data for each of the connections. For several times a (time x connection) array is returned.
+
+        """
+        connection_data = self.get_store().get_element_values(time, param, policy).copy()
+        return connection_data
+
+    def get_surface_flux(self, connections, params):
+        """ Total of flows across a control surface made of several connections, as one reduction
+
+        Parameters
+        -----------
+        connections : list[int or tuple]
+            Connections forming the surface. Pairs given as (ELEM2, ELEM1) are counted with reversed sign.
+        params : list[string]
+            Flow parameters to be summed, e.g. ['FLOW_G', 'FLOW_L']
+
+        Returns
+        --------
+        surface_flux : np.ndarray
+            Array of shape (time, parameter)
+
+        """
+        connection_indices, signs = self.get_connection_indices(connections)
+        timeseries_data = self.get_store().get_timeseries_batch(connection_indices, params)
+        surface_flux = np.einsum('tcp,c->tp', timeseries_data, signs)
+        return surface_flux
+
+    def get_boundary_connections(self, elements):
+        """ Connections joining a set of elements to the rest of the model
+
+        Parameters
+        -----------
+        elements : list[string]
+            Names of the elements inside the region
+
+        Returns
+        --------
+        boundary_connections : list[tuple]
+            (inside element, outside element) of each connection crossing the boundary of the region
+
+        """
+        region = set(element.strip() for element in elements)
+        boundary_connections = []
+        for first_element, second_element in self.get_connections():
+            if first_element in region and second_element not in region:
+                boundary_connections.append((first_element, second_element))
+            elif second_element in region and first_element not in region:
+                boundary_connections.append((second_element, first_element))
+        return boundary_connections
+
+    def get_region_flux(self, elements, params):
+        """ Net flow into a region, following the TOUGH convention that a positive flow goes from ELEM2 into ELEM1
+
+        Parameters
+        -----------
+        elements : list[string]
+            Names of the elements inside the region
+        params : list[string]
+            Flow parameters to be summed, e.g. ['FLOW_G', 'FLOW_L']
+
+        Returns
+        --------
+        region_flux : np.ndarray
+            Array of shape (time, parameter) with the net inflow across the region boundary
+
+        """
+        boundary_connections = self.get_boundary_connections(elements)
+        if len(boundary_connections) == 0:
+            return np.zeros((len(self.get_store().times), len(params)), dtype=np.float64)
+        region_flux = self.get_surface_flux(boundary_connections, params)
+        return region_flux
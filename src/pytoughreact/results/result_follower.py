@@ -0,0 +1,268 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import os
+import re
+import time as time_module
+import numpy as np
+from pytoughreact.results.result_stream import ResultStream
+from pytoughreact.results.result_tecplot_index import TecplotIndex, ZONE_PATTERN, VARIABLES_PATTERN
+
+CSV = 'csv'
+TECPLOT = 'tecplot'
+TIME_PATTERN = re.compile(rb'^"TIME[^\n]*', re.MULTILINE)
+
+
+class ResultFollower(object):
+    """ Incremental reader that parses only the blocks appended to a result file since the last poll """
+    def __init__(self, file_path, file_type=None):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        file_path :  string
+            Full path to the output of a running simulation, e.g. OUTPUT_ELEME.csv or kdd_conc.tec
+        file_type : string
+            'csv' for TOUGH3 csv output or 'tecplot' for TOUGHREACT Tecplot output. Defaults to 'tecplot'
+            for files ending in '.tec' and 'csv' otherwise.
+
+        Returns
+        --------
+
+        """
+        self.file_path = file_path
+        if file_type is None:
+            file_type = TECPLOT if file_path.lower().endswith('.tec') else CSV
+        if file_type not in [CSV, TECPLOT]:
+            raise ValueError('file_type can either be ' + CSV + ' or ' + TECPLOT)
+        self.file_type = file_type
+        self.reset()
+
+    def __repr__(self):
+        return 'Follower of ' + self.file_path + ' at byte ' + str(self.offset)
+
+    def __iter__(self):
+        return self.follow()
+
+    def reset(self):
+        """ Forget everything read so far so the next poll starts again from the beginning of the file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        self.offset = 0
+        self.headers = None
+        self.key_count = None
+        self.row_count = None
+        self.elements = None
+        self.times = []
+        self._file_id = None
+
+    def _read_headers(self, chunk):
+        """ Parse the column names at the start of the file
+
+        Parameters
+        -----------
+        chunk :  bytes
+            Complete lines read from the start of the file
+
+        Returns
+        --------
+        header_end : int
+            Position after the heading line, or None if it was not written yet
+
+        """
+        if self.file_type == CSV:
+            header_end = chunk.find(b'\n')
+            if header_end < 0:
+                return None
+            self.headers = ResultStream.parse_header(chunk[:header_end].decode())
+            return header_end + 1
+        variables = VARIABLES_PATTERN.search(chunk)
+        if variables is None:
+            return None
+        self.headers = TecplotIndex.parse_variables(variables.group().decode().rstrip())
+        return variables.end() + 1
+
+    def _parse_block(self, body):
+        """ Convert the rows of one time block to a float array
+
+        Parameters
+        -----------
+        body :  bytes
+            Text between two time lines
+
+        Returns
+        --------
+        elements, values : list[string], np.ndarray
+            Element names (None for Tecplot files) and an array of shape (element, parameter). Rows of a
+            zone that is still being written are left out.
+
+        """
+        if self.file_type == TECPLOT:
+            values = np.fromstring(body.decode(), dtype=np.float64, sep=' ')
+            number_of_values = values.size - values.size % len(self.headers)
+            return None, values[:number_of_values].reshape(-1, len(self.headers))
+        rows = [line for line in body.decode().split('\n') if line.strip()]
+        if len(rows) == 0:
+            return [], np.empty((0, len(self.headers) - (self.key_count or 1)), dtype=np.float64)
+        if self.key_count is None:
+            self.key_count = ResultStream.count_keys(rows[0])
+        parts = [row.rstrip().split(',', self.key_count) for row in rows]
+        values = np.fromstring(','.join([row_parts[self.key_count] for row_parts in parts]), dtype=np.float64,
+                               sep=',')
+        return [row_parts[0].strip('"') for row_parts in parts], \
+            values.reshape(len(rows), len(self.headers) - self.key_count)
+
+    def _parse_time(self, line):
+        """ Time of the line starting a block
+
+        Parameters
+        -----------
+        line :  string
+            "TIME [sec]" line of a csv file or Zone line of a Tecplot file
+
+        Returns
+        --------
+        time : float
+            Time in seconds or None if the line has no time
+
+        """
+        if self.file_type == TECPLOT:
+            return TecplotIndex.parse_zone_time(line)
+        return ResultStream.parse_time(line)
+
+    def poll(self, final=False):
+        """ Parse the time blocks completed since the previous poll
+
+        Parameters
+        -----------
+        final : boolean
+            Set to True once the simulation has finished, so that the last block is returned without
+            waiting for the block after it
+
+        Returns
+        --------
+        blocks : list[tuple]
+            (time, values) of each new block, where values is a (element, parameter) array
+
+        """
+        if not os.path.isfile(self.file_path):
+            return []
+        stat_result = os.stat(self.file_path)
+        if (stat_result.st_dev, stat_result.st_ino) != self._file_id or stat_result.st_size < self.offset:
+            self.reset()
+            self._file_id = (stat_result.st_dev, stat_result.st_ino)
+        with open(self.file_path, 'rb') as result_file:
+            result_file.seek(self.offset)
+            chunk = result_file.read(stat_result.st_size - self.offset)
+        if not final:
+            chunk = chunk[:chunk.rfind(b'\n') + 1]
+        if self.headers is None:
+            header_end = self._read_headers(chunk)
+            if header_end is None:
+                return []
+            self.offset += header_end
+            chunk = chunk[header_end:]
+        pattern = ZONE_PATTERN if self.file_type == TECPLOT else TIME_PATTERN
+        markers = [marker for marker in pattern.finditer(chunk)
+                   if self._parse_time(marker.group().decode()) is not None]
+        blocks = []
+        consumed = markers[0].start() if len(markers) > 0 else 0
+        for marker_index, marker in enumerate(markers):
+            last = marker_index == len(markers) - 1
+            end = len(chunk) if last else markers[marker_index + 1].start()
+            elements, values = self._parse_block(chunk[marker.end():end])
+            if last and not final and (self.row_count is None or len(values) != self.row_count):
+                break
+            if self.row_count is None:
+                self.row_count = len(values)
+                self.elements = elements
+            time = self._parse_time(marker.group().decode())
+            self.times.append(time)
+            blocks.append((time, values))
+            consumed = end
+        self.offset += consumed
+        return blocks
+
+    def follow(self, interval=1.0, timeout=None):
+        """ Generator over new time blocks as the simulation writes them
+
+        Parameters
+        -----------
+        interval : float
+            Seconds to wait between polls when no new block is available
+        timeout : float
+            Stop after this many seconds without a new block, returning the last block as complete.
+            If None, follow until the generator is closed.
+
+        Returns
+        --------
+        output : generator
+            Yields (time, values) for each new block
+
+        """
+        last_update = time_module.monotonic()
+        while True:
+            blocks = self.poll()
+            for block in blocks:
+                yield block
+            if len(blocks) > 0:
+                last_update = time_module.monotonic()
+            elif timeout is not None and time_module.monotonic() - last_update >= timeout:
+                for block in self.poll(final=True):
+                    yield block
+                return
+            else:
+                time_module.sleep(interval)
+
+    def watch(self, callback, interval=1.0, timeout=None):
+        """ Call a function for every new time block as the simulation writes them
+
+        Parameters
+        -----------
+        callback : function
+            Called as callback(time, values) for each new block
+        interval : float
+            Seconds to wait between polls when no new block is available
+        timeout : float
+            Stop after this many seconds without a new block. If None, watch until interrupted.
+
+        Returns
+        --------
+        number_of_blocks : int
+            Number of blocks passed to the callback
+
+        """
+        number_of_blocks = 0
+        for time, values in self.follow(interval, timeout):
+            callback(time, values)
+            number_of_blocks += 1
+        return number_of_blocks
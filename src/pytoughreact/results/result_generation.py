@@ -0,0 +1,472 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import os
+import numpy as np
+import pandas as pd
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.results.result_stream import ResultStream, TIME_MARKER
+from pytoughreact.results.time_axis import TimeAxis
+
+
+class ResultGeneration(object):
+    """ Class for processing generation (source and sink) results from Tough3 """
+    def __init__(self, simulatortype, filelocation, filetitle):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        simulator_type :  string
+            Type of simulator being run. Can either be 'tmvoc', 'toughreact' or 'tough3'.
+        file_location : string
+            Location of results file on system
+        file_title : string
+            Title or name of the generation file. Three layouts are read: one row per time for a single
+            generator (first column is the time), one row per time and generator with quoted element and
+            source columns, or "TIME [sec]" blocks with one row per generator as in OUTPUT_ELEME.csv.
+
+        Returns
+        --------
+
+        """
+        if filelocation is None:
+            self.filelocation = os.getcwd()
+        else:
+            self.filelocation = filelocation
+        self.filetitle = filetitle
+        self.simulatortype = simulatortype
+        self.times = None
+        self.generators = None
+        self.elements = None
+        self.parameters = None
+        self.values = None
+        self.signature = None
+        self._parameter_index = None
+        self._generator_index = None
+        self._time_axis = None
+
+    def __repr__(self):
+        return 'Generation results from ' + self.filelocation + ' in ' + self.filetitle + ' for ' + \
+            self.simulatortype
+
+    def get_file_path(self):
+        """ Full path of the generation file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        file_path : string
+            Location and title of the file joined
+
+        """
+        return os.path.join(self.filelocation, self.filetitle)
+
+    def is_stale(self):
+        """ Check if the file was not parsed yet or changed since it was parsed
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        stale : boolean
+            True if the file has to be parsed again
+
+        """
+        if self.signature is None:
+            return True
+        try:
+            return ResultStore.file_signature(self.get_file_path()) != self.signature
+        except OSError:
+            return True
+
+    def read_file(self):
+        """ Parse the generation file into a (time x generator x parameter) array. The file is only parsed
+        on first use or after it changed on disk.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        values : np.ndarray
+            Array of shape (time, generator, parameter). Generators without a row at a time hold NaN.
+
+        """
+        if not self.is_stale():
+            return self.values
+        file_path = self.get_file_path()
+        signature = ResultStore.file_signature(file_path)
+        with open(file_path) as generation_file:
+            generation_file.readline()
+            first_row = generation_file.readline()
+        if first_row.strip().startswith(TIME_MARKER):
+            self._read_blocks(file_path)
+        else:
+            self._read_rows(file_path)
+        self.signature = signature
+        self._parameter_index = {parameter: index for index, parameter in enumerate(self.parameters)}
+        self._generator_index = None
+        self._time_axis = None
+        return self.values
+
+    def _read_blocks(self, file_path):
+        """ Parse a file made of "TIME [sec]" blocks with one row per generator
+
+        Parameters
+        -----------
+        file_path :  string
+            Full path to the file
+
+        Returns
+        --------
+
+        """
+        stream = ResultStream(file_path)
+        times = []
+        blocks = []
+        keys = []
+        for time, block_keys, block_values in stream.iter_blocks():
+            if len(blocks) == 0:
+                keys = [tuple(key.strip() for key in row_keys) for row_keys in block_keys]
+            elif len(block_keys) != len(keys):
+                raise ValueError('Time ' + str(time) + ' in ' + file_path + ' has ' +
+                                 str(len(block_keys)) + ' rows, expected ' + str(len(keys)))
+            times.append(time)
+            blocks.append(block_values)
+        key_count = stream.key_count or 1
+        self.parameters = [heading.strip().upper() for heading in stream.headers[key_count:]]
+        self.times = np.asarray(times, dtype=np.float64)
+        self.elements = [row_keys[0] for row_keys in keys]
+        self.generators = [row_keys[-1] for row_keys in keys]
+        if len(blocks) > 0:
+            self.values = np.stack(blocks)
+        else:
+            self.values = np.empty((0, 0, len(self.parameters)), dtype=np.float64)
+
+    def _read_rows(self, file_path):
+        """ Parse a file with one row per time, or per time and generator when it has text columns
+
+        Parameters
+        -----------
+        file_path :  string
+            Full path to the file
+
+        Returns
+        --------
+
+        """
+        data_table = pd.read_csv(file_path, quotechar='"', skipinitialspace=True)
+        headings = [str(heading).strip().upper() for heading in data_table.columns]
+        data_table.columns = headings
+        key_headings = [heading for heading in headings if not pd.api.types.is_numeric_dtype(data_table[heading])]
+        time_heading = next((heading for heading in headings
+                             if heading.startswith('TIME') and heading not in key_headings), headings[0])
+        if time_heading in key_headings:
+            raise ValueError('The time column ' + time_heading + ' of ' + file_path + ' is not numeric')
+        self.parameters = [heading for heading in headings if heading not in key_headings]
+        row_values = data_table[self.parameters].to_numpy(dtype=np.float64)
+        row_times = data_table[time_heading].to_numpy(dtype=np.float64)
+        if len(key_headings) == 0:
+            self.times = row_times
+            self.elements = [os.path.splitext(self.filetitle)[0]]
+            self.generators = list(self.elements)
+            self.values = row_values[:, np.newaxis, :]
+            return
+        row_keys = data_table[key_headings].astype(str).apply(lambda column: column.str.strip())
+        key_tuples = list(row_keys.itertuples(index=False, name=None))
+        keys = list(dict.fromkeys(key_tuples))
+        key_position = {key: position for position, key in enumerate(keys)}
+        generator_positions = np.fromiter((key_position[key] for key in key_tuples), dtype=np.intp,
+                                          count=len(key_tuples))
+        self.times, time_positions = np.unique(row_times, return_inverse=True)
+        self.elements = [key[0] for key in keys]
+        self.generators = [key[-1] for key in keys]
+        self.values = np.full((len(self.times), len(keys), len(self.parameters)), np.nan)
+        self.values[time_positions, generator_positions] = row_values
+
+    def get_times(self):
+        """ Get times stored for duration of the simulation
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        time_data : list
+            Time data directly from file without processing.
+
+        """
+        self.read_file()
+        time_data = self.times.tolist()
+        return time_data
+
+    def get_time_axis(self):
+        """ Get the output times with their conversions to other units
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        time_axis : TimeAxis
+            Time axis of the generation file
+
+        """
+        self.read_file()
+        if self._time_axis is None:
+            self._time_axis = TimeAxis(self.times)
+        return self._time_axis
+
+    def get_generators(self):
+        """ Get the generators of the file. The source name is used when the file gives one, else the element.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        generators : list[string]
+            Name of each generator in file order
+
+        """
+        self.read_file()
+        return list(self.generators)
+
+    def get_parameters(self):
+        """ Get the numeric parameters of the file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        parameters : list[string]
+            Upper case parameter names
+
+        """
+        self.read_file()
+        return list(self.parameters)
+
+    def get_parameter_index(self, param):
+        """ Index of a parameter in the last axis of the values array
+
+        Parameters
+        -----------
+        param: string
+            Parameter name (case insensitive)
+
+        Returns
+        --------
+        parameter_index : int
+            Position of the parameter
+
+        """
+        self.read_file()
+        try:
+            return self._parameter_index[param.strip().upper()]
+        except KeyError:
+            raise ValueError(param + ' is not a numeric parameter of ' + self.filetitle)
+
+    def get_generator_index(self, generator):
+        """ Position of a generator given by name or by index
+
+        Parameters
+        -----------
+        generator : int or string
+            Generator index, or its source or element name
+
+        Returns
+        --------
+        generator_index : int
+            Position of the generator in the values array
+
+        """
+        self.read_file()
+        if not isinstance(generator, str):
+            return int(generator)
+        if self._generator_index is None:
+            self._generator_index = {}
+            for names in [self.elements, self.generators]:
+                for generator_index, name in enumerate(names):
+                    self._generator_index.setdefault(name, generator_index)
+        try:
+            return self._generator_index[generator.strip()]
+        except KeyError:
+            raise ValueError(generator + ' is not a generator of ' + self.filetitle)
+
+    def get_rates(self, param):
+        """ Values of one parameter for every time and generator
+
+        Parameters
+        -----------
+        param: string
+            Parameter name (case insensitive), e.g. 'GEN' or 'RATE'
+
+        Returns
+        --------
+        rates : np.ndarray
+            Array of shape (time, generator)
+
+        """
+        parameter_index = self.get_parameter_index(param)
+        return self.values[:, :, parameter_index]
+
+    def get_timeseries_data(self, param, generator=0):
+        """ Get Time series data
+
+        Parameters
+        -----------
+        param: string
+            Parameter to be derive data
+        generator : int or string
+            Generator index, or its source or element name
+
+        Returns
+        --------
+        final_timeseries_data : list
+            Time series data for particular parameter.
+
+        """
+        final_timeseries_data = self.get_rates(param)[:, self.get_generator_index(generator)].tolist()
+        return final_timeseries_data
+
+    def _integrate(self, rates):
+        """ Cumulative trapezoidal integral over time of (time x generator) rates. The injected part
+        (positive rate) and produced part (negative rate) are integrated separately, splitting intervals
+        where the rate changes sign at the crossing of the linear interpolant.
+
+        Parameters
+        -----------
+        rates : np.ndarray
+            Array of shape (time, generator). Missing values are taken as zero.
+
+        Returns
+        --------
+        injection, production : np.ndarray, np.ndarray
+            Cumulative injected and produced amounts of shape (time, generator), both positive
+
+        """
+        rates = np.nan_to_num(rates)
+        injection = np.zeros(rates.shape)
+        production = np.zeros(rates.shape)
+        if len(self.times) < 2:
+            return injection, production
+        time_steps = np.diff(self.times)[:, np.newaxis]
+        start = rates[:-1]
+        end = rates[1:]
+        crossing = start * end < 0
+        difference = np.where(crossing, np.abs(end - start), 1.0)
+        positive_area = np.where(crossing, (np.maximum(start, 0) ** 2 + np.maximum(end, 0) ** 2) / (2 * difference),
+                                 0.5 * (np.maximum(start, 0) + np.maximum(end, 0)))
+        negative_area = np.where(crossing, (np.minimum(start, 0) ** 2 + np.minimum(end, 0) ** 2) / (2 * difference),
+                                 -0.5 * (np.minimum(start, 0) + np.minimum(end, 0)))
+        np.cumsum(positive_area * time_steps, axis=0, out=injection[1:])
+        np.cumsum(negative_area * time_steps, axis=0, out=production[1:])
+        return injection, production
+
+    def get_cumulative_injection(self, param):
+        """ Cumulative injected amount of every generator, from the positive part of its rate
+
+        Parameters
+        -----------
+        param: string
+            Rate parameter, e.g. 'GEN'. The result is in the rate units times seconds (kg for kg/s).
+
+        Returns
+        --------
+        injection : np.ndarray
+            Array of shape (time, generator)
+
+        """
+        return self._integrate(self.get_rates(param))[0]
+
+    def get_cumulative_production(self, param):
+        """ Cumulative produced amount of every generator, from the negative part of its rate
+
+        Parameters
+        -----------
+        param: string
+            Rate parameter, e.g. 'GEN'. The result is in the rate units times seconds (kg for kg/s).
+
+        Returns
+        --------
+        production : np.ndarray
+            Array of shape (time, generator), positive for production
+
+        """
+        return self._integrate(self.get_rates(param))[1]
+
+    def get_cumulative_net(self, param):
+        """ Cumulative net amount (injection minus production) of every generator
+
+        Parameters
+        -----------
+        param: string
+            Rate parameter, e.g. 'GEN'
+
+        Returns
+        --------
+        net : np.ndarray
+            Array of shape (time, generator)
+
+        """
+        injection, production = self._integrate(self.get_rates(param))
+        return injection - production
+
+    def get_summary(self, param):
+        """ Total injection, production and net amount of every generator at the last output time
+
+        Parameters
+        -----------
+        param: string
+            Rate parameter, e.g. 'GEN'
+
+        Returns
+        --------
+        summary : pd.Dataframe
+            Table indexed by generator with 'ELEMENT', 'INJECTION', 'PRODUCTION' and 'NET' columns
+
+        """
+        injection, production = self._integrate(self.get_rates(param))
+        if len(self.times) == 0:
+            total_injection = np.zeros(len(self.generators))
+            total_production = np.zeros(len(self.generators))
+        else:
+            total_injection = injection[-1]
+            total_production = production[-1]
+        summary = pd.DataFrame({'ELEMENT': self.elements, 'INJECTION': total_injection,
+                                'PRODUCTION': total_production, 'NET': total_injection - total_production},
+                               index=pd.Index(self.generators, name='GENERATOR'))
+        return summary
@@ -0,0 +1,194 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import os
+import tempfile
+import numpy as np
+from pytoughreact.results.result_store import ResultStore
+
+SIDECAR_EXTENSION = '.npz'
+SIDECAR_VERSION = 2
+
+
+class SidecarColumns(object):
+    """ Lazy access to the per-parameter arrays of an opened sidecar """
+    def __init__(self, archive):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        archive :  np.lib.npyio.NpzFile
+            Opened sidecar archive
+
+        Returns
+        --------
+
+        """
+        self.archive = archive
+
+    def __getitem__(self, parameter_index):
+        return self.archive['column_' + str(parameter_index)]
+
+    def close(self):
+        """ Close the sidecar archive
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        self.archive.close()
+
+
+class ResultSidecar(object):
+    """ Binary (NumPy .npz) sidecar holding a parsed result next to its text output """
+    def __init__(self, source_path, sidecar_path=None):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        source_path :  string
+            Full path to the text output, e.g. OUTPUT_ELEME.csv or kdd_conc.tec
+        sidecar_path : string
+            Full path to the sidecar. Defaults to the source path with '.npz' appended.
+
+        Returns
+        --------
+
+        """
+        self.source_path = source_path
+        if sidecar_path is None:
+            sidecar_path = source_path + SIDECAR_EXTENSION
+        self.sidecar_path = sidecar_path
+
+    def __repr__(self):
+        return 'Sidecar of ' + self.source_path + ' in ' + self.sidecar_path
+
+    def exists(self):
+        """ Check if the sidecar file exists
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        output : boolean
+            True if the sidecar is on disk
+
+        """
+        return os.path.isfile(self.sidecar_path)
+
+    def is_fresh(self):
+        """ Check if the sidecar is newer than its source and was written from the current source
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        output : boolean
+            True if the sidecar can be used in place of the text output
+
+        """
+        if not self.exists() or not os.path.isfile(self.source_path):
+            return False
+        if os.stat(self.sidecar_path).st_mtime_ns < os.stat(self.source_path).st_mtime_ns:
+            return False
+        try:
+            with np.load(self.sidecar_path) as archive:
+                source_signature = tuple(int(value) for value in archive['source_signature'])
+                version = int(archive['version'])
+        except Exception:
+            # A truncated or corrupt sidecar, e.g. left by a killed copy or a full disk, is ignored
+            return False
+        return version == SIDECAR_VERSION and source_signature == ResultStore.file_signature(self.source_path)
+
+    def write(self, store):
+        """ Write a parsed result store to the sidecar
+
+        Parameters
+        -----------
+        store :  ResultStore
+            Parsed result to be written
+
+        Returns
+        --------
+        sidecar_path : string
+            Full path of the written sidecar
+
+        """
+        arrays = {'version': np.asarray(SIDECAR_VERSION),
+                  'source_signature': np.asarray(store.signature, dtype=np.int64),
+                  'times': np.asarray(store.times, dtype=np.float64),
+                  'elements': np.asarray(store.elements, dtype=str),
+                  'headers': np.asarray(store.headers, dtype=str),
+                  'key_count': np.asarray(store.key_count)}
+        coordinates = store.get_coordinates()
+        if coordinates is not None:
+            arrays['coordinates'] = coordinates
+        if store.keys is not None:
+            arrays['keys'] = np.asarray(store.keys, dtype=str).reshape(len(store.keys), store.key_count)
+        for parameter_index, parameter in enumerate(store.parameters):
+            arrays['column_' + str(parameter_index)] = np.ascontiguousarray(store.get_column(parameter))
+        directory = os.path.dirname(os.path.abspath(self.sidecar_path))
+        file_descriptor, temporary_path = tempfile.mkstemp(suffix=SIDECAR_EXTENSION, dir=directory)
+        try:
+            with os.fdopen(file_descriptor, 'wb') as sidecar_file:
+                np.savez(sidecar_file, **arrays)
+            os.replace(temporary_path, self.sidecar_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        return self.sidecar_path
+
+    def load(self):
+        """ Open the sidecar as a result store. Parameter arrays are only read when first used.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        store : ResultStore
+            Store backed by the sidecar
+
+        """
+        archive = np.load(self.sidecar_path)
+        coordinates = archive['coordinates'] if 'coordinates' in archive.files else None
+        store = ResultStore(self.source_path, archive['times'], archive['elements'].tolist(),
+                            archive['headers'].tolist(), int(archive['key_count']), None,
+                            signature=tuple(int(value) for value in archive['source_signature']),
+                            columns=SidecarColumns(archive),
+                            keys=[tuple(row_keys) for row_keys in archive['keys'].tolist()]
+                            if 'keys' in archive.files else None)
+        store.coordinates = coordinates
+        return store
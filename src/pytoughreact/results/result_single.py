@@ -22,7 +22,6 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 
 '''
-import os
 from pytoughreact.plotting.plot_tough_routine import PlotTough
 from pytoughreact.plotting.plot_multiple_tough_routine import PlotMultiTough
 import pytoughreact.constants.generalconstants as gc
@@ -54,8 +53,6 @@ class FileReadSingle(object):
 
         """
         self.filelocation = filelocation
-        if isinstance(self.filelocation, str):
-            os.chdir(self.filelocation)
         self.filetitle = filetitle
         self.simulatortype = simulatortype
         self.generation = kwargs.get(gc.GENERATION)
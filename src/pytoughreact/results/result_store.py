@@ -0,0 +1,411 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import os
+import numpy as np
+import pandas as pd
+from pytoughreact.results.result_stream import ResultStream
+from pytoughreact.results.time_index import TimeIndex, NEAREST
+from pytoughreact.results.time_axis import TimeAxis
+
+
+class ResultStore(object):
+    """ NumPy-backed store of a parsed result file (e.g. OUTPUT_ELEME.csv or kdd_conc.tec) """
+    def __init__(self, file_path, times, elements, headers, key_count, values, signature=None, columns=None,
+                 keys=None):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        file_path :  string
+            Full path to the parsed file
+        times : np.ndarray
+            Output times in seconds
+        elements : list[string]
+            Element (or connection) names as written in the file
+        headers : list[string]
+            Column headings as written in the file
+        key_count : int
+            Number of leading text columns (1 for ELEME, 2 for CONNE, 0 for Tecplot files)
+        values : np.ndarray
+            Numeric data with shape (time, element, parameter). Can be None if columns is given.
+        signature : tuple
+            (mtime, size) of the file when it was parsed
+        columns : list
+            Lazily loaded (time x element) arrays, one per parameter, used instead of values when
+            the store is opened from a binary sidecar
+        keys : list[tuple]
+            Leading text columns of each row, e.g. (ELEM1, ELEM2) for connections
+
+        Returns
+        --------
+
+        """
+        self.file_path = file_path
+        self.times = times
+        self.elements = elements
+        self.headers = headers
+        self.key_count = key_count
+        self.keys = keys
+        self._values = values
+        self._columns = columns
+        self._column_cache = {}
+        self.signature = signature
+        self.coordinates = None
+        self._time_index = None
+        self._time_axis = None
+        self._element_index = None
+        self.parameters = [heading.strip().upper() for heading in headers[key_count:]]
+        self._parameter_index = {parameter: index for index, parameter in enumerate(self.parameters)}
+
+    @property
+    def values(self):
+        """ Numeric data with shape (time, element, parameter) """
+        if self._values is None:
+            self._values = np.stack([self.get_column(parameter) for parameter in self.parameters], axis=-1)
+            self._column_cache = {}
+        return self._values
+
+    def __repr__(self):
+        return 'Result store of ' + str(len(self.times)) + ' times and ' + str(len(self.elements)) + \
+            ' elements from ' + self.file_path
+
+    @staticmethod
+    def file_signature(file_path):
+        """ Signature used to decide if a parsed file has changed on disk
+
+        Parameters
+        -----------
+        file_path :  string
+            Full path to the file
+
+        Returns
+        --------
+        signature : tuple
+            Modification time in nanoseconds and size in bytes
+
+        """
+        stat_result = os.stat(file_path)
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+    @classmethod
+    def from_file(cls, file_path, params=None):
+        """ Parse a TOUGH3 csv output file block by block into one preallocated array, sized from a first
+        scan of its time lines
+
+        Parameters
+        -----------
+        file_path :  string
+            Full path to the file
+        params : list[string]
+            Parameters to be decoded (case insensitive). If None every parameter of the file is decoded.
+
+        Returns
+        --------
+        store : ResultStore
+            Store holding all times and elements of the file and the requested parameters
+
+        """
+        signature = cls.file_signature(file_path)
+        stream = ResultStream(file_path)
+        if params is not None:
+            params = list(dict.fromkeys(param.strip().upper() for param in params))
+            times, keys, values = stream.read_columns(params)
+            key_count = stream.detect_key_count()
+            headers = stream.headers[:key_count] + \
+                [stream.headers[key_count + stream.get_parameter_index(param)] for param in params]
+            return cls(file_path, times, [row_keys[0] for row_keys in keys], headers, key_count, values, signature,
+                       keys=keys)
+        times = stream.get_times()
+        elements = []
+        element_keys = []
+        values = None
+        block_count = 0
+        for time, keys, block in stream.iter_blocks():
+            if block_count == len(times):
+                break
+            if values is None:
+                element_keys = list(keys)
+                elements = [row_keys[0] for row_keys in keys]
+                values = np.empty((len(times),) + block.shape, dtype=np.float64)
+            elif len(keys) != len(elements):
+                raise ValueError('Time ' + str(time) + ' in ' + file_path + ' has ' +
+                                 str(len(keys)) + ' rows, expected ' + str(len(elements)))
+            values[block_count] = block
+            block_count += 1
+        key_count = stream.key_count or 1
+        if values is None:
+            values = np.empty((0, 0, len(stream.headers) - key_count), dtype=np.float64)
+        return cls(file_path, times[:block_count], elements, stream.headers, key_count, values[:block_count],
+                   signature, keys=element_keys)
+
+    def is_stale(self):
+        """ Check if the file changed since it was parsed
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        stale : boolean
+            True if the modification time or size of the file changed
+
+        """
+        try:
+            return self.file_signature(self.file_path) != self.signature
+        except OSError:
+            return True
+
+    def close(self):
+        """ Close the sidecar archive backing the store, if any. Columns that were not read yet can no
+        longer be accessed afterwards.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        if self._columns is not None and hasattr(self._columns, 'close'):
+            self._columns.close()
+
+    def get_parameter_index(self, param):
+        """ Index of a parameter in the last axis of the values array
+
+        Parameters
+        -----------
+        param: string
+            Parameter name (case insensitive)
+
+        Returns
+        --------
+        parameter_index : int
+            Position of the parameter in the store
+
+        """
+        try:
+            return self._parameter_index[param.strip().upper()]
+        except KeyError:
+            raise ValueError(param + ' is not a numeric parameter of ' + self.file_path)
+
+    def get_column(self, param):
+        """ Values of one parameter for every time and element
+
+        Parameters
+        -----------
+        param: string
+            Parameter name (case insensitive)
+
+        Returns
+        --------
+        column : np.ndarray
+            View of shape (time, element)
+
+        """
+        parameter_index = self.get_parameter_index(param)
+        if self._values is not None:
+            return self._values[:, :, parameter_index]
+        if parameter_index not in self._column_cache:
+            self._column_cache[parameter_index] = self._columns[parameter_index]
+        return self._column_cache[parameter_index]
+
+    def get_coordinates(self):
+        """ Element coordinates taken from the X, Y and Z columns at the first output time
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        coordinates : np.ndarray
+            Array of shape (element, 3) or None if the file has no coordinate columns
+
+        """
+        if self.coordinates is None and len(self.times) > 0:
+            coordinate_columns = []
+            for direction in ['X', 'Y', 'Z']:
+                matches = [parameter for parameter in self.parameters
+                           if parameter == direction or parameter == direction + '(M)']
+                if len(matches) == 0:
+                    return None
+                coordinate_columns.append(self.get_column(matches[0])[0])
+            self.coordinates = np.column_stack(coordinate_columns)
+        return self.coordinates
+
+    def get_nearest_time_index(self, time):
+        """ Index of the output time nearest to the requested time
+
+        Parameters
+        -----------
+        time : float
+            Time in seconds
+
+        Returns
+        --------
+        time_index : int
+            Index into the times array
+
+        """
+        return self.get_time_index().lookup(time)
+
+    def get_time_index(self):
+        """ Sorted index of the output times
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        time_index : TimeIndex
+            Index used for time lookups
+
+        """
+        if self._time_index is None:
+            self._time_index = TimeIndex(self.times)
+        return self._time_index
+
+    def get_time_axis(self):
+        """ Output times with their cached conversions to other units
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        time_axis : TimeAxis
+            Time axis of the store
+
+        """
+        if self._time_axis is None:
+            self._time_axis = TimeAxis(self.times)
+        return self._time_axis
+
+    def get_element_values(self, time, param, policy=NEAREST):
+        """ Values of one parameter for every element at one or several output times
+
+        Parameters
+        -----------
+        time : float or list[float] or np.ndarray
+            Requested time(s) in seconds
+        param: string
+            Parameter name (case insensitive)
+        policy : string
+            Time matching policy, 'nearest', 'floor', 'ceil' or 'exact'
+
+        Returns
+        --------
+        values : np.ndarray
+            Read-only array of shape (element) for a single time or (time, element) for an array of times. A
+            single time is a view into the store, so it can not be changed by the caller.
+
+        """
+        values = self.get_column(param)[self.get_time_index().lookup(time, policy)].view()
+        values.flags.writeable = False
+        return values
+
+    def get_element_indices(self, elements):
+        """ Row positions of elements given by name or by index
+
+        Parameters
+        -----------
+        elements : list[int or string]
+            Element indices or names. A name must appear once in a time block.
+
+        Returns
+        --------
+        element_indices : np.ndarray
+            Row position of each element
+
+        """
+        if self._element_index is None:
+            self._element_index = {}
+            for element_index, element in enumerate(self.elements):
+                name = element.strip()
+                self._element_index[name] = None if name in self._element_index else element_index
+        element_indices = []
+        for element in elements:
+            if isinstance(element, str):
+                element_index = self._element_index.get(element.strip(), -1)
+                if element_index is None:
+                    raise ValueError(element + ' appears more than once in ' + self.file_path + ', use its index')
+                if element_index < 0:
+                    raise ValueError(element + ' is not an element of ' + self.file_path)
+            else:
+                element_index = int(element)
+            element_indices.append(element_index)
+        return np.asarray(element_indices, dtype=np.intp)
+
+    def get_timeseries_batch(self, elements, params):
+        """ Time series of several parameters for several elements in one vectorised selection
+
+        Parameters
+        -----------
+        elements : list[int or string]
+            Element indices or names
+        params : list[string]
+            Parameter names (case insensitive)
+
+        Returns
+        --------
+        values : np.ndarray
+            Array of shape (time, element, parameter)
+
+        """
+        element_indices = self.get_element_indices(elements)
+        parameter_indices = [self.get_parameter_index(param) for param in params]
+        if self._values is not None:
+            return self._values[:, element_indices[:, np.newaxis], parameter_indices]
+        return np.stack([self.get_column(param)[:, element_indices] for param in params], axis=-1)
+
+    @staticmethod
+    def batch_to_dataframe(times, elements, params, values):
+        """ Convert a (time x element x parameter) batch to a table
+
+        Parameters
+        -----------
+        times : np.ndarray
+            Output times in seconds
+        elements : list[int or string]
+            Element indices or names as requested
+        params : list[string]
+            Parameter names as requested
+        values : np.ndarray
+            Array of shape (time, element, parameter)
+
+        Returns
+        --------
+        data_table : pd.Dataframe
+            Table indexed by (time, element) with one column per parameter
+
+        """
+        index = pd.MultiIndex.from_product([np.asarray(times), list(elements)], names=['time', 'element'])
+        return pd.DataFrame(np.reshape(values, (len(times) * len(elements), len(params))), index=index,
+                            columns=list(params))
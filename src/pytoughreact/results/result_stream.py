@@ -0,0 +1,646 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import io
+import mmap
+from collections import deque
+import numpy as np
+import pandas as pd
+
+TIME_MARKER = '"TIME'
+
+
+class ResultStream(object):
+    """ Streaming reader that walks the "TIME [sec]" blocks of a TOUGH3 csv output file one at a time """
+    def __init__(self, file_path):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        file_path :  string
+            Full path to the TOUGH3 csv output file (e.g. OUTPUT_ELEME.csv)
+
+        Returns
+        --------
+
+        """
+        self.file_path = file_path
+        with open(self.file_path) as result_file:
+            self.headers = self.parse_header(result_file.readline())
+        self.key_count = None
+
+    def __repr__(self):
+        return 'Result stream of ' + self.file_path
+
+    def __iter__(self):
+        return self.iter_records()
+
+    @staticmethod
+    def parse_header(line):
+        """ Split the heading line of the file into column names
+
+        Parameters
+        -----------
+        line :  string
+            First line of the file
+
+        Returns
+        --------
+        headers : list[string]
+            Column names with quotes and padding removed
+
+        """
+        return [heading.strip().strip('"').strip() for heading in line.rstrip().split(',')]
+
+    @staticmethod
+    def parse_time(line):
+        """ Time value of a "TIME [sec]" line
+
+        Parameters
+        -----------
+        line :  string
+            Time line from the file
+
+        Returns
+        --------
+        time : float
+            Time in seconds
+
+        """
+        return float(line.strip().strip('"').split()[2])
+
+    @staticmethod
+    def count_keys(line):
+        """ Count the leading quoted (text) columns of a data row
+
+        Parameters
+        -----------
+        line :  string
+            Data row from the file
+
+        Returns
+        --------
+        key_count : int
+            Number of text columns before the numeric data
+
+        """
+        key_count = 0
+        for field in line.split(','):
+            if field.strip().startswith('"'):
+                key_count += 1
+            else:
+                break
+        return key_count
+
+    def detect_key_count(self):
+        """ Number of text columns, found from the first data row of the file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        key_count : int
+            Number of text columns before the numeric data
+
+        """
+        if self.key_count is None:
+            with open(self.file_path) as result_file:
+                result_file.readline()
+                in_block = False
+                for line in result_file:
+                    if line.startswith(TIME_MARKER):
+                        in_block = True
+                    elif in_block and line.strip():
+                        self.key_count = self.count_keys(line)
+                        break
+        return self.key_count or 1
+
+    def iter_lines(self):
+        """ Walk the file yielding time values and the data rows of each block
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        output : generator
+            Yields (time, None) at the start of each block and (None, line) for each data row in it
+
+        """
+        with open(self.file_path) as result_file:
+            result_file.readline()
+            in_block = False
+            for line in result_file:
+                if line.startswith(TIME_MARKER):
+                    in_block = True
+                    yield self.parse_time(line), None
+                elif in_block and line.strip():
+                    if self.key_count is None:
+                        self.key_count = self.count_keys(line)
+                    yield None, line
+
+    def iter_blocks(self):
+        """ Generator over the time blocks of the file, holding a single block in memory
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        output : generator
+            Yields (time, keys, values) where keys holds the text columns of each row (the element name,
+            or ELEM1 and ELEM2 for connections) and values is a (row x parameter) float array
+
+        """
+        time = None
+        keys = []
+        rows = []
+        for new_time, line in self.iter_lines():
+            if new_time is not None:
+                if time is not None:
+                    yield time, keys, self._rows_to_array(rows)
+                time = new_time
+                keys = []
+                rows = []
+            else:
+                parts = line.rstrip().split(',', self.key_count)
+                keys.append(tuple(part.strip('"') for part in parts[:self.key_count]))
+                rows.append(parts[self.key_count])
+        if time is not None:
+            yield time, keys, self._rows_to_array(rows)
+
+    def _rows_to_array(self, rows):
+        """ Convert the numeric part of the rows of a block to a float array
+
+        Parameters
+        -----------
+        rows :  list[string]
+            Comma separated numeric text of each row
+
+        Returns
+        --------
+        values : np.ndarray
+            Array of shape (row, parameter)
+
+        """
+        number_of_parameters = len(self.headers) - (self.key_count or 1)
+        if len(rows) == 0:
+            return np.empty((0, number_of_parameters), dtype=np.float64)
+        values = np.fromstring(','.join(rows), dtype=np.float64, sep=',')
+        return values.reshape(len(rows), number_of_parameters)
+
+    def get_block(self, time_index):
+        """ Parse a single time block, skipping the rows of every other block
+
+        Parameters
+        -----------
+        time_index :  int
+            Position of the block in the file
+
+        Returns
+        --------
+        time, keys, values : float, list[tuple], np.ndarray
+            Time of the block, text columns of each row and (row x parameter) values
+
+        """
+        return self.get_blocks([time_index])[time_index]
+
+    def get_blocks(self, time_indices):
+        """ Parse several time blocks in a single pass over the file, skipping the rows of every other block and
+        stopping after the last requested one
+
+        Parameters
+        -----------
+        time_indices :  list[int]
+            Positions of the blocks in the file
+
+        Returns
+        --------
+        blocks : dict
+            (time, keys, values) of each requested block, keyed by its position
+
+        """
+        requested = set(int(time_index) for time_index in time_indices)
+        blocks = {}
+        if len(requested) == 0:
+            return blocks
+        if min(requested) < 0:
+            raise IndexError('Time index ' + str(min(requested)) + ' is not in ' + self.file_path)
+        last_index = max(requested)
+        current_index = -1
+        time = None
+        keys = []
+        rows = []
+        for new_time, line in self.iter_lines():
+            if new_time is not None:
+                if current_index in requested:
+                    blocks[current_index] = (time, keys, self._rows_to_array(rows))
+                if current_index == last_index:
+                    break
+                current_index += 1
+                time = new_time
+                keys = []
+                rows = []
+            elif current_index in requested:
+                parts = line.rstrip().split(',', self.key_count)
+                keys.append(tuple(part.strip('"') for part in parts[:self.key_count]))
+                rows.append(parts[self.key_count])
+        if current_index in requested and current_index not in blocks:
+            blocks[current_index] = (time, keys, self._rows_to_array(rows))
+        if current_index < last_index:
+            raise IndexError('Time index ' + str(last_index) + ' is not in ' + self.file_path)
+        return blocks
+
+    def get_record_dtype(self, name_length=32):
+        """ Record array type of a single time step
+
+        Parameters
+        -----------
+        name_length :  int
+            Maximum length of the element names
+
+        Returns
+        --------
+        dtype : np.dtype
+            Structured type with text key fields followed by float64 parameter fields
+
+        """
+        key_count = self.key_count or 1
+        fields = [(heading, 'U' + str(name_length)) for heading in self.headers[:key_count]]
+        fields += [(heading, np.float64) for heading in self.headers[key_count:]]
+        return np.dtype(fields)
+
+    def iter_records(self):
+        """ Generator yielding one time step at a time as a typed NumPy record array
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        output : generator
+            Yields (time, records) where records has one entry per element
+
+        """
+        dtype = None
+        for time, keys, values in self.iter_blocks():
+            if dtype is None:
+                dtype = self.get_record_dtype(max([len(key) for row_keys in keys for key in row_keys] + [1]))
+            records = np.empty(len(keys), dtype=dtype)
+            for index, name in enumerate(dtype.names[:self.key_count]):
+                records[name] = [row_keys[index] for row_keys in keys]
+            for index, name in enumerate(dtype.names[self.key_count:]):
+                records[name] = values[:, index]
+            yield time, records.view(np.recarray)
+
+    def get_parameter_index(self, param):
+        """ Index of a parameter within the numeric part of a data row
+
+        Parameters
+        -----------
+        param: string
+            Parameter name (case insensitive)
+
+        Returns
+        --------
+        parameter_index : int
+            Index of the parameter after the key columns
+
+        """
+        key_count = self.detect_key_count()
+        parameters = [heading.strip().upper() for heading in self.headers[key_count:]]
+        try:
+            return parameters.index(param.strip().upper())
+        except ValueError:
+            raise ValueError(param + ' is not a numeric parameter of ' + self.file_path)
+
+    def get_times(self):
+        """ Times of all blocks, reading only the time lines
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        times : np.ndarray
+            Output times in seconds
+
+        """
+        times = []
+        with open(self.file_path) as result_file:
+            for line in result_file:
+                if line.startswith(TIME_MARKER):
+                    times.append(self.parse_time(line))
+        return np.asarray(times, dtype=np.float64)
+
+    def get_timeseries(self, param, element):
+        """ Time series of one parameter for one element in constant memory
+
+        Parameters
+        -----------
+        param: string
+            Parameter name (case insensitive)
+        element : int or string
+            Position of the element in each block or its name. Negative positions count from the end of
+            each block, as in the parsed store.
+
+        Returns
+        --------
+        times, values : np.ndarray, np.ndarray
+            Output times and the parameter value of the element at each time
+
+        """
+        parameter_index = self.get_parameter_index(param)
+        times = []
+        values = []
+        if isinstance(element, str) or element >= 0:
+            row_number = 0
+            for time, line in self.iter_lines():
+                if time is not None:
+                    times.append(time)
+                    row_number = 0
+                    continue
+                if isinstance(element, str):
+                    matched = line.split(',', 1)[0].strip().strip('"').strip() == element.strip()
+                else:
+                    matched = row_number == element
+                if matched:
+                    values.append(self._get_field(line, parameter_index))
+                row_number += 1
+        else:
+            last_lines = deque(maxlen=-element)
+            for time, line in self.iter_lines():
+                if time is not None:
+                    if len(times) > 0 and len(last_lines) == -element:
+                        values.append(self._get_field(last_lines[0], parameter_index))
+                    times.append(time)
+                    last_lines.clear()
+                else:
+                    last_lines.append(line)
+            if len(times) > 0 and len(last_lines) == -element:
+                values.append(self._get_field(last_lines[0], parameter_index))
+        if len(values) != len(times):
+            raise ValueError(str(element) + ' was not found at every time in ' + self.file_path)
+        return np.asarray(times, dtype=np.float64), np.asarray(values, dtype=np.float64)
+
+    def _get_field(self, line, parameter_index):
+        """ Value of one parameter in a data row
+
+        Parameters
+        -----------
+        line :  string
+            Data row of a block
+        parameter_index : int
+            Position of the parameter among the numeric columns
+
+        Returns
+        --------
+        value : float
+            Value of the parameter
+
+        """
+        fields = line.rstrip().split(',', self.key_count + parameter_index + 1)
+        return float(fields[self.key_count + parameter_index])
+
+    def get_timeseries_batch(self, elements, params):
+        """ Time series of several parameters for several elements in a single pass over the file
+
+        Parameters
+        -----------
+        elements : list[int or string]
+            Positions of the elements in each block or their names
+        params : list[string]
+            Parameter names (case insensitive)
+
+        Returns
+        --------
+        times, values : np.ndarray, np.ndarray
+            Output times and an array of shape (time, element, parameter)
+
+        """
+        parameter_indices = [self.get_parameter_index(param) for param in params]
+        element_indices = None
+        times = []
+        blocks = []
+        for time, keys, values in self.iter_blocks():
+            if element_indices is None:
+                names = [row_keys[0].strip() for row_keys in keys]
+                element_indices = []
+                for element in elements:
+                    if isinstance(element, str):
+                        if names.count(element.strip()) != 1:
+                            raise ValueError(element + ' does not appear exactly once in ' + self.file_path)
+                        element_indices.append(names.index(element.strip()))
+                    else:
+                        element_indices.append(int(element))
+                element_indices = np.asarray(element_indices, dtype=np.intp)
+            times.append(time)
+            blocks.append(values[element_indices[:, np.newaxis], parameter_indices])
+        if len(blocks) == 0:
+            return np.empty(0, dtype=np.float64), np.empty((0, len(elements), len(params)), dtype=np.float64)
+        return np.asarray(times, dtype=np.float64), np.stack(blocks)
+
+    def split_blocks(self, content):
+        """ Locate the times and data rows of each block in the raw bytes of the file, without copying them
+
+        Parameters
+        -----------
+        content :  bytes or mmap.mmap
+            Content of the whole file
+
+        Returns
+        --------
+        times, bounds : np.ndarray, list[tuple]
+            Output times and the (start, end) byte offsets of the rows of each block
+
+        """
+        marker = b'\n' + TIME_MARKER.encode()
+        position = content.find(marker) + 1
+        times = []
+        bounds = []
+        while position > 0:
+            line_end = content.find(b'\n', position)
+            line_end = len(content) if line_end < 0 else line_end + 1
+            next_position = content.find(marker, line_end - 1) + 1
+            end = next_position if next_position > 0 else len(content)
+            times.append(self.parse_time(content[position:line_end].decode()))
+            bounds.append((line_end, end))
+            position = next_position
+        return np.asarray(times, dtype=np.float64), bounds
+
+    def _read_fixed_width_columns(self, content, bounds, columns, key_count):
+        """ Decode columns by byte position when every row of the file has the same layout, as TOUGH3 writes them.
+        The rows are read in place and the values are written into one preallocated array.
+
+        Parameters
+        -----------
+        content :  bytes or mmap.mmap
+            Content of the whole file
+        bounds : list[tuple]
+            (start, end) byte offsets of the rows of each block
+        columns : list[int]
+            Positions of the requested fields in a row
+        key_count : int
+            Number of leading text columns of a row
+
+        Returns
+        --------
+        keys, values : list[tuple], np.ndarray
+            Text columns of each row of the first block and an array of shape (time, element, parameter), or
+            None if the rows are not fixed width
+
+        """
+        buffer = np.frombuffer(content, dtype=np.uint8)
+        first_start, first_end = bounds[0]
+        row_end = content.find(b'\n', first_start, first_end)
+        if row_end < 0:
+            return None
+        row_length = row_end + 1 - first_start
+        first_row = buffer[first_start:first_start + row_length]
+        commas = np.flatnonzero(first_row == ord(','))
+        if len(commas) != len(self.headers) - 1:
+            return None
+        line_end = row_length - 2 if first_row[-2] == ord('\r') else row_length - 1
+        starts = np.concatenate([[0], commas + 1])
+        ends = np.concatenate([commas, [line_end]])
+        row_count = (first_end - first_start) // row_length
+        values = np.empty((len(bounds), row_count, len(columns)), dtype=np.float64)
+        for time_index, (start, end) in enumerate(bounds):
+            block_bytes = buffer[start:end]
+            if len(block_bytes) % row_length == row_length - 1 and end == len(buffer):
+                block_bytes = np.append(block_bytes, np.uint8(ord('\n')))
+            if len(block_bytes) % row_length != 0:
+                return None
+            rows = block_bytes.reshape(-1, row_length)
+            if len(rows) != row_count:
+                self._check_row_counts([row_count] * time_index + [len(rows)])
+            if not np.all(rows[:, commas] == ord(',')):
+                return None
+            for position, column in enumerate(columns):
+                fields = np.ascontiguousarray(rows[:, starts[column]:ends[column]])
+                try:
+                    values[time_index, :, position] = fields.view('S' + str(ends[column] - starts[column])).ravel()
+                except ValueError:
+                    return None
+        first_rows = buffer[first_start:first_start + row_count * row_length].reshape(-1, row_length)
+        key_columns = []
+        for column in range(key_count):
+            names = np.ascontiguousarray(first_rows[:, starts[column]:ends[column]])
+            key_columns.append([name.decode().strip().strip('"')
+                                for name in names.view('S' + str(ends[column] - starts[column])).ravel()])
+        keys = list(zip(*key_columns))
+        return keys, values
+
+    def _check_row_counts(self, row_counts):
+        """ Raise an error if the blocks of the file do not all have the same number of rows
+
+        Parameters
+        -----------
+        row_counts :  list[int]
+            Number of rows of each block
+
+        Returns
+        --------
+
+        """
+        for time_index, row_count in enumerate(row_counts):
+            if row_count != row_counts[0]:
+                raise ValueError('Time index ' + str(time_index) + ' in ' + self.file_path + ' has ' +
+                                 str(row_count) + ' rows, expected ' + str(row_counts[0]))
+
+    def read_columns(self, params):
+        """ Parse every time block of the file, decoding only the requested parameters
+
+        Parameters
+        -----------
+        params : list[string]
+            Parameter names (case insensitive)
+
+        Returns
+        --------
+        times, keys, values : np.ndarray, list[tuple], np.ndarray
+            Output times, text columns of each row (e.g. (ELEM1, ELEM2) for connections) and an array of
+            shape (time, element, parameter)
+
+        """
+        key_count = self.detect_key_count()
+        columns = [key_count + self.get_parameter_index(param) for param in params]
+        with open(self.file_path, 'rb') as result_file:
+            content = mmap.mmap(result_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return self._read_mapped_columns(content, columns, key_count)
+        finally:
+            try:
+                content.close()
+            except BufferError:
+                # Arrays still referenced by an exception keep the map open until they are freed
+                pass
+
+    def _read_mapped_columns(self, content, columns, key_count):
+        """ Decode the requested columns of every block of a memory-mapped file into one preallocated array.
+        Blocks that are not fixed width are parsed one at a time, so at most one block is copied.
+
+        Parameters
+        -----------
+        content :  mmap.mmap
+            Content of the whole file
+        columns : list[int]
+            Positions of the requested fields in a row
+        key_count : int
+            Number of leading text columns of a row
+
+        Returns
+        --------
+        times, keys, values : np.ndarray, list[tuple], np.ndarray
+            Output times, text columns of each row and an array of shape (time, element, parameter)
+
+        """
+        times, bounds = self.split_blocks(content)
+        if len(bounds) == 0 or all(end <= start for start, end in bounds):
+            return times, [], np.empty((len(times), 0, len(columns)), dtype=np.float64)
+        fixed_width = self._read_fixed_width_columns(content, bounds, columns, key_count)
+        if fixed_width is not None:
+            keys, values = fixed_width
+            return times, keys, values
+        keys = []
+        values = None
+        key_columns = list(range(key_count))
+        for time_index, (start, end) in enumerate(bounds):
+            table = pd.read_csv(io.BytesIO(content[start:end]), header=None,
+                                usecols=sorted(set(key_columns + columns)), quotechar='"', skipinitialspace=True,
+                                dtype={column: str for column in key_columns})
+            if values is None:
+                keys = list(zip(*[table[column].tolist() for column in key_columns]))
+                values = np.empty((len(bounds), len(table), len(columns)), dtype=np.float64)
+            elif len(table) != values.shape[1]:
+                self._check_row_counts([values.shape[1]] * time_index + [len(table)])
+            values[time_index] = table[columns].to_numpy(dtype=np.float64)
+        return times, keys, values
@@ -0,0 +1,343 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import mmap
+import os
+import re
+import tempfile
+import numpy as np
+from pytoughreact.results.time_index import TimeIndex
+
+INDEX_EXTENSION = '.idx'
+INDEX_VERSION = 1
+ZONE_PATTERN = re.compile(rb'^(?:ZONE|Zone|zone)[^\n]*', re.MULTILINE)
+VARIABLES_PATTERN = re.compile(rb'^(?:VARIABLES|Variables|variables)[^\n]*', re.MULTILINE)
+
+
+class TecplotIndex(object):
+    """ Byte-offset index of the zones of a TOUGHREACT Tecplot file (e.g. kdd_conc.tec) """
+    def __init__(self, file_path, index_path=None):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        file_path :  string
+            Full path to the Tecplot file
+        index_path : string
+            Full path to the persisted index. Defaults to the file path with '.idx' appended.
+
+        Returns
+        --------
+
+        """
+        self.file_path = file_path
+        if index_path is None:
+            index_path = file_path + INDEX_EXTENSION
+        self.index_path = index_path
+        self.times = None
+        self.offsets = None
+        self.headers = None
+        self.signature = None
+        self._time_index = None
+
+    def __repr__(self):
+        return 'Zone index of ' + self.file_path
+
+    @staticmethod
+    def file_signature(file_path):
+        """ Signature used to decide if the indexed file has changed on disk
+
+        Parameters
+        -----------
+        file_path :  string
+            Full path to the file
+
+        Returns
+        --------
+        signature : tuple
+            Modification time in nanoseconds and size in bytes
+
+        """
+        stat_result = os.stat(file_path)
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+    @staticmethod
+    def parse_variables(line):
+        """ Column names of the Variables line, read the same way as t2listing.toughreact_tecplot
+
+        Parameters
+        -----------
+        line :  string
+            Variables line of the file
+
+        Returns
+        --------
+        headers : list[string]
+            Column names
+
+        """
+        separator = ',' if ',' in line else None
+        headers = []
+        for heading in line[line.find('=') + 1:].strip().split(separator):
+            if heading.strip():
+                if heading.startswith('"') and heading.endswith('"'):
+                    headers.append(heading[1:-1].strip())
+                else:
+                    headers.append(heading.strip())
+        return headers
+
+    @staticmethod
+    def parse_zone_time(line):
+        """ Time of a Zone line, e.g. Zone T= "1.00000000E+01 sec"
+
+        Parameters
+        -----------
+        line :  string
+            Zone line of the file
+
+        Returns
+        --------
+        time : float
+            Time in seconds or None if the line has no time
+        """
+        quote_position = line.find('"')
+        if quote_position < 0:
+            return None
+        space_position = line.find(' ', quote_position)
+        if space_position < 0:
+            return None
+        return float(line[quote_position + 1:space_position])
+
+    def build(self):
+        """ Scan the memory-mapped file once for the Variables line and the start of every zone
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        self.signature = self.file_signature(self.file_path)
+        times = []
+        offsets = []
+        headers = []
+        with open(self.file_path, 'rb') as tecplot_file:
+            if self.signature[1] > 0:
+                with mmap.mmap(tecplot_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                    variables = VARIABLES_PATTERN.search(mapped_file)
+                    if variables is not None:
+                        headers = self.parse_variables(variables.group().decode().rstrip())
+                    for zone in ZONE_PATTERN.finditer(mapped_file):
+                        time = self.parse_zone_time(zone.group().decode())
+                        if time is not None:
+                            times.append(time)
+                            offsets.append(zone.end() + 1)
+        if len(headers) == 0:
+            raise ValueError('Could not find variable definitions for TOUGHREACT Tecplot file ' + self.file_path)
+        if len(times) == 0:
+            raise ValueError('No results found in TOUGHREACT Tecplot file ' + self.file_path)
+        self.times = np.asarray(times, dtype=np.float64)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.headers = headers
+
+    def is_fresh(self):
+        """ Check if the persisted index was built from the current file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        output : boolean
+            True if the persisted index can be used
+
+        """
+        if not os.path.isfile(self.index_path):
+            return False
+        try:
+            with np.load(self.index_path) as archive:
+                source_signature = tuple(int(value) for value in archive['source_signature'])
+                version = int(archive['version'])
+        except Exception:
+            # A truncated or corrupt index, e.g. left by a killed writer, is rebuilt
+            return False
+        return version == INDEX_VERSION and source_signature == self.file_signature(self.file_path)
+
+    def save(self):
+        """ Persist the index next to the Tecplot file. The index is written to a temporary file that replaces
+        the old one, so readers never see a partial index. A read-only location is ignored.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        directory = os.path.dirname(os.path.abspath(self.index_path))
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(suffix=INDEX_EXTENSION, dir=directory)
+        except OSError:
+            return
+        try:
+            with os.fdopen(file_descriptor, 'wb') as index_file:
+                np.savez(index_file, version=np.asarray(INDEX_VERSION),
+                         source_signature=np.asarray(self.signature, dtype=np.int64),
+                         times=self.times, offsets=self.offsets, headers=np.asarray(self.headers, dtype=str))
+            os.replace(temporary_path, self.index_path)
+        except OSError:
+            pass
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def load(self):
+        """ Read the persisted index
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        with np.load(self.index_path) as archive:
+            self.signature = tuple(int(value) for value in archive['source_signature'])
+            self.times = archive['times']
+            self.offsets = archive['offsets']
+            self.headers = archive['headers'].tolist()
+
+    def open(self):
+        """ Load the persisted index, or build and persist it on first open or when the file changed
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        index : TecplotIndex
+            The opened index
+
+        """
+        if self.times is None or self.signature != self.file_signature(self.file_path):
+            loaded = False
+            if self.is_fresh():
+                try:
+                    self.load()
+                    loaded = True
+                except Exception:
+                    # The index was replaced by a corrupt file after it was checked
+                    loaded = False
+            if not loaded:
+                self.build()
+                self.save()
+        return self
+
+    def get_nearest_time_index(self, time):
+        """ Index of the zone nearest to the requested time, chosen as t2listing.toughreact_tecplot.set_time does
+
+        Parameters
+        -----------
+        time : float
+            Time in seconds
+
+        Returns
+        --------
+        time_index : int
+            Index of the zone
+
+        """
+        return self.get_time_index().lookup(time)
+
+    def get_time_index(self):
+        """ Sorted index of the zone times
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        time_index : TimeIndex
+            Index used for time lookups
+
+        """
+        if self._time_index is None or self._time_index.times is not self.times:
+            self._time_index = TimeIndex(self.times)
+        return self._time_index
+
+    def get_parameter_index(self, param):
+        """ Column of a parameter in each zone
+
+        Parameters
+        -----------
+        param: string
+            Parameter name as written in the Variables line
+
+        Returns
+        --------
+        parameter_index : int
+            Position of the parameter
+
+        """
+        try:
+            return self.headers.index(param)
+        except ValueError:
+            raise ValueError(param + ' is not a parameter of ' + self.file_path)
+
+    def get_zone(self, time_index):
+        """ Parse a single zone from the memory-mapped file
+
+        Parameters
+        -----------
+        time_index :  int
+            Index of the zone. Negative values count from the end.
+
+        Returns
+        --------
+        values : np.ndarray
+            Array of shape (element, parameter)
+
+        """
+        start = int(self.offsets[time_index])
+        if time_index == -1 or time_index == len(self.offsets) - 1:
+            end = None
+        else:
+            end = int(self.offsets[time_index + 1])
+        with open(self.file_path, 'rb') as tecplot_file:
+            with mmap.mmap(tecplot_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                if end is None:
+                    end = len(mapped_file)
+                else:
+                    end = mapped_file.rfind(b'\n', start, end - 1) + 1
+                zone_text = mapped_file[start:end]
+        values = np.fromstring(zone_text.decode(), dtype=np.float64, sep=' ')
+        return values.reshape(-1, len(self.headers))
@@ -26,9 +26,16 @@ SOFTWARE.
 import os
 import numpy as np
 import csv
-import collections
-import itertools
 from pytoughreact.utilities.t2_utilities import T2Utilities
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.utilities.downsampling import get_downsampled_timeseries, LTTB
+from pytoughreact.results.result_stream import ResultStream, TIME_MARKER
+from pytoughreact.results.time_index import TimeIndex
+from pytoughreact.results.time_axis import TimeAxis
+from pytoughreact.results.result_sidecar import ResultSidecar
+from pytoughreact.results.result_follower import ResultFollower
+from pytoughreact.results.result_generation import ResultGeneration
+from pytoughreact.results.structured_grid import StructuredGrid
 
 
 class ResultTough3(object):
@@ -47,6 +54,12 @@ class ResultTough3(object):
             Title or name of the file. Example is 'kddconc.tec' or 'OUTPUT.csv'
         kwargs: dict
             1) generation (string) - if generation data exists in the results.
+            2) streaming (boolean) - read the file block by block in bounded memory instead of
+               holding the whole parsed result in memory.
+            3) use_sidecar (boolean) - read from the binary sidecar written by export() when it is
+               newer than the text output. Defaults to True.
+            4) usecols (list[string]) - parameters to be decoded from the file, e.g. ['X', 'Z', 'PRES'].
+               The other columns are skipped, which is much faster for files with many columns.
 
 
         Returns
@@ -57,11 +70,19 @@ class ResultTough3(object):
             self.filelocation = os.getcwd()
         else:
             self.filelocation = filelocation
-            os.chdir(self.filelocation)
         self.filetitle = filetitle
         self.simulatortype = simulatortype
         self.generation = kwargs.get('generation')
         self.file_as_list = []
+        self.streaming = kwargs.get('streaming', False)
+        self.use_sidecar = kwargs.get('use_sidecar', True)
+        self.usecols = kwargs.get('usecols')
+        self._store = None
+        self._generation = None
+        self._grid = None
+        self._grid_signature = None
+        self._result_dictionary = None
+        self._result_dictionary_signature = None
 
     def __repr__(self):
         return 'Results from ' + self.filelocation + ' in ' + self.filetitle + ' for ' + self.simulatortype
@@ -79,14 +100,122 @@ class ResultTough3(object):
             Results from file as list
 
         """
-        os.chdir(self.filelocation)
-        with open(self.filetitle) as csv_file:
+        with open(os.path.join(self.filelocation, self.filetitle)) as csv_file:
             csv_reader = csv.reader(csv_file, delimiter=',', quotechar='"')
             self.file_as_list = []
             for row in csv_reader:
                 self.file_as_list.append(row)
         return self.file_as_list
 
+    def get_store(self):
+        """ Get the parsed result store, parsing the file only on first use or after it changed on disk
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        store : ResultStore
+            NumPy-backed (time x element x parameter) store of the file
+
+        """
+        if self._store is None or self._store.is_stale():
+            if self._store is not None:
+                self._store.close()
+            file_path = os.path.join(self.filelocation, self.filetitle)
+            sidecar = ResultSidecar(file_path)
+            if self.use_sidecar and sidecar.is_fresh():
+                self._store = sidecar.load()
+            else:
+                self._store = ResultStore.from_file(file_path, self.usecols)
+        return self._store
+
+    def close(self):
+        """ Release the parsed results and any open sidecar. The file is parsed again on the next query.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        if self._store is not None:
+            self._store.close()
+        self._store = None
+        self._generation = None
+        self._grid = None
+        self._grid_signature = None
+        self._result_dictionary = None
+        self._result_dictionary_signature = None
+        self.file_as_list = []
+
+    def export(self, sidecar_path=None):
+        """ Convert the text output once into a binary sidecar that later readers open instead
+
+        Parameters
+        -----------
+        sidecar_path : string
+            Full path of the sidecar. Defaults to the result file name with '.npz' appended.
+
+        Returns
+        --------
+        sidecar_path : string
+            Full path of the written sidecar
+
+        """
+        file_path = os.path.join(self.filelocation, self.filetitle)
+        if self.usecols is not None:
+            return ResultSidecar(file_path, sidecar_path).write(ResultStore.from_file(file_path))
+        return ResultSidecar(file_path, sidecar_path).write(self.get_store())
+
+    def get_follower(self):
+        """ Get an incremental reader that returns only the time blocks appended by a running simulation
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        follower : ResultFollower
+            Follower of the result file
+
+        """
+        return ResultFollower(os.path.join(self.filelocation, self.filetitle), 'csv')
+
+    def get_stream(self):
+        """ Get a streaming reader over the time blocks of the file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        stream : ResultStream
+            Reader yielding one time step at a time
+
+        """
+        return ResultStream(os.path.join(self.filelocation, self.filetitle))
+
+    def iter_time_steps(self):
+        """ Iterate over the output one time step at a time
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        output : generator
+            Yields (time, records) where records is a NumPy record array with a field per column
+
+        """
+        return self.get_stream().iter_records()
+
     def get_times(self):
         """ Get times stored for duration of the simulation
 
@@ -102,19 +231,13 @@ class ResultTough3(object):
         unprocessed_time_data : list
             Time data directly from file without processing.
         """
-        self.read_file()
-        time = []
         unprocessed_time_data = []
         if self.generation is True:
-            for i in range(1, len(self.file_as_list)):
-                unprocessed_time_data.append(float(self.file_as_list[i][0]))
+            unprocessed_time_data = self.get_generation().get_times()
+        elif self.streaming:
+            unprocessed_time_data = self.get_stream().get_times().tolist()
         else:
-            for i in range(len(self.file_as_list)):
-                if len(self.file_as_list[i]) == 1:
-                    time.append(self.file_as_list[i])
-            for i in range(len(time)):
-                interim = time[i][0].split()
-                unprocessed_time_data.append(float(interim[2]))
+            unprocessed_time_data = self.get_store().times.tolist()
         return unprocessed_time_data
 
     def convert_times(self, format_of_date):
@@ -123,7 +246,8 @@ class ResultTough3(object):
         Parameters
         -----------
         format_of_date : str
-            Provides information to the method on format of the date. For example. year, hour, min or seconds
+            Provides information to the method on format of the date. For example. year, hour, min or seconds.
+            A number is taken as the length of the unit in seconds.
 
         Returns
         --------
@@ -131,11 +255,28 @@ class ResultTough3(object):
             List of converted time
 
         """
-        intermediate = self.get_times()
-        utility_function = T2Utilities()
-        processed_time_data = utility_function.convert_times(intermediate, format_of_date)
+        processed_time_data = self.get_time_axis().convert(format_of_date).tolist()
         return processed_time_data
 
+    def get_time_axis(self):
+        """ Get the output times with their conversions to other units, computed once per parse of the file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        time_axis : TimeAxis
+            Time axis of the results
+
+        """
+        if self.generation is True:
+            return self.get_generation().get_time_axis()
+        if self.streaming:
+            return TimeAxis(self.get_times())
+        return self.get_store().get_time_axis()
+
     def get_time_index(self):
         """ Get Index of Time
 
@@ -156,13 +297,32 @@ class ResultTough3(object):
         indexed_time.append(len(self.file_as_list))
         return indexed_time
 
-    def get_generation_data(self, param):
+    def get_generation(self):
+        """ Get the generation reader of the file, which parses it once for every parameter and generator
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        generation : ResultGeneration
+            Reader of the generation file
+
+        """
+        if self._generation is None:
+            self._generation = ResultGeneration(self.simulatortype, self.filelocation, self.filetitle)
+        return self._generation
+
+    def get_generation_data(self, param, generator=0):
         """ Get data from generation.
 
         Parameters
         -----------
         param: string
             Parameter to be derive data
+        generator : int or string
+            Generator index, or its source or element name, for files holding several generators
 
         Returns
         --------
@@ -170,18 +330,7 @@ class ResultTough3(object):
             Results from the generation.
 
         """
-        self.read_file()
-        result_array = []
-        heading = []
-        heading_first = self.file_as_list[0]
-        heading_first_modify = []
-        for i in heading_first:
-            heading_first_modify.append(i.upper())
-        for i in range(len(heading_first_modify)):
-            heading.append(heading_first_modify[i].lstrip())
-        index_param = heading.index(param.upper())
-        for i in range(1, len(self.file_as_list)):
-            result_array.append(float(self.file_as_list[i][index_param]))
+        result_array = self.get_generation().get_timeseries_data(param, generator)
         return result_array
 
     def get_elements(self):
@@ -197,12 +346,7 @@ class ResultTough3(object):
             Elements present in the result file.
 
         """
-        self.read_file()
-        indextime = self.get_time_index()
-        temp_file = self.file_as_list[indextime[0] + 1:indextime[1]]
-        elements = []
-        for i in range(len(temp_file)):
-            elements.append(temp_file[i][0])
+        elements = list(self.get_store().elements)
         return elements
 
     def get_parameters(self):
@@ -218,14 +362,11 @@ class ResultTough3(object):
             Parameters with blanks removed.
 
         """
-        self.read_file()
-        parameter_list = self.file_as_list[0]
-        for i in range(len(parameter_list)):
-            parameter_list[i] = parameter_list[i].replace(" ", "")
+        parameter_list = [heading.replace(" ", "") for heading in self.get_store().headers]
         return parameter_list
 
     def get_result_dictionary(self):
-        """ Results in dictionary form
+        """ Results in dictionary form, with the rows of the file read once per version of the file
 
         Parameters
         -----------
@@ -234,19 +375,25 @@ class ResultTough3(object):
         Returns
         --------
         result_dict : dict
-            Results dictionary
+            Results dictionary keyed by time. Each row holds the fields of a line of the file as strings.
 
         """
-        self.read_file()
-        result_dict = {}
-        temp_dict = {}
-        index_time = self.get_time_index()
-        timeraw = self.get_times()
-        for i in range(len(index_time) - 1):
-            temp_dict[i] = self.file_as_list[index_time[i] + 1:index_time[i + 1]]
-        for i in range(len(timeraw)):
-            result_dict[timeraw[i]] = temp_dict[i]
-        return result_dict
+        signature = ResultStore.file_signature(os.path.join(self.filelocation, self.filetitle))
+        if self._result_dictionary is None or self._result_dictionary_signature != signature:
+            times = self.get_times()
+            result_dict = {}
+            time_number = -1
+            for row in self.read_file():
+                if len(row) > 0 and row[0].startswith(TIME_MARKER.strip('"')):
+                    time_number += 1
+                    if time_number == len(times):
+                        break
+                    result_dict[times[time_number]] = []
+                elif time_number >= 0:
+                    result_dict[times[time_number]].append(row)
+            self._result_dictionary = result_dict
+            self._result_dictionary_signature = signature
+        return {time: [list(row) for row in rows] for time, rows in self._result_dictionary.items()}
 
     def get_timeseries_data(self, param, gridblocknumber):
         """ Get Time series data
@@ -264,61 +411,91 @@ class ResultTough3(object):
             Time series data for particular parameter.
 
         """
-        self.read_file()
-        results = self.get_result_dictionary()
-        resultarray = []
-        heading = []
-        heading_first = self.file_as_list[0]
-        heading_first_modify = []
-        for i in heading_first:
-            heading_first_modify.append(i.upper())
-        for i in range(len(heading_first_modify)):
-            heading.append(heading_first_modify[i].lstrip())
-        index_param = heading.index(param.upper())
-        for k in results.keys():
-            resultarray.append(results[k][gridblocknumber][index_param].lstrip())
-        final_timeseries_data = [float(x) for x in resultarray]
+        if self.streaming:
+            _, timeseries_data = self.get_stream().get_timeseries(param, gridblocknumber)
+            return timeseries_data.tolist()
+        final_timeseries_data = self.get_store().get_column(param)[:, gridblocknumber].tolist()
         return final_timeseries_data
 
-    def get_element_data(self, time, param):
-        """ Get Data for elements
+    def get_downsampled_timeseries(self, param, grid_block_number, max_points, method=LTTB):
+        """ Get a time series reduced to a number of points that keeps its shape, e.g. for plotting long runs
 
         Parameters
         -----------
-        time : float
-            Time in which the data should be retrieved.
         param: string
             Parameter to be derive data
+        grid_block_number :  int
+            The grid block number for which to retrieve the results
+        max_points : int
+            Largest number of points to keep
+        method : string
+            'lttb' for Largest-Triangle-Three-Buckets or 'minmax' for the extremes of each bucket
 
         Returns
         --------
-        final_element_data : list
-            Data for each of the elements.
+        times, values : np.ndarray, np.ndarray
+            Kept output times in seconds and the parameter values at those times
+
         """
-        self.read_file()
-        timeraw = self.get_times()
-        results = self.get_result_dictionary()
-        heading = []
-        heading_first = self.file_as_list[0]
-        heading_first_modify = []
-        for i in heading_first:
-            heading_first_modify.append(i.upper())
-        for i in range(len(heading_first_modify)):
-            heading.append(heading_first_modify[i].lstrip())
-        index_param = heading.index(param.upper())
-        if time < timeraw[0]:
-            time = timeraw[0]
-        elif time > timeraw[-1]:
-            time = timeraw[-1]
+        return get_downsampled_timeseries(self.get_store(), param, grid_block_number, max_points, method)
+
+    def get_timeseries_batch(self, elements, params, as_dataframe=False):
+        """ Get time series of several parameters for several grid blocks at once
+
+        Parameters
+        -----------
+        elements : list[int or string]
+            Grid block numbers or names
+        params : list[string]
+            Parameters to be derived from data
+        as_dataframe : boolean
+            Return a table indexed by (time, element) instead of an array
+
+        Returns
+        --------
+        timeseries_data : np.ndarray or pd.Dataframe
+            Array of shape (time, element, parameter) or the equivalent table
+
+        """
+        if self.streaming:
+            times, timeseries_data = self.get_stream().get_timeseries_batch(elements, params)
         else:
-            absolute_difference_function = lambda list_value: abs(list_value - time)
-            time = min(timeraw, key=absolute_difference_function)
-        results_specific = results[time]
-        data = []
-        for i in range(len(results_specific)):
-            data.append(results_specific[i][index_param].lstrip())
-        final_element_data = [float(x) for x in data]
-        return final_element_data
+            store = self.get_store()
+            times = store.times
+            timeseries_data = store.get_timeseries_batch(elements, params)
+        if as_dataframe:
+            return ResultStore.batch_to_dataframe(times, elements, params, timeseries_data)
+        return timeseries_data
+
+    def get_element_data(self, time, param, policy='nearest'):
+        """ Get Data for elements
+
+        Parameters
+        -----------
+        time : float or list[float] or np.ndarray
+            Time in which the data should be retrieved. Several times can be given at once.
+        param: string
+            Parameter to be derive data
+        policy : string
+            How the output time is matched, 'nearest', 'floor', 'ceil' or 'exact'
+
+        Returns
+        --------
+        final_element_data : list or np.ndarray
+            Data for each of the elements. For several times a (time x element) array is returned.
+        """
+        if self.streaming:
+            stream = self.get_stream()
+            parameter_index = stream.get_parameter_index(param)
+            time_index = TimeIndex(stream.get_times()).lookup(time, policy)
+            if np.ndim(time_index) == 0:
+                return stream.get_block(time_index)[2][:, parameter_index].tolist()
+            blocks = stream.get_blocks(time_index.tolist())
+            return np.stack([blocks[index][2][:, parameter_index] for index in time_index.tolist()])
+        final_element_data = self.get_store().get_element_values(time, param, policy)
+        if np.ndim(time) == 0:
+            return final_element_data.tolist()
+        return final_element_data.copy()
 
     def get_x_data(self, time):
         """ Get X Axis Data
@@ -391,6 +568,57 @@ class ResultTough3(object):
             print("coordinates can either be X, Y or Z")
         return direction_value_output
 
+    def get_grid(self):
+        """ Get the structured-grid index of the element coordinates, built once per version of the file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        grid : StructuredGrid
+            Unique x, y and z axes of the elements and their (i, j, k) positions
+
+        """
+        signature = ResultStore.file_signature(os.path.join(self.filelocation, self.filetitle))
+        if self._grid is None or self._grid_signature != signature:
+            self._grid = StructuredGrid(self.get_coord_data('x', 0), self.get_coord_data('y', 0),
+                                        self.get_coord_data('z', 0))
+            self._grid_signature = signature
+        return self._grid
+
+    def get_grid_data(self, param, timer, direction=None, layer_number=None, policy='nearest'):
+        """ Get data for the elements arranged on the structured grid
+
+        Parameters
+        -----------
+        param: string
+            Parameter to be derive data
+        timer : float or list[float] or np.ndarray
+            Time in which the data should be retrieved. Several times can be given at once.
+        direction : string
+            Direction normal to the layer. Can be 'X', 'Y', 'Z'. If None the whole grid is returned.
+        layer_number: int
+            Layer number in which to retrieve data, starting from 1 at the smallest coordinate
+        policy : string
+            How the output time is matched, 'nearest', 'floor', 'ceil' or 'exact'
+
+        Returns
+        --------
+        grid_data : np.ndarray
+            View of shape (..., z, y, x) or of a single layer of it
+
+        """
+        grid = self.get_grid()
+        if self.streaming:
+            element_data = np.asarray(self.get_element_data(timer, param, policy))
+        else:
+            element_data = self.get_store().get_element_values(timer, param, policy)
+        if direction is None:
+            return grid.reshape(element_data)
+        return grid.get_layer(element_data, direction, layer_number)
+
     def get_unique_x_data(self, timer):
         """ Get Unique X Axis Data
 
@@ -405,17 +633,7 @@ class ResultTough3(object):
             Unique data for the x axis.
 
         """
-        original_array = self.get_coord_data('x', timer)
-        indices_array = []
-        for i in range(0, len(original_array)):
-            try:
-                if original_array[i] > original_array[i + 1]:
-                    indices_array.append(i)
-                else:
-                    continue
-            except Exception:
-                pass
-        unique_x_output_data = original_array[0:indices_array[0] + 1]
+        unique_x_output_data = self.get_grid().first_x_row.tolist()
         return unique_x_output_data
 
     def get_x_start_points(self, timer):
@@ -432,17 +650,7 @@ class ResultTough3(object):
             X Axis Start Point Data.
 
         """
-        original_array = self.get_coord_data('x', timer)
-        indices_array = []
-        for i in range(0, len(original_array)):
-            try:
-                if original_array[i] > original_array[i + 1]:
-                    indices_array.append(i)
-                else:
-                    continue
-            except Exception:
-                pass
-        # output_data = ori_array[0:indices_array[0] + 1]
+        indices_array = self.get_grid().x_row_ends.tolist()
         return indices_array
 
     def get_unique_y_data(self, timer):
@@ -459,8 +667,7 @@ class ResultTough3(object):
             Unique data for the y axis.
 
         """
-        original_array = self.get_coord_data('y', timer)
-        unique_y_output_data = list(set(original_array))
+        unique_y_output_data = self.get_grid().get_axis('y').tolist()
         return unique_y_output_data
 
     def get_unique_z_data(self, timer):
@@ -477,8 +684,7 @@ class ResultTough3(object):
             Unique data for the z axis.
 
         """
-        original_array = self.get_coord_data('z', timer)
-        unique_z_output_data = list(set(original_array))
+        unique_z_output_data = self.get_grid().get_axis('z').tolist()
         return unique_z_output_data
 
     def get_number_of_layers(self, direction):
@@ -534,7 +740,7 @@ class ResultTough3(object):
         if layer_number < total_grid_in_z:
             end_index = x_start[layer_number - 1] + 1
         else:
-            end_index = 50
+            end_index = None
         z_layer_data_output = z_data[begin_index:end_index]
         return z_layer_data_output
 
@@ -559,10 +765,7 @@ class ResultTough3(object):
         element_data = self.get_element_data(timer, param)
         x_layers = self.get_number_of_layers('x')
         z_layers = self.get_number_of_layers('z')
-        x_depth_data_array = []
-        for i in range(0, z_layers):
-            x_depth_data_array.append(element_data[line_number - 1])
-            line_number = line_number + x_layers
+        x_depth_data_array = element_data[line_number - 1::x_layers][:z_layers]
         return x_depth_data_array
 
     def get_layer_data(self, direction, layer_number, timer, param):
@@ -681,8 +884,7 @@ class ResultTough3(object):
             List after indexes have been removed
 
         """
-        for index in sorted(indexes, reverse=True):
-            del input_list[index]
+        input_list = T2Utilities().del_index(input_list, indexes)
         return input_list
 
     def duplicate_index(self, sequence):
@@ -700,14 +902,5 @@ class ResultTough3(object):
             Output after indexes have been duplicated
 
         """
-        dicta = {}
-        indexes = []
-        duplicates = collections.defaultdict(list)
-        for i, e in enumerate(sequence):
-            duplicates[e].append(i)
-        for k, v in sorted(duplicates.items()):
-            if len(v) >= 2:
-                dicta[k] = v
-        for k, v in dicta.items():
-            indexes.append(v[1:])
-        return list(itertools.chain.from_iterable(indexes))
+        output = T2Utilities().duplicate_index(sequence)
+        return output
@@ -24,14 +24,22 @@ SOFTWARE.
 '''
 
 import os
+import numpy as np
 from pytoughreact.utilities.t2_utilities import T2Utilities
 from pytoughreact.utilities.t2_tough_react_utilities import T2UtilitiesToughReact
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.utilities.downsampling import get_downsampled_timeseries, LTTB
+from pytoughreact.results.result_sidecar import ResultSidecar
+from pytoughreact.results.result_follower import ResultFollower
+from pytoughreact.results.structured_grid import StructuredGrid
+from pytoughreact.results.result_tecplot_index import TecplotIndex
+from pytoughreact.results.time_axis import TimeAxis
 import t2listing
 
 
 class ResultReact(object):
     """ Class for processing results from TOUGHREACT """
-    def __init__(self, simulator_type, file_location, file_title):
+    def __init__(self, simulator_type, file_location, file_title, **kwargs):
         """Initialization of Parameters
 
         Parameters
@@ -43,6 +51,9 @@ class ResultReact(object):
             Location of results file on system
         file_title : string
             Title or name of the file. Example is 'kddconc.tec' or 'OUTPUT.csv'
+        kwargs: dict
+            1) use_sidecar (boolean) - read from the binary sidecar written by export() when it is
+               newer than the Tecplot file. Defaults to True.
 
 
         Returns
@@ -50,14 +61,67 @@ class ResultReact(object):
 
         """
         self.filelocation = file_location
-        os.chdir(self.filelocation)
         self.filetitle = file_title
         self.simulatortype = simulator_type
-        self.data = t2listing.toughreact_tecplot(self.filetitle, self.get_elements())
+        self.use_sidecar = kwargs.get('use_sidecar', True)
+        self._store = None
+        self._grid = None
+        self._grid_signature = None
+        self._data = None
+        self._zone_index = None
+        self._time_axis = None
+        self._elements = None
+        self._sidecar_checked = False
 
     def __repr__(self):
         return 'Results from ' + self.filelocation + ' in ' + self.filetitle + ' for ' + self.simulatortype
 
+    @property
+    def data(self):
+        """ t2listing.toughreact_tecplot object of the file, opened on first use """
+        if self._data is None:
+            self._data = t2listing.toughreact_tecplot(os.path.join(self.filelocation, self.filetitle),
+                                                      self.get_elements())
+        return self._data
+
+    def get_zone_index(self):
+        """ Byte-offset index of the zones of the Tecplot file, built on first open and persisted
+        next to the file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        zone_index : TecplotIndex
+            Opened zone index
+
+        """
+        if self._zone_index is None:
+            self._zone_index = TecplotIndex(os.path.join(self.filelocation, self.filetitle))
+        return self._zone_index.open()
+
+    def _get_sidecar_store(self):
+        """ Store opened from a fresh binary sidecar. The sidecar is only looked up on first use.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        store : ResultStore or None
+            Opened store, or None if there is no usable sidecar and the Tecplot file has not been parsed
+
+        """
+        if self._store is None and not self._sidecar_checked:
+            self._sidecar_checked = True
+            sidecar = ResultSidecar(os.path.join(self.filelocation, self.filetitle))
+            if self.use_sidecar and sidecar.is_fresh():
+                self._store = sidecar.load()
+        return self._store
+
     def get_parameters(self):
         """ Get Parameters from file
 
@@ -71,7 +135,89 @@ class ResultReact(object):
             Parameters returned as list
 
         """
-        return self.data.element.column_name
+        store = self._get_sidecar_store()
+        if store is not None:
+            return list(store.headers)
+        return list(self.get_zone_index().headers)
+
+    def get_store(self):
+        """ Get all output times of the Tecplot file as a NumPy-backed result store
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        store : ResultStore
+            (time x element x parameter) store of the file
+
+        """
+        if self._get_sidecar_store() is None:
+            zone_index = self.get_zone_index()
+            values = np.stack([zone_index.get_zone(time_index) for time_index in range(len(zone_index.times))])
+            elements = self.get_elements()
+            if values.shape[1] != len(elements):
+                raise ValueError('Specified block name list is the wrong length for TOUGHREACT Tecplot file ' +
+                                 zone_index.file_path)
+            self._store = ResultStore(zone_index.file_path, zone_index.times, elements, list(zone_index.headers),
+                                      0, values, zone_index.signature)
+        return self._store
+
+    def close(self):
+        """ Release the parsed results, the zone index and any open sidecar. The file is opened again on
+        the next query.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        if self._store is not None:
+            self._store.close()
+        self._store = None
+        self._grid = None
+        self._grid_signature = None
+        self._data = None
+        self._zone_index = None
+        self._time_axis = None
+        self._elements = None
+        self._sidecar_checked = False
+
+    def export(self, sidecar_path=None):
+        """ Convert the Tecplot output once into a binary sidecar that later readers open instead
+
+        Parameters
+        -----------
+        sidecar_path : string
+            Full path of the sidecar. Defaults to the result file name with '.npz' appended.
+
+        Returns
+        --------
+        sidecar_path : string
+            Full path of the written sidecar
+
+        """
+        file_path = os.path.join(self.filelocation, self.filetitle)
+        return ResultSidecar(file_path, sidecar_path).write(self.get_store())
+
+    def get_follower(self):
+        """ Get an incremental reader that returns only the time blocks appended by a running simulation
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        follower : ResultFollower
+            Follower of the result file
+
+        """
+        return ResultFollower(os.path.join(self.filelocation, self.filetitle), 'tecplot')
 
     def get_elements(self):
         """ Get elements from the simulation
@@ -86,12 +232,12 @@ class ResultReact(object):
             Elements present in the result file.
 
         """
-        find_connection = T2UtilitiesToughReact(self.filelocation, 'CONNE')
-        find_connection.find_word()
-        find_connection.slice_off_line()
-        find_connection.write_to_file()
-        with open('test.txt') as f:
-            grid_blocks = f.read().splitlines()
+        store = self._get_sidecar_store()
+        if store is not None:
+            return list(store.elements)
+        if self._elements is None:
+            self._elements = T2UtilitiesToughReact(self.filelocation, 'CONNE').get_elements()
+        grid_blocks = list(self._elements)
         return grid_blocks
 
     def get_times(self):
@@ -106,7 +252,11 @@ class ResultReact(object):
         unprocessed_time_data : list
             Time data directly from file without processing.
         """
-        time_data = self.data.times
+        store = self._get_sidecar_store()
+        if store is not None:
+            time_data = store.times
+        else:
+            time_data = self.get_zone_index().times
         unprocessed_time_data = list(time_data)
         value = T2Utilities()
         if len(unprocessed_time_data) > 15:
@@ -120,19 +270,41 @@ class ResultReact(object):
         Parameters
         -----------
         format_of_date : str
-            Provides information to the method on format of the date. For example. year, hour, min or seconds
+            Provides information to the method on format of the date. For example. year, hour, min or seconds.
+            A number is taken as the length of the unit in seconds.
 
         Returns
         --------
         processed_time_data  : list
-            List of converted time
+            List of converted time, reduced like get_times so that it matches get_timeseries_data
 
         """
-        get_times = self.get_times()
-        utility_class = T2Utilities()
-        processed_time_data = utility_class.convert_times(get_times, format_of_date)
+        processed_time_data = self.get_time_axis().convert(format_of_date).tolist()
+        if len(processed_time_data) > 15:
+            processed_time_data = T2Utilities().chop_list(processed_time_data, 15)
         return processed_time_data
 
+    def get_time_axis(self):
+        """ Get all output times with their conversions to other units, computed once per version of the file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        time_axis : TimeAxis
+            Time axis of the results
+
+        """
+        store = self._get_sidecar_store()
+        if store is not None:
+            return store.get_time_axis()
+        times = self.get_zone_index().times
+        if self._time_axis is None or self._time_axis.seconds is not times:
+            self._time_axis = TimeAxis(times)
+        return self._time_axis
+
     def get_timeseries_data(self, param, grid_block_number):
         """ Get Time series data
 
@@ -149,34 +321,86 @@ class ResultReact(object):
             Time series data for particular parameter.
 
         """
-        os.chdir(self.filelocation)
-        grid = self.get_elements()[grid_block_number]
-        mf = self.data.history([(grid, param)])
-        final_timeseries_data = mf[1]
-        final_timeseries_data = list(final_timeseries_data)
+        final_timeseries_data = list(self.get_store().get_column(param)[:, grid_block_number])
         value = T2Utilities()
         if len(final_timeseries_data) > 15:
             final_timeseries_data = value.chop_list(final_timeseries_data, 15)
             return final_timeseries_data
         return final_timeseries_data
 
-    def get_element_data(self, time, param):
+    def get_downsampled_timeseries(self, param, grid_block_number, max_points, method=LTTB):
+        """ Get a time series reduced to a number of points that keeps its shape, e.g. for plotting long runs
+
+        Parameters
+        -----------
+        param: string
+            Parameter to be derive data
+        grid_block_number :  int
+            The grid block number for which to retrieve the results
+        max_points : int
+            Largest number of points to keep
+        method : string
+            'lttb' for Largest-Triangle-Three-Buckets or 'minmax' for the extremes of each bucket
+
+        Returns
+        --------
+        times, values : np.ndarray, np.ndarray
+            Kept output times in seconds and the parameter values at those times
+
+        """
+        return get_downsampled_timeseries(self.get_store(), param, grid_block_number, max_points, method)
+
+    def get_timeseries_batch(self, elements, params, as_dataframe=False):
+        """ Get time series of several parameters for several grid blocks in one pass over the zones
+
+        Parameters
+        -----------
+        elements : list[int or string]
+            Grid block numbers or names
+        params : list[string]
+            Parameters to be derived from data
+        as_dataframe : boolean
+            Return a table indexed by (time, element) instead of an array
+
+        Returns
+        --------
+        timeseries_data : np.ndarray or pd.Dataframe
+            Array of shape (time, element, parameter) or the equivalent table
+
+        """
+        store = self.get_store()
+        timeseries_data = store.get_timeseries_batch(elements, params)
+        if as_dataframe:
+            return ResultStore.batch_to_dataframe(store.times, elements, params, timeseries_data)
+        return timeseries_data
+
+    def get_element_data(self, time, param, policy='nearest'):
         """ Get Data for elements
 
         Parameters
         -----------
-        time : float
-            Time in which the data should be retrieved.
+        time : float or list[float] or np.ndarray
+            Time in which the data should be retrieved. Several times can be given at once.
         param: string
             Parameter to be derive data
+        policy : string
+            How the output time is matched, 'nearest', 'floor', 'ceil' or 'exact'
 
         Returns
         --------
-        final_element_data : list
-            Data for each of the elements.
+        final_element_data : np.ndarray
+            Data for each of the elements. For several times a (time x element) array is returned.
         """
-        self.data.set_time(time)
-        final_element_data = self.data.element[param]
+        store = self._get_sidecar_store()
+        if store is not None:
+            return store.get_element_values(time, param, policy).copy()
+        zone_index = self.get_zone_index()
+        parameter_index = zone_index.get_parameter_index(param)
+        time_index = zone_index.get_time_index().lookup(time, policy)
+        if np.ndim(time_index) == 0:
+            return zone_index.get_zone(time_index)[:, parameter_index]
+        zones = {index: zone_index.get_zone(index)[:, parameter_index] for index in set(time_index.tolist())}
+        final_element_data = np.stack([zones[index] for index in time_index.tolist()])
         return final_element_data
 
     def get_x_data(self, time):
@@ -227,6 +451,54 @@ class ResultReact(object):
         """
         return self.get_element_data(time, 'Z(m)')
 
+    def get_grid(self):
+        """ Get the structured-grid index of the element coordinates, built once per version of the file
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        grid : StructuredGrid
+            Unique x, y and z axes of the elements and their (i, j, k) positions
+
+        """
+        signature = ResultStore.file_signature(os.path.join(self.filelocation, self.filetitle))
+        if self._grid is None or self._grid_signature != signature:
+            self._grid = StructuredGrid(self.get_coord_data('x', 0), self.get_coord_data('y', 0),
+                                        self.get_coord_data('z', 0))
+            self._grid_signature = signature
+        return self._grid
+
+    def get_grid_data(self, param, timer, direction=None, layer_number=None, policy='nearest'):
+        """ Get data for the elements arranged on the structured grid
+
+        Parameters
+        -----------
+        param: string
+            Parameter to be derive data
+        timer : float or list[float] or np.ndarray
+            Time in which the data should be retrieved. Several times can be given at once.
+        direction : string
+            Direction normal to the layer. Can be 'X', 'Y', 'Z'. If None the whole grid is returned.
+        layer_number: int
+            Layer number in which to retrieve data, starting from 1 at the smallest coordinate
+        policy : string
+            How the output time is matched, 'nearest', 'floor', 'ceil' or 'exact'
+
+        Returns
+        --------
+        grid_data : np.ndarray
+            View of shape (..., z, y, x) or of a single layer of it
+
+        """
+        grid = self.get_grid()
+        element_data = np.asarray(self.get_element_data(timer, param, policy))
+        if direction is None:
+            return grid.reshape(element_data)
+        return grid.get_layer(element_data, direction, layer_number)
+
     def get_unique_x_data(self, timer):
         """ Get Unique X Axis Data
 
@@ -241,20 +513,7 @@ class ResultReact(object):
             Unique data for the x axis.
 
         """
-        original_array = self.get_coord_data('x', timer)
-        indices_array = []
-        for i in range(0, len(original_array)):
-            try:
-                if original_array[i] > original_array[i + 1]:
-                    indices_array.append(i)
-                else:
-                    continue
-            except Exception:
-                pass
-        if len(indices_array) > 0:
-            unique_x_output_data = original_array[0:indices_array[0] + 1]
-        else:
-            unique_x_output_data = original_array
+        unique_x_output_data = self.get_grid().first_x_row.tolist()
         return unique_x_output_data
 
     def get_x_start_points(self, timer):
@@ -271,16 +530,7 @@ class ResultReact(object):
             X Axis Start Point Data.
 
         """
-        original_array = self.get_coord_data('x', timer)
-        indices_array = []
-        for i in range(0, len(original_array)):
-            try:
-                if original_array[i] > original_array[i + 1]:
-                    indices_array.append(i)
-                else:
-                    continue
-            except Exception:
-                pass
+        indices_array = self.get_grid().x_row_ends.tolist()
         return indices_array
 
     def get_unique_y_data(self, timer):
@@ -297,8 +547,7 @@ class ResultReact(object):
             Unique data for the y axis.
 
         """
-        original_array = self.get_coord_data('y', timer)
-        output = list(set(original_array))
+        output = self.get_grid().get_axis('y').tolist()
         return output
 
     def get_unique_z_data(self, timer):
@@ -315,8 +564,7 @@ class ResultReact(object):
             Unique data for the z axis.
 
         """
-        ori_array = self.get_coord_data('z', timer)
-        output = list(set(ori_array))
+        output = self.get_grid().get_axis('z').tolist()
         return output
 
     def get_number_of_layers(self, direction):
@@ -372,7 +620,7 @@ class ResultReact(object):
         if layer_number < total_grid_in_z:
             end_index = x_start[layer_number - 1] + 1
         else:
-            end_index = 50
+            end_index = None
         z_layer_data_output = z_data[begin_index:end_index]
         return z_layer_data_output
 
@@ -397,10 +645,7 @@ class ResultReact(object):
         element_data = self.get_element_data(timer, param)
         x_layers = self.get_number_of_layers('x')
         z_layers = self.get_number_of_layers('z')
-        x_depth_data_array = []
-        for i in range(0, z_layers):
-            x_depth_data_array.append(element_data[line_number - 1])
-            line_number = line_number + x_layers
+        x_depth_data_array = element_data[line_number - 1::x_layers][:z_layers]
         return x_depth_data_array
 
     def get_layer_data(self, direction, layer_number, timer, param):
@@ -26,6 +26,34 @@ SOFTWARE.
 import numpy as np
 import os
 import pandas as pd
+from functools import lru_cache
+from pytoughreact.results.result_store import ResultStore
+
+RMSE = 'RMSE'
+NRMSE = 'NRMSE'
+LOG_RMSE = 'LOG_RMSE'
+MEAN_LOG_RESIDUAL = 'MEAN_LOG_RESIDUAL'
+
+
+@lru_cache(maxsize=32)
+def _read_data_table(file_path, signature):
+    """ Parse an experimental data file. Results are cached by path and (mtime, size) signature, so
+    every Experiment opened on an unchanged file shares a single parse.
+
+    Parameters
+    -----------
+    file_path : string
+        Full path to the file
+    signature : tuple
+        Signature of the file used as part of the cache key
+
+    Returns
+    --------
+    data_table : pd.Dataframe
+        Parsed file
+
+    """
+    return pd.read_csv(file_path)
 
 
 class Experiment(object):
@@ -45,9 +73,24 @@ class Experiment(object):
 
         """
         self.filelocation = filelocation
-        os.chdir(self.filelocation)
         self.filetitle = filetitle
 
+    def _get_data_table(self):
+        """ Cached parse of the file, shared with other readers of the same file until it changes on disk
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        data_table : pd.Dataframe
+            Parsed file. It must not be modified.
+
+        """
+        file_path = os.path.join(self.filelocation, self.filetitle)
+        return _read_data_table(file_path, ResultStore.file_signature(file_path))
+
     def read_file(self):
         """ Read file specified in file_location and file_title
 
@@ -61,8 +104,7 @@ class Experiment(object):
             Dataframe with requested output
 
         """
-        os.chdir(self.filelocation)
-        data_table = pd.read_csv(self.filetitle)
+        data_table = self._get_data_table().copy()
         return data_table
 
     def get_column_names(self):
@@ -78,8 +120,7 @@ class Experiment(object):
             column names in file
 
         """
-        df = self.read_file()
-        column_names = df.columns
+        column_names = self._get_data_table().columns
         return column_names
 
     def get_times(self):
@@ -91,14 +132,10 @@ class Experiment(object):
 
         Returns
         --------
-        unprocessed_time_data : list
+        unprocessed_time_data : np.ndarray
             Time data directly from file without processing.
         """
-        df = self.read_file()
-        unprocessed_time_data = df['Time']
-        unprocessed_time_data = list(unprocessed_time_data)
-        unprocessed_time_data = unprocessed_time_data[1:]
-        unprocessed_time_data = np.array(unprocessed_time_data, float)
+        unprocessed_time_data = self._get_data_table()['Time'].to_numpy()[1:].astype(float)
         return unprocessed_time_data
 
     def get_timeseries_data(self, param):
@@ -111,13 +148,225 @@ class Experiment(object):
 
         Returns
         --------
-        final_timeseries_data : list
+        final_timeseries_data : np.ndarray
             Time series data for particular parameter.
 
         """
-        df = self.read_file()
-        final_timeseries_data = df[param]
-        final_timeseries_data = list(final_timeseries_data)
-        final_timeseries_data = final_timeseries_data[1:]
-        final_timeseries_data = np.array(final_timeseries_data, float)
+        final_timeseries_data = self._get_data_table()[param].to_numpy()[1:].astype(float)
         return final_timeseries_data
+
+    def get_data_array(self, params):
+        """ Observations of several parameters in one array. As for get_timeseries_data, the first row
+        below the heading (units) is skipped.
+
+        Parameters
+        -----------
+        params: list[string]
+            Parameters to be derived from data
+
+        Returns
+        --------
+        data_array : np.ndarray
+            Array of shape (time, parameter)
+
+        """
+        data_array = self._get_data_table()[list(params)].to_numpy()[1:].astype(float)
+        return data_array
+
+    @staticmethod
+    def interpolate_columns(source_times, source_values, times):
+        """ Linear interpolation of many columns sampled at the same times, sharing a single search of the
+        interval of each requested time. Requested times outside the sampled range give NaN.
+
+        Parameters
+        -----------
+        source_times : np.ndarray
+            Sample times of shape (sample)
+        source_values : np.ndarray
+            Samples of shape (sample, column). Missing samples (NaN) are skipped for their column only.
+        times : np.ndarray
+            Times of shape (time) at which the columns are needed
+
+        Returns
+        --------
+        values : np.ndarray
+            Array of shape (time, column)
+
+        """
+        source_times = np.asarray(source_times, dtype=np.float64)
+        source_values = np.asarray(source_values, dtype=np.float64)
+        times = np.asarray(times, dtype=np.float64)
+        order = np.argsort(source_times, kind='stable')
+        source_times = source_times[order]
+        source_values = source_values[order]
+        values = np.full((len(times), source_values.shape[1]), np.nan)
+        if len(source_times) == 0:
+            return values
+        inside = (times >= source_times[0]) & (times <= source_times[-1])
+        upper = np.clip(np.searchsorted(source_times, times[inside]), 1, max(len(source_times) - 1, 1))
+        lower = upper - 1
+        if len(source_times) == 1:
+            upper = lower
+        interval = source_times[upper] - source_times[lower]
+        weight = np.divide(times[inside] - source_times[lower], interval, out=np.zeros(len(lower)),
+                           where=interval > 0)[:, np.newaxis]
+        values[inside] = source_values[lower] * (1 - weight) + source_values[upper] * weight
+        missing_columns = np.flatnonzero(np.isnan(source_values).any(axis=0))
+        for column in missing_columns:
+            valid = ~np.isnan(source_values[:, column])
+            column_values = np.full(len(times), np.nan)
+            if valid.any():
+                valid_times = source_times[valid]
+                column_inside = (times >= valid_times[0]) & (times <= valid_times[-1])
+                column_values[column_inside] = np.interp(times[column_inside], valid_times,
+                                                         source_values[valid, column])
+            values[:, column] = column_values
+        return values
+
+    def interpolate_to(self, times, params):
+        """ Observations interpolated onto another time axis, e.g. the converted times of a simulation
+
+        Parameters
+        -----------
+        times : list[float] or np.ndarray
+            Target times, in the same unit as the 'Time' column of the file
+        params: list[string]
+            Parameters to be derived from data
+
+        Returns
+        --------
+        values : np.ndarray
+            Array of shape (time, parameter) with NaN outside the observed time range
+
+        """
+        values = self.interpolate_columns(self.get_times(), self.get_data_array(params), times)
+        return values
+
+    def get_residuals(self, times, simulated, params, log=False):
+        """ Simulated minus observed values at the observation times, for all parameters at once
+
+        Parameters
+        -----------
+        times : list[float] or np.ndarray
+            Times of the simulated values, in the same unit as the 'Time' column of the file
+        simulated : np.ndarray
+            Simulated values of shape (time, parameter), e.g. from ResultTough3.get_timeseries_batch
+        params: list[string]
+            Parameters of the simulated columns, as named in the file
+        log : boolean
+            Return log10(simulated) - log10(observed) instead. Pairs that are not both positive give NaN.
+
+        Returns
+        --------
+        residuals : np.ndarray
+            Array of shape (observation, parameter) with NaN where the simulation does not cover the
+            observation time
+
+        """
+        observed = self.get_data_array(params)
+        return self._compare(self._simulated_at_observations(times, simulated, params), observed, log)
+
+    def _simulated_at_observations(self, times, simulated, params):
+        """ Simulated values interpolated to the observation times
+
+        Parameters
+        -----------
+        times : list[float] or np.ndarray
+            Times of the simulated values, in the same unit as the 'Time' column of the file
+        simulated : np.ndarray
+            Simulated values of shape (time, parameter)
+        params: list[string]
+            Parameters of the simulated columns, as named in the file
+
+        Returns
+        --------
+        simulated_at_observations : np.ndarray
+            Array of shape (observation, parameter) with NaN outside the simulated times
+
+        """
+        simulated = np.asarray(simulated, dtype=np.float64).reshape(len(times), len(params))
+        return self.interpolate_columns(times, simulated, self.get_times())
+
+    @staticmethod
+    def _compare(simulated_at_observations, observed, log=False):
+        """ Residuals of simulated values that are already at the observation times
+
+        Parameters
+        -----------
+        simulated_at_observations : np.ndarray
+            Array of shape (observation, parameter)
+        observed : np.ndarray
+            Observations of the same shape
+        log : boolean
+            Return log10(simulated) - log10(observed) instead. Pairs that are not both positive give NaN.
+
+        Returns
+        --------
+        residuals : np.ndarray
+            Array of shape (observation, parameter)
+
+        """
+        if not log:
+            return simulated_at_observations - observed
+        positive = (simulated_at_observations > 0) & (observed > 0)
+        residuals = np.full(observed.shape, np.nan)
+        residuals[positive] = np.log10(simulated_at_observations[positive]) - np.log10(observed[positive])
+        return residuals
+
+    @staticmethod
+    def _root_mean_square(residuals):
+        """ Root mean square of each column, ignoring NaN
+
+        Parameters
+        -----------
+        residuals : np.ndarray
+            Array of shape (observation, parameter)
+
+        Returns
+        --------
+        root_mean_square : np.ndarray
+            Array of shape (parameter), NaN for a column without values
+
+        """
+        valid = ~np.isnan(residuals)
+        count = valid.sum(axis=0)
+        square_sum = np.where(valid, residuals, 0) ** 2
+        return np.sqrt(np.divide(square_sum.sum(axis=0), count, out=np.full(len(count), np.nan), where=count > 0))
+
+    def get_misfit(self, times, simulated, params):
+        """ Misfit metrics of a simulation against the observations, one row per parameter
+
+        Parameters
+        -----------
+        times : list[float] or np.ndarray
+            Times of the simulated values, in the same unit as the 'Time' column of the file
+        simulated : np.ndarray
+            Simulated values of shape (time, parameter)
+        params: list[string]
+            Parameters of the simulated columns, as named in the file
+
+        Returns
+        --------
+        misfit : pd.Dataframe
+            Table indexed by parameter with 'RMSE', 'NRMSE' (RMSE over the observed range), 'LOG_RMSE'
+            and 'MEAN_LOG_RESIDUAL' columns. Observations without a simulated value are left out.
+
+        """
+        observed = self.get_data_array(params)
+        simulated_at_observations = self._simulated_at_observations(times, simulated, params)
+        residuals = self._compare(simulated_at_observations, observed)
+        log_residuals = self._compare(simulated_at_observations, observed, log=True)
+        valid = ~np.isnan(residuals)
+        rmse = self._root_mean_square(residuals)
+        observed_range = np.max(np.where(valid, observed, -np.inf), axis=0, initial=-np.inf) - \
+            np.min(np.where(valid, observed, np.inf), axis=0, initial=np.inf)
+        nrmse = np.divide(rmse, observed_range, out=np.full(len(rmse), np.nan),
+                          where=np.isfinite(observed_range) & (observed_range > 0))
+        log_rmse = self._root_mean_square(log_residuals)
+        log_valid = ~np.isnan(log_residuals)
+        log_count = log_valid.sum(axis=0)
+        mean_log_residual = np.divide(np.where(log_valid, log_residuals, 0).sum(axis=0), log_count,
+                                      out=np.full(len(log_count), np.nan), where=log_count > 0)
+        misfit = pd.DataFrame({RMSE: rmse, NRMSE: nrmse, LOG_RMSE: log_rmse,
+                               MEAN_LOG_RESIDUAL: mean_log_residual}, index=pd.Index(list(params), name='PARAMETER'))
+        return misfit
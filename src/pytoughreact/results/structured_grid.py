@@ -0,0 +1,296 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import numpy as np
+
+DIRECTIONS = ['x', 'y', 'z']
+
+
+class StructuredGrid(object):
+    """ One-time index of the grid structure behind the element coordinates of a result file """
+    def __init__(self, x, y, z):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        x :  np.ndarray
+            X coordinate of each element in file order
+        y :  np.ndarray
+            Y coordinate of each element in file order
+        z :  np.ndarray
+            Z coordinate of each element in file order
+
+        Returns
+        --------
+
+        """
+        self.coordinates = np.column_stack([np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64),
+                                            np.asarray(z, dtype=np.float64)])
+        self.axes = []
+        indices = []
+        for direction_index in range(3):
+            axis, inverse = np.unique(self.coordinates[:, direction_index], return_inverse=True)
+            self.axes.append(axis)
+            indices.append(inverse.reshape(-1))
+        self.indices = np.column_stack(indices)
+        self.x_axis, self.y_axis, self.z_axis = self.axes
+        self.shape = (len(self.z_axis), len(self.y_axis), len(self.x_axis))
+        x_values = self.coordinates[:, 0]
+        self.x_row_ends = np.flatnonzero(x_values[:-1] > x_values[1:])
+        if len(self.x_row_ends) > 0:
+            self.first_x_row = x_values[:self.x_row_ends[0] + 1].copy()
+        else:
+            self.first_x_row = x_values.copy()
+        self.first_x_row.flags.writeable = False
+        self._layout = self._find_layout()
+        self._plane_positions = {}
+
+    def __repr__(self):
+        return 'Structured grid of ' + str(len(self.coordinates)) + ' elements with shape (z, y, x) ' + \
+            str(self.shape)
+
+    def _find_layout(self):
+        """ Order in which the file walks the x, y and z axes, if the elements form a full structured grid
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+        layout : tuple
+            (axis order from slowest to fastest, ascending flag of each axis) or None
+
+        """
+        number_of_elements = len(self.coordinates)
+        counts = [len(axis) for axis in self.axes]
+        if number_of_elements == 0 or int(np.prod(counts)) != number_of_elements:
+            return None
+        strides = []
+        for direction_index in range(3):
+            changes = np.flatnonzero(self.indices[:, direction_index] != self.indices[0, direction_index])
+            strides.append(changes[0] if len(changes) > 0 else number_of_elements)
+        order = sorted(range(3), key=lambda direction_index: -strides[direction_index])
+        ascending = [self.indices[0, direction_index] == 0 for direction_index in range(3)]
+        file_shape = tuple(counts[direction_index] for direction_index in order)
+        for position, direction_index in enumerate(order):
+            expected = np.arange(counts[direction_index])
+            if not ascending[direction_index]:
+                expected = expected[::-1]
+            broadcast_shape = [1, 1, 1]
+            broadcast_shape[position] = counts[direction_index]
+            actual = self.indices[:, direction_index].reshape(file_shape)
+            if not np.array_equal(actual, np.broadcast_to(expected.reshape(broadcast_shape), file_shape)):
+                return None
+        return order, ascending
+
+    @property
+    def is_structured(self):
+        """ True if every (x, y, z) combination of the unique axes appears exactly once in file order """
+        return self._layout is not None
+
+    def get_direction_index(self, direction):
+        """ Position of a direction in the coordinates
+
+        Parameters
+        -----------
+        direction : string
+            Direction. Can be 'X', 'Y', 'Z'
+
+        Returns
+        --------
+        direction_index : int
+            0 for x, 1 for y and 2 for z
+
+        """
+        if direction.lower() not in DIRECTIONS:
+            raise ValueError("coordinates can either be X, Y or Z")
+        return DIRECTIONS.index(direction.lower())
+
+    def get_axis(self, direction):
+        """ Sorted unique coordinates along a direction
+
+        Parameters
+        -----------
+        direction : string
+            Direction. Can be 'X', 'Y', 'Z'
+
+        Returns
+        --------
+        axis : np.ndarray
+            Unique coordinates
+
+        """
+        return self.axes[self.get_direction_index(direction)]
+
+    def reshape(self, values):
+        """ View of element values as a (z, y, x) array with each axis in ascending coordinate order
+
+        Parameters
+        -----------
+        values :  np.ndarray
+            Values with the elements along the last axis. Leading axes (e.g. time) are kept.
+
+        Returns
+        --------
+        grid_values : np.ndarray
+            View of shape (..., z, y, x)
+
+        """
+        if not self.is_structured:
+            raise ValueError('The elements do not form a structured grid')
+        values = np.asarray(values)
+        order, ascending = self._layout
+        leading = values.shape[:-1]
+        file_shape = tuple(len(self.axes[direction_index]) for direction_index in order)
+        grid_values = values.reshape(leading + file_shape)
+        leading_axes = list(range(len(leading)))
+        grid_axes = [len(leading) + order.index(direction_index) for direction_index in [2, 1, 0]]
+        grid_values = grid_values.transpose(leading_axes + grid_axes)
+        flips = [slice(None)] * len(leading)
+        for direction_index in [2, 1, 0]:
+            flips.append(slice(None) if ascending[direction_index] else slice(None, None, -1))
+        return grid_values[tuple(flips)]
+
+    def get_layer(self, values, direction, layer_number):
+        """ View of the element values on one layer of the grid
+
+        Parameters
+        -----------
+        values :  np.ndarray
+            Values with the elements along the last axis
+        direction : string
+            Direction normal to the layer. Can be 'X', 'Y', 'Z'
+        layer_number : int
+            Layer number, starting from 1 at the smallest coordinate
+
+        Returns
+        --------
+        layer_values : np.ndarray
+            View of shape (..., y, x) for a z layer, (..., z, x) for a y layer or (..., z, y) for an x layer
+
+        """
+        direction_index = self.get_direction_index(direction)
+        if layer_number < 1 or layer_number > len(self.axes[direction_index]):
+            raise ValueError("The specified layer is more than the number of layers in the model")
+        grid_values = self.reshape(values)
+        selection = [Ellipsis, slice(None), slice(None), slice(None)]
+        selection[3 - direction_index] = layer_number - 1
+        return grid_values[tuple(selection)]
+
+    def get_plane_positions(self, horizontal, vertical):
+        """ Cell of each element on the plane of two directions, if every cell of the plane holds exactly
+        one element (e.g. an X-Z section of a 2D model, with the elements in any order)
+
+        Parameters
+        -----------
+        horizontal : string
+            Direction along the columns of the plane. Can be 'X', 'Y', 'Z'
+        vertical : string
+            Direction along the rows of the plane. Can be 'X', 'Y', 'Z'
+
+        Returns
+        --------
+        positions : np.ndarray
+            Flat (row x column) position of each element, or None if the elements do not fill the plane once
+
+        """
+        key = (self.get_direction_index(horizontal), self.get_direction_index(vertical))
+        if key not in self._plane_positions:
+            column_count = len(self.axes[key[0]])
+            cell_count = column_count * len(self.axes[key[1]])
+            positions = self.indices[:, key[1]] * column_count + self.indices[:, key[0]]
+            if cell_count != len(positions) or np.any(np.bincount(positions, minlength=cell_count) != 1):
+                positions = None
+            self._plane_positions[key] = positions
+        return self._plane_positions[key]
+
+    def get_plane(self, values, horizontal, vertical):
+        """ Element values laid out on the plane of two directions
+
+        Parameters
+        -----------
+        values :  np.ndarray
+            Value of each element in file order
+        horizontal : string
+            Direction along the columns of the plane. Can be 'X', 'Y', 'Z'
+        vertical : string
+            Direction along the rows of the plane. Can be 'X', 'Y', 'Z'
+
+        Returns
+        --------
+        plane_values : np.ndarray
+            Array of shape (vertical, horizontal) with both axes in ascending coordinate order, or None if
+            the elements do not fill the plane once
+
+        """
+        positions = self.get_plane_positions(horizontal, vertical)
+        if positions is None:
+            return None
+        values = np.asarray(values)
+        plane_values = np.empty(len(positions), dtype=values.dtype)
+        plane_values[positions] = values
+        return plane_values.reshape(len(self.get_axis(vertical)), len(self.get_axis(horizontal)))
+
+    def get_element_index(self, i, j, k):
+        """ Position in the file of the element at grid indices (i, j, k)
+
+        Parameters
+        -----------
+        i, j, k : int
+            Indices along x, y and z, starting from 0 at the smallest coordinate
+
+        Returns
+        --------
+        element_index : int
+            Row of the element in each time block
+
+        """
+        return int(self.reshape(np.arange(len(self.coordinates)))[k, j, i])
+
+    def get_grid_indices(self, x, y, z):
+        """ Grid indices of a coordinate
+
+        Parameters
+        -----------
+        x, y, z : float
+            Coordinate of the element
+
+        Returns
+        --------
+        i, j, k : int
+            Indices along x, y and z
+
+        """
+        grid_indices = []
+        for direction_index, value in enumerate([x, y, z]):
+            axis = self.axes[direction_index]
+            position = min(int(np.searchsorted(axis, value)), len(axis) - 1)
+            if position > 0 and abs(axis[position - 1] - value) <= abs(axis[position] - value):
+                position = position - 1
+            if not np.isclose(axis[position], value):
+                raise ValueError(str(value) + ' is not a ' + DIRECTIONS[direction_index] + ' coordinate of the grid')
+            grid_indices.append(position)
+        return tuple(grid_indices)
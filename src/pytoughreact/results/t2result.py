@@ -44,6 +44,7 @@ class T2Result(object):
             Title or name of the file. Example is 'kddconc.tec' or 'OUTPUT.csv'
         kwargs: dict
             1) generation (string) - if generation data exists in the results.
+            Other keyword arguments (e.g. use_sidecar, streaming or usecols) are passed to the reader.
 
 
         Returns
@@ -55,14 +56,25 @@ class T2Result(object):
             self.filelocation = os.getcwd()
         else:
             self.filelocation = filelocation
-        os.chdir(self.filelocation)
         self.filetitle = filetitle
         self.simulatortype = simulatortype
         self.generation = kwargs.get('generation')
         self.file_as_list = []
+        self.reader_options = kwargs
+        self._reader = None
+
+    def __repr__(self):
+        return 'Results from ' + self.filelocation + ' in ' + self.filetitle + ' for ' + self.simulatortype
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def read_file(self):
-        """ Read file specified in file_location and file_title
+        """ Read file specified in file_location and file_title. The reader is created on first use and
+        kept, so its parsed results are shared by every later query.
 
         Parameters
         -----------
@@ -74,13 +86,31 @@ class T2Result(object):
             Resulting class for further processing
 
         """
-        if self.simulatortype.lower() == "tmvoc" or self.simulatortype.lower() == "tough3":
-            resulting_class = ResultTough3(self.simulatortype, self.filelocation, self.filetitle,
-                                           generation=self.generation)
-        else:
-            resulting_class = ResultReact(self.simulatortype, self.filelocation, self.filetitle)
+        if self._reader is None:
+            if self.simulatortype.lower() == "tmvoc" or self.simulatortype.lower() == "tough3":
+                self._reader = ResultTough3(self.simulatortype, self.filelocation, self.filetitle,
+                                            **self.reader_options)
+            else:
+                self._reader = ResultReact(self.simulatortype, self.filelocation, self.filetitle,
+                                           **self.reader_options)
+        resulting_class = self._reader
         return resulting_class
 
+    def close(self):
+        """ Release the reader and its parsed results. A later query opens the file again.
+
+        Parameters
+        -----------
+
+
+        Returns
+        --------
+
+        """
+        if self._reader is not None:
+            self._reader.close()
+        self._reader = None
+
     def get_times(self, format_of_date='year'):
         """ Get times stored for duration of the simulation
 
@@ -0,0 +1,89 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import numpy as np
+from pytoughreact.utilities.time_units import get_unit_seconds
+
+
+class TimeAxis(object):
+    """ Output times of a result with their conversions to other units, each computed once """
+    def __init__(self, times):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        times :  list[float] or np.ndarray
+            Output times in seconds
+
+        Returns
+        --------
+
+        """
+        self.seconds = np.asarray(times, dtype=np.float64)
+        self._converted = {}
+
+    def __repr__(self):
+        return 'Time axis of ' + str(len(self.seconds)) + ' times'
+
+    def __len__(self):
+        return len(self.seconds)
+
+    @staticmethod
+    def get_unit_seconds(unit):
+        """ Length of a time unit in seconds
+
+        Parameters
+        -----------
+        unit : string or float
+            'year', 'day', 'hour', 'minute' or 'second', or the length of a custom unit in seconds
+
+        Returns
+        --------
+        unit_seconds : float
+            Number of seconds in one unit
+
+        """
+        return get_unit_seconds(unit)
+
+    def convert(self, unit):
+        """ Output times in another unit
+
+        Parameters
+        -----------
+        unit : string or float
+            'year', 'day', 'hour', 'minute' or 'second', or the length of a custom unit in seconds
+
+        Returns
+        --------
+        converted_times : np.ndarray
+            Read-only array of the times in the requested unit, shared between calls
+
+        """
+        unit_seconds = self.get_unit_seconds(unit)
+        if unit_seconds not in self._converted:
+            converted_times = self.seconds / unit_seconds
+            converted_times.flags.writeable = False
+            self._converted[unit_seconds] = converted_times
+        return self._converted[unit_seconds]
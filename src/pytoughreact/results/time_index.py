@@ -0,0 +1,106 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import numpy as np
+
+NEAREST = 'nearest'
+FLOOR = 'floor'
+CEIL = 'ceil'
+EXACT = 'exact'
+TIME_POLICIES = [NEAREST, FLOOR, CEIL, EXACT]
+
+
+class TimeIndex(object):
+    """ Sorted index of output times answering time lookups with numpy.searchsorted """
+    def __init__(self, times):
+        """Initialization of Parameters
+
+        Parameters
+        -----------
+        times :  np.ndarray
+            Output times in seconds, in file order
+
+        Returns
+        --------
+
+        """
+        self.times = np.asarray(times, dtype=np.float64)
+        if len(self.times) == 0:
+            raise ValueError('Time index needs at least one output time')
+        self._order = np.argsort(self.times, kind='stable')
+        self._sorted_times = self.times[self._order]
+
+    def __repr__(self):
+        return 'Time index of ' + str(len(self.times)) + ' output times'
+
+    def __len__(self):
+        return len(self.times)
+
+    def lookup(self, time, policy=NEAREST, tolerance=0.0):
+        """ Position of the output time matching each requested time
+
+        Parameters
+        -----------
+        time : float or list[float] or np.ndarray
+            Requested time(s) in seconds
+        policy : string
+            'nearest' - closest output time, clamped to the first and last output times
+            'floor' - last output time at or before the requested time
+            'ceil' - first output time at or after the requested time
+            'exact' - output time equal to the requested time within tolerance
+        tolerance : float
+            Absolute tolerance used by the 'exact' policy
+
+        Returns
+        --------
+        time_index : int or np.ndarray
+            Index into the times in file order. An array is returned for an array of requested times.
+
+        """
+        if policy not in TIME_POLICIES:
+            raise ValueError('policy can either be nearest, floor, ceil or exact')
+        query = np.asarray(time, dtype=np.float64)
+        sorted_times = self._sorted_times
+        last = len(sorted_times) - 1
+        if policy == FLOOR:
+            position = np.searchsorted(sorted_times, query, side='right') - 1
+            if np.any(position < 0):
+                raise ValueError('No output time at or before ' + str(np.min(query)))
+        elif policy == CEIL:
+            position = np.searchsorted(sorted_times, query, side='left')
+            if np.any(position > last):
+                raise ValueError('No output time at or after ' + str(np.max(query)))
+        else:
+            right = np.clip(np.searchsorted(sorted_times, query, side='left'), 0, last)
+            left = np.searchsorted(sorted_times, sorted_times[np.clip(right - 1, 0, last)], side='left')
+            use_left = np.abs(query - sorted_times[left]) <= np.abs(sorted_times[right] - query)
+            position = np.where(use_left, left, right)
+            position = np.where(query <= sorted_times[0], 0, np.where(query >= sorted_times[last], last, position))
+            if policy == EXACT and np.any(np.abs(sorted_times[position] - query) > tolerance):
+                raise ValueError('Requested time is not an output time')
+        time_index = self._order[position]
+        if np.ndim(time_index) == 0:
+            return int(time_index)
+        return time_index
@@ -0,0 +1,168 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+import numpy as np
+
+LTTB = 'lttb'
+MIN_MAX = 'minmax'
+DOWNSAMPLING_METHODS = [LTTB, MIN_MAX]
+
+
+def lttb_indices(x, y, max_points):
+    """ Indices kept by Largest-Triangle-Three-Buckets downsampling
+
+    Parameters
+    -----------
+    x :  np.ndarray
+        Sorted x values, e.g. times
+    y : np.ndarray
+        Values of the series
+    max_points : int
+        Number of points to keep. The first and last points are always kept.
+
+    Returns
+    --------
+    indices : np.ndarray
+        Increasing indices of the kept points
+
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    number_of_points = len(x)
+    if max_points >= number_of_points or max_points < 3:
+        return np.arange(number_of_points)
+    bucket_size = (number_of_points - 2) / (max_points - 2)
+    bounds = np.floor(np.arange(max_points - 1) * bucket_size).astype(np.intp) + 1
+    bounds[-1] = number_of_points - 1
+    bounds = np.append(bounds, number_of_points)
+    bucket_lengths = np.diff(bounds)
+    mean_x = np.add.reduceat(x, bounds[:-1]) / bucket_lengths
+    mean_y = np.add.reduceat(y, bounds[:-1]) / bucket_lengths
+    indices = np.empty(max_points, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = number_of_points - 1
+    selected = 0
+    for bucket in range(max_points - 2):
+        start = bounds[bucket]
+        end = bounds[bucket + 1]
+        areas = np.abs((x[selected] - mean_x[bucket + 1]) * (y[start:end] - y[selected]) -
+                       (x[selected] - x[start:end]) * (mean_y[bucket + 1] - y[selected]))
+        selected = start + int(np.argmax(areas))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def min_max_indices(x, y, max_points):
+    """ Indices of the smallest and largest value of each bucket, so that no peak is lost
+
+    Parameters
+    -----------
+    x :  np.ndarray
+        Sorted x values, e.g. times
+    y : np.ndarray
+        Values of the series
+    max_points : int
+        Largest number of points to keep. The first and last points are always kept.
+
+    Returns
+    --------
+    indices : np.ndarray
+        Increasing indices of the kept points
+
+    """
+    y = np.asarray(y, dtype=np.float64)
+    number_of_points = len(y)
+    number_of_buckets = (max_points - 2) // 2
+    if max_points >= number_of_points or number_of_buckets < 1:
+        return np.arange(number_of_points)
+    inner = y[1:-1]
+    bucket_size = -(-len(inner) // number_of_buckets)
+    padded = np.full(bucket_size * number_of_buckets, np.nan)
+    padded[:len(inner)] = inner
+    buckets = padded.reshape(number_of_buckets, bucket_size)
+    filled = ~np.all(np.isnan(buckets), axis=1)
+    offsets = np.arange(number_of_buckets)[filled] * bucket_size + 1
+    minimum = np.nanargmin(buckets[filled], axis=1) + offsets
+    maximum = np.nanargmax(buckets[filled], axis=1) + offsets
+    return np.unique(np.concatenate([[0], minimum, maximum, [number_of_points - 1]]))
+
+
+def downsample(x, y, max_points, method=LTTB):
+    """ Reduce a series to at most max_points points, keeping x and y aligned
+
+    Parameters
+    -----------
+    x :  list[float] or np.ndarray
+        Sorted x values, e.g. times
+    y : list[float] or np.ndarray
+        Values of the series
+    max_points : int
+        Largest number of points to keep
+    method : string
+        'lttb' for Largest-Triangle-Three-Buckets or 'minmax' for the extremes of each bucket
+
+    Returns
+    --------
+    x, y : np.ndarray, np.ndarray
+        The kept points. The same indices are applied to both arrays.
+
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) != len(y):
+        raise ValueError('x and y should have the same length')
+    if method == LTTB:
+        indices = lttb_indices(x, y, max_points)
+    elif method == MIN_MAX:
+        indices = min_max_indices(x, y, max_points)
+    else:
+        raise ValueError('method can either be ' + ' or '.join(DOWNSAMPLING_METHODS))
+    return x[indices], y[indices]
+
+
+def get_downsampled_timeseries(store, param, element, max_points, method=LTTB):
+    """ Time series of one element of a result store, reduced to a number of points that keeps its shape
+
+    Parameters
+    -----------
+    store :  ResultStore
+        Parsed results
+    param : string
+        Parameter to be derived from data
+    element : int or string
+        Grid block number or name
+    max_points : int
+        Largest number of points to keep
+    method : string
+        'lttb' for Largest-Triangle-Three-Buckets or 'minmax' for the extremes of each bucket
+
+    Returns
+    --------
+    times, values : np.ndarray, np.ndarray
+        Kept output times in seconds and the parameter values at those times
+
+    """
+    element_index = store.get_element_indices([element])[0]
+    return downsample(store.times, store.get_column(param)[:, element_index], max_points, method)
@@ -26,6 +26,10 @@ SOFTWARE.
 import os
 import shutil
 import itertools
+import threading
+
+_ELEMENT_CACHE = {}
+_ELEMENT_CACHE_LOCK = threading.Lock()
 
 
 class T2UtilitiesToughReact(object):
@@ -109,7 +113,7 @@ class T2UtilitiesToughReact(object):
 
         """
         # find the position of a word
-        with open(self.file2) as my_file:
+        with open(os.path.join(self.location, self.file2)) as my_file:
             for num, line in enumerate(my_file, 1):
                 if self.word in line:
                     point1 = num
@@ -130,17 +134,17 @@ class T2UtilitiesToughReact(object):
         """
 
         #        os.remove("test2.txt")
-        f = open("test2.txt", "w+")
+        f = open(os.path.join(self.location, "test2.txt"), "w+")
         f.close()
-        f = open("test.txt", "w+")
+        f = open(os.path.join(self.location, "test.txt"), "w+")
         f.close()
-        f = open('test2.txt', 'r+')
+        f = open(os.path.join(self.location, 'test2.txt'), 'r+')
         f.truncate(0)
         f.close()
-        os.remove("test.txt")
+        os.remove(os.path.join(self.location, "test.txt"))
         point1 = self.find_word()
-        with open("test2.txt", "w") as f1:
-            with open(self.file2, "r") as text_file:
+        with open(os.path.join(self.location, "test2.txt"), "w") as f1:
+            with open(os.path.join(self.location, self.file2), "r") as text_file:
                 for line in itertools.islice(text_file, 1, point1 - 2):
                     f1.write(line)
         f1.close()
@@ -162,7 +166,7 @@ class T2UtilitiesToughReact(object):
 
         """
         self.slice_off_file()
-        with open('test2.txt') as thefile:
+        with open(os.path.join(self.location, 'test2.txt')) as thefile:
             lines = thefile.readlines()
             output = []
             for i in range(0, len(lines)):
@@ -187,7 +191,42 @@ class T2UtilitiesToughReact(object):
 
         """
         mesh = self.slice_off_line()
-        with open("test.txt", "w") as f1:
+        with open(os.path.join(self.location, "test.txt"), "w") as f1:
             for item in mesh:
                 f1.write("%s\n" % item)
         f1.close()
+
+    def get_elements(self):
+        """ Element names of the MESH file, read in memory without writing test.txt or test2.txt.
+        Each MESH file is parsed once per process; it is read again only if it changes on disk.
+
+        Parameters
+        -----------
+
+        Returns
+        --------
+        output : list
+            list of grids
+
+        """
+        mesh_path = os.path.abspath(os.path.join(self.location, self.file2))
+        stat_result = os.stat(mesh_path)
+        key = (mesh_path, self.word)
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        with _ELEMENT_CACHE_LOCK:
+            cached = _ELEMENT_CACHE.get(key)
+        if cached is not None and cached[0] == signature:
+            return list(cached[1])
+        with open(mesh_path) as mesh_file:
+            lines = mesh_file.read().splitlines()
+        point = None
+        for number, line in enumerate(lines, 1):
+            if self.word in line:
+                point = number
+                break
+        if point is None:
+            raise ValueError(self.word + ' was not found in ' + mesh_path)
+        output = [line[0:5] for line in lines[1:point - 2]]
+        with _ELEMENT_CACHE_LOCK:
+            _ELEMENT_CACHE[key] = (signature, tuple(output))
+        return output
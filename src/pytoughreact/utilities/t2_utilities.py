@@ -24,6 +24,7 @@ SOFTWARE.
 '''
 
 import numpy as np
+from pytoughreact.utilities.time_units import get_unit_seconds
 
 
 class T2Utilities(object):
@@ -37,33 +38,17 @@ class T2Utilities(object):
         -----------
         arraylist :  list
             Array of the time to be converted
-        format_of_date : str
-            Provides information to the method on format of the date. For example. year, hour, min or seconds
+        format_of_date : str or float
+            Provides information to the method on format of the date. For example. year, hour, min or seconds.
+            A number is taken as the length of the unit in seconds.
 
         Returns
         --------
         processed_time_data : list
             Time data after conversion
         """
-        processing_data_array = arraylist
-        processed_time_data = []
-        if format_of_date.lower() == 'year':
-            for i in range(len(processing_data_array)):
-                processed_time_data.append(processing_data_array[i] / 3.154e+7)
-        elif format_of_date.lower() == 'day':
-            for i in range(len(processing_data_array)):
-                processed_time_data.append(processing_data_array[i] / 86400)
-        elif format_of_date.lower() == 'hour':
-            for i in range(len(processing_data_array)):
-                processed_time_data.append(processing_data_array[i] / 3600)
-        elif format_of_date.lower() == 'minute':
-            for i in range(len(processing_data_array)):
-                processed_time_data.append(processing_data_array[i] / 60)
-        elif format_of_date.lower() == 'second':
-            for i in range(len(processing_data_array)):
-                processed_time_data.append(processing_data_array[i])
-        else:
-            raise ValueError("format can either be year, day, hour, minute or second")
+        unit_seconds = get_unit_seconds(format_of_date)
+        processed_time_data = (np.asarray(arraylist, dtype=np.float64) / unit_seconds).tolist()
         return processed_time_data
 
     def chop_list(self, input_list, step_increase=3):
@@ -81,13 +66,12 @@ class T2Utilities(object):
         final_processed_list : list
             List data after reduction
         """
-        global final_processed_list
-        if isinstance(input_list, list):
-            if len(input_list) > 100:
-                input_list = input_list[0:len(input_list):step_increase]
-                self.chop_list(input_list)
-            else:
-                final_processed_list = input_list[0:len(input_list):step_increase]
+        if not isinstance(input_list, list):
+            return input_list
+        while len(input_list) > 100:
+            input_list = input_list[0:len(input_list):step_increase]
+            step_increase = 3
+        final_processed_list = input_list[0:len(input_list):step_increase]
         return final_processed_list
 
     def trim_data_points(self, time_data, result_data, slice_value):
@@ -108,10 +92,10 @@ class T2Utilities(object):
             List data after trimming
 
         """
-        for i in range(len(time_data) - 1, 0, -1):
-            if time_data[i] > slice_value:
-                del time_data[i]
-                del result_data[i]
+        keep = np.asarray(time_data, dtype=np.float64) <= slice_value
+        keep[:1] = True
+        time_data[:] = self.select_items(time_data, keep)
+        result_data[:] = self.select_items(result_data, keep)
         return time_data, result_data
 
     def remove_repetiting(self, time_list, value_list):
@@ -130,18 +114,76 @@ class T2Utilities(object):
             List data after removing repetiting values
 
         """
-        final_time_list = []
-        final_value_list = []
-        for i in range(0, len(time_list)):
-            if time_list[i] not in final_time_list:
-                final_time_list.append(time_list[i])
-                final_value_list.append(value_list[i])
-        for i in range(len(final_time_list) - 1, 0, -1):
-            if final_time_list[i] - final_time_list[i - 1] < 1:
-                del final_time_list[i]
-                del final_value_list[i]
+        times = np.asarray(time_list)
+        first_indices = np.sort(np.unique(times, return_index=True)[1])
+        unique_times = times[first_indices]
+        keep = np.ones(len(first_indices), dtype=bool)
+        keep[1:] = ~(np.diff(unique_times) < 1)
+        kept_indices = first_indices[keep]
+        final_time_list = unique_times[keep].tolist()
+        final_value_list = self.select_items(value_list, kept_indices)
         return final_time_list, final_value_list
 
+    def select_items(self, input_list, selection):
+        """ Pick items of a list with a boolean mask or an index array
+
+        Parameters
+        -----------
+        input_list :  list
+            List to pick from
+        selection :  np.ndarray
+            Boolean mask with one entry per item, or indices of the items to keep
+
+        Returns
+        --------
+        selected_list : list
+            Picked items in their original order
+
+        """
+        selected_list = np.asarray(input_list)[selection].tolist()
+        return selected_list
+
+    def duplicate_index(self, sequence):
+        """ Indices of the repeated occurrences of each value, grouped by increasing value
+
+        Parameters
+        -----------
+        sequence: list
+            list containing data
+
+        Returns
+        --------
+        output : list
+            Index of every occurrence of a value after its first one
+
+        """
+        order = np.argsort(np.asarray(sequence), kind='stable')
+        sorted_values = np.asarray(sequence)[order]
+        repeated = np.zeros(len(order), dtype=bool)
+        repeated[1:] = sorted_values[1:] == sorted_values[:-1]
+        return order[repeated].tolist()
+
+    def del_index(self, input_list, indexes):
+        """ Delete items of a list in place
+
+        Parameters
+        -----------
+        input_list: list
+            Input list to remove indexes
+        indexes: list
+            indexes for which to remove data
+
+        Returns
+        --------
+        input_list : list
+            List after indexes have been removed
+
+        """
+        keep = np.ones(len(input_list), dtype=bool)
+        keep[np.asarray(indexes, dtype=np.intp)] = False
+        input_list[:] = [item for item, kept in zip(input_list, keep) if kept]
+        return input_list
+
     def param_label_full(self, param):
         """ Get Full Names of TOUGHREACT and TMVIO parameters to be embedded in graphs
 
@@ -0,0 +1,51 @@
+'''
+MIT License
+
+Copyright (c) [2022] [Temitope Ajayi]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+'''
+
+UNIT_SECONDS = {'year': 3.154e+7, 'day': 86400.0, 'hour': 3600.0, 'minute': 60.0, 'second': 1.0}
+
+
+def get_unit_seconds(unit):
+    """ Length of a time unit in seconds
+
+    Parameters
+    -----------
+    unit : string or float
+        'year', 'day', 'hour', 'minute' or 'second', or the length of a custom unit in seconds
+
+    Returns
+    --------
+    unit_seconds : float
+        Number of seconds in one unit
+
+    """
+    if isinstance(unit, str):
+        try:
+            return UNIT_SECONDS[unit.lower()]
+        except KeyError:
+            raise ValueError("format can either be year, day, hour, minute or second")
+    unit_seconds = float(unit)
+    if unit_seconds <= 0:
+        raise ValueError('The length of a time unit should be positive')
+    return unit_seconds
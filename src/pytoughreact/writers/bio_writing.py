@@ -328,11 +328,7 @@ class T2Bio(t2data):
 
         """
 
-        if runlocation:
-            os.chdir(os.path.dirname(os.path.realpath(__file__)))
-            print(os.path.dirname(os.path.realpath(__file__)))
-            # newPath = shutil.copy('tmvoc.exe', runlocation)
-            os.chdir(runlocation)
+        root_dir = os.path.abspath(runlocation or os.curdir)
         if self.filename:
             datbase, ext = splitext(self.filename)
             if (self.type == 'AUTOUGH2'):
@@ -342,7 +338,7 @@ class T2Bio(t2data):
                     incon_filename = datbase + '.incon'
                 savebase, ext = splitext(save_filename)
                 inconbase, ext = splitext(incon_filename)
-                runfilename = datbase + '_' + basename(simulator) + '.in'
+                runfilename = os.path.join(root_dir, datbase + '_' + basename(simulator) + '.in')
                 open(runfilename, 'w').write('\n'.join([savebase, inconbase, datbase]))
                 infile = open(runfilename, 'r')
                 cmd = [simulator]
@@ -351,16 +347,14 @@ class T2Bio(t2data):
                 else:
                     outfile = None
                 # run AUTOUGH2:
-                call(cmd, stdin=infile, stdout=outfile)
+                call(cmd, stdin=infile, stdout=outfile, cwd=root_dir)
                 infile.close()
                 remove(runfilename)
             else:  # run TOUGH2 (need to specify simulator executable name)
-                if runlocation:
-                    os.chdir(runlocation)
                 # if os.path.exists("GENER"): os.remove("GENER")
                 # if os.path.exists("OUTPUT_ELEME.csv"): os.remove("OUTPUT_ELEME.csv")
                 cmd = [simulator]
-                infile = open(self.filename, 'r')
+                infile = open(os.path.join(root_dir, self.filename), 'r')
                 if silent:
                     outfile = None
                 else:
@@ -369,8 +363,8 @@ class T2Bio(t2data):
                         outfilename = datbase + '.out'
                     else:
                         outfilename = output_filename
-                    outfile = open(outfilename, 'w')
-                call(cmd, stdin=infile, stdout=outfile)
+                    outfile = open(os.path.join(root_dir, outfilename), 'w')
+                call(cmd, stdin=infile, stdout=outfile, cwd=root_dir)
 
     def read_rocktypes(self, infile):
         """ Reads grid rock types
@@ -910,11 +904,10 @@ class T2Bio(t2data):
         if runlocation:
             if not os.path.isdir(runlocation):
                 os.mkdir(runlocation)
-            os.chdir(runlocation)
         if filename:
             self.filename = filename
         mode = 'r' if sys.version_info > (3,) else 'rU'
-        infile = T2BioParser(self.filename, mode, read_function=self.read_function)
+        infile = T2BioParser(os.path.join(runlocation, self.filename), mode, read_function=self.read_function)
         self.read_title(infile)
         self._sections = []
         more = True
@@ -946,7 +939,8 @@ class T2Bio(t2data):
             self.meshfilename = meshfilename
             if isinstance(meshfilename, str):
                 mode = 'r' if sys.version_info > (3,) else 'rU'
-                meshfile = T2BioParser(self.meshfilename, mode, read_function=self.read_function)
+                meshfile = T2BioParser(os.path.join(runlocation, self.meshfilename), mode,
+                                       read_function=self.read_function)
                 self.read_meshfile(meshfile)
                 meshfile.close()
             elif isinstance(meshfilename, (list, tuple)):
@@ -989,7 +983,6 @@ class T2Bio(t2data):
         if run_location:
             if not os.path.isdir(run_location):
                 os.mkdir(run_location)
-            os.chdir(run_location)
         if filename:
             self.filename = filename
         if self.filename == '':
@@ -1000,7 +993,7 @@ class T2Bio(t2data):
             self.meshfilename = meshfilename
         if self.meshfilename:
             if isinstance(self.meshfilename, str):
-                meshfile = T2BioParser(self.meshfilename, 'w')
+                meshfile = T2BioParser(os.path.join(run_location, self.meshfilename), 'w')
                 self.write_blocks(meshfile)
                 self.write_connections(meshfile)
                 meshfile.close()
@@ -1011,7 +1004,7 @@ class T2Bio(t2data):
                     mesh_sections = ['ELEME', 'CONNE']
         if self.type == 'AUTOUGH2':
             self.write_extra_precision(extra_precision, echo_extra_precision)
-        outfile = T2BioParser(self.filename, 'w')
+        outfile = T2BioParser(os.path.join(run_location, self.filename), 'w')
         self.write_title(outfile)
         for keyword in self._sections:
             if (keyword not in mesh_sections) and \
@@ -2055,12 +2055,11 @@ class T2Chemical(t2data):
         if runlocation:
             if not os.path.isdir(runlocation):
                 os.mkdir(runlocation)
-            os.chdir(runlocation)
         if filename == '':
             filename = 'chemical.inp'
         self.update_sections()
         self.update_read_write_functions()
-        outfile = T2ChemicalData(filename, 'w')
+        outfile = T2ChemicalData(os.path.join(runlocation, filename), 'w')
         for keyword in self._sections:
             self.write_fn[keyword](outfile)
             outfile.write('\n')
@@ -2137,11 +2136,10 @@ class T2Chemical(t2data):
         if runlocation:
             if not os.path.isdir(runlocation):
                 os.mkdir(runlocation)
-            os.chdir(runlocation)
         if filename:
             self.filename = filename
         mode = 'r' if sys.version_info > (3,) else 'rU'
-        infile = T2ChemicalData(self.filename, mode, read_function=self.read_function)
+        infile = T2ChemicalData(os.path.join(runlocation, self.filename), mode, read_function=self.read_function)
         self.read_title(infile)
         self._sections = []
         self.update_read_write_functions()
@@ -57,12 +57,10 @@ class T2ReactParser(fixed_format_file):
         self.specification = specification
         self.read_function = read_function
         self.preprocess_specification()
-        print(os.getcwd())
         if location is None:
             self.file = open(filename, mode)
         else:
-            os.chdir(location)
-            self.file = open(filename, mode)
+            self.file = open(os.path.join(location, filename), mode)
 
 
 class T2ExtraPrecisionDataParser(fixed_format_file):
@@ -435,12 +433,10 @@ class T2React(t2data):
 
         """
         if runlocation:
-            os.chdir(os.path.dirname(os.path.realpath(__file__)))
-            os.chdir(runlocation)
             self.check_for_thermodynamic_database(runlocation, t2solute)
             self.check_for_executable(simulator, runlocation)
         if self.filename:
-            root_dir = os.path.abspath(os.curdir)
+            root_dir = os.path.abspath(runlocation or os.curdir)
             self.check_for_executable(simulator, root_dir)
             self.check_for_thermodynamic_database(root_dir, t2solute)
             datbase, ext = splitext(self.filename)
@@ -451,7 +447,7 @@ class T2React(t2data):
                     incon_filename = datbase + '.incon'
                 savebase, ext = splitext(save_filename)
                 inconbase, ext = splitext(incon_filename)
-                runfilename = datbase + '_' + basename(simulator) + '.in'
+                runfilename = os.path.join(root_dir, datbase + '_' + basename(simulator) + '.in')
                 open(runfilename, 'w').write('\n'.join([savebase, inconbase, datbase]))
                 infile = open(runfilename, 'r')
                 cmd = [simulator]
@@ -460,18 +456,16 @@ class T2React(t2data):
                 else:
                     outfile = None
                 # run AUTOUGH2:
-                call(cmd, stdin=infile, stdout=outfile)
+                call(cmd, stdin=infile, stdout=outfile, cwd=root_dir)
                 infile.close()
                 remove(runfilename)
             else:  # run TOUGH2 (need to specify simulator executable name)
-                if runlocation:
-                    os.chdir(runlocation)
-                if os.path.exists("GENER"):
-                    os.remove("GENER")
-                if os.path.exists("OUTPUT_ELEME.csv"):
-                    os.remove("OUTPUT_ELEME.csv")
+                if os.path.exists(os.path.join(root_dir, "GENER")):
+                    os.remove(os.path.join(root_dir, "GENER"))
+                if os.path.exists(os.path.join(root_dir, "OUTPUT_ELEME.csv")):
+                    os.remove(os.path.join(root_dir, "OUTPUT_ELEME.csv"))
                 cmd = [simulator]
-                infile = open(self.filename, 'r')
+                infile = open(os.path.join(root_dir, self.filename), 'r')
                 if silent:
                     outfile = None
                 else:
@@ -480,9 +474,9 @@ class T2React(t2data):
                         outfilename = datbase + '.out'
                     else:
                         outfilename = output_filename
-                    outfile = open(outfilename, 'w')
+                    outfile = open(os.path.join(root_dir, outfilename), 'w')
                 # p = Popen(os.path.join(current_dir,">treacteos1<flow.inp"),cwd=current_dir)
-                status = call(cmd, stdin=infile, stdout=outfile)
+                status = call(cmd, stdin=infile, stdout=outfile, cwd=root_dir)
                 print(status)
                 outfile.close()
                 infile.close()
@@ -612,7 +606,8 @@ class T2React(t2data):
             self.meshfilename = meshfilename
             if isinstance(meshfilename, str):
                 mode = 'r' if sys.version_info > (3,) else 'rU'
-                meshfile = T2ReactParser(self.meshfilename, mode, read_function=self.read_function)
+                meshfile = T2ReactParser(self.meshfilename, mode, read_function=self.read_function,
+                                         location=file_location)
                 self.read_meshfile(meshfile)
                 meshfile.close()
             elif isinstance(meshfilename, (list, tuple)):
@@ -653,7 +648,6 @@ class T2React(t2data):
         if runlocation:
             if not os.path.isdir(runlocation):
                 os.mkdir(runlocation)
-            os.chdir(runlocation)
         if filename:
             self.filename = filename
         if self.filename == '':
@@ -664,7 +658,7 @@ class T2React(t2data):
             self.meshfilename = meshfilename
         if self.meshfilename:
             if isinstance(self.meshfilename, str):
-                meshfile = T2ReactParser(self.meshfilename, 'w')
+                meshfile = T2ReactParser(self.meshfilename, 'w', location=runlocation)
                 self.write_blocks(meshfile)
                 self.write_connections(meshfile)
                 meshfile.close()
@@ -675,7 +669,7 @@ class T2React(t2data):
                     mesh_sections = ['ELEME', 'CONNE']
         if self.type == 'AUTOUGH2':
             self.write_extra_precision(extra_precision, echo_extra_precision)
-        outfile = T2ReactParser(self.filename, 'w')
+        outfile = T2ReactParser(self.filename, 'w', location=runlocation)
         self.write_title(outfile)
         for keyword in self._sections:
             if (keyword not in mesh_sections) and ((keyword not in self.extra_precision) or
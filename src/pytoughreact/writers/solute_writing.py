@@ -1504,12 +1504,11 @@ class T2Solute(t2data):
         if runlocation:
             if not os.path.isdir(runlocation):
                 os.mkdir(runlocation)
-            os.chdir(runlocation)
         if filename == '':
             filename = 'solute.inp'
         self.update_sections()
         self.update_read_write_functions()
-        outfile = T2SoluteParser(filename, 'w')
+        outfile = T2SoluteParser(os.path.join(runlocation, filename), 'w')
         for keyword in self._sections:
             self.write_fn[keyword](outfile)
             outfile.write('\n')
@@ -1540,11 +1539,10 @@ class T2Solute(t2data):
         if runlocation:
             if not os.path.isdir(runlocation):
                 os.mkdir(runlocation)
-            os.chdir(runlocation)
         if filename:
             self.filename = filename
         mode = 'r' if sys.version_info > (3,) else 'rU'
-        infile = T2SoluteParser(self.filename, mode, read_function=self.read_function)
+        infile = T2SoluteParser(os.path.join(runlocation, self.filename), mode, read_function=self.read_function)
         self.read_title(infile)
         self._sections = []
         self.update_read_write_functions()
@@ -0,0 +1,50 @@
+import os
+
+
+def write_element_output(directory, x, z, times=(0.0,), y=None, headers=('PRES',), values=None, units=None,
+                         file_name='OUTPUT_ELEME.csv'):
+    """ Write a synthetic TOUGH3 element output with one row per element and time
+
+    Parameters
+    -----------
+    directory :  str
+        Directory of the file
+    x, z : list[float]
+        Coordinates of each element
+    times : list[float]
+        Output times in seconds
+    y : list[float]
+        Y coordinates of each element. Defaults to 0.0.
+    headers : list[str]
+        Parameters written after the coordinates
+    values : callable
+        values(time_index, element_number) returns the parameter values of a row. Defaults to a single
+        pressure of 1e5 + time + x - z.
+    units : list[str]
+        Units of the parameters, written in a line below the headings if given
+    file_name : str
+        Name of the file
+
+    Returns
+    --------
+    file_path : str
+        Full path of the written file
+
+    """
+    if y is None:
+        y = [0.0] * len(x)
+    if values is None:
+        def values(time_index, number):
+            return [1e5 + times[time_index] + x[number] - z[number]]
+    file_path = os.path.join(directory, file_name)
+    with open(file_path, 'w') as result_file:
+        result_file.write('"ELEM","X","Y","Z",' + ','.join('"' + header + '"' for header in headers) + '\n')
+        if units is not None:
+            result_file.write('"","(M)","(M)","(M)",' + ','.join('"' + unit + '"' for unit in units) + '\n')
+        for time_index, time in enumerate(times):
+            result_file.write('"TIME [sec]  ' + str(time) + '"\n')
+            for number in range(len(x)):
+                result_file.write('"A' + str(number).zfill(4) + '",' + str(x[number]) + ',' + str(y[number]) + ',' +
+                                  str(z[number]) + ',' + ','.join(str(value) for value in values(time_index, number)) +
+                                  '\n')
+    return file_path
@@ -0,0 +1,68 @@
+import os
+import shutil
+import pytest
+import matplotlib.pyplot as plt
+from pytoughreact.plotting.batch_renderer import BatchRenderer, PlotJob, TIME_PLOT, PARAM_PLOT
+from pytoughreact.results.result_tough_react import ResultReact
+from test.result_writers import write_element_output
+
+
+def copy_runs(tmp_path, count):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    runs = []
+    for run_number in range(count):
+        run_path = os.path.join(str(tmp_path), 'run' + str(run_number))
+        os.mkdir(run_path)
+        for file_name in ['kdd_conc.tec', 'flow.inp', 'MESH']:
+            shutil.copy(os.path.join(file_path, file_name), run_path)
+        runs.append(run_path)
+    return runs
+
+
+def test_split_jobs_groups_runs():
+    renderer = BatchRenderer('toughreact', 'kdd_conc.tec')
+    jobs = [PlotJob(TIME_PLOT, 'pH', file_location=location) for location in ['a', 'b', 'a', 'a', 'b']]
+    assert renderer.split_jobs(jobs, 1) == [('a', [0, 2, 3]), ('b', [1, 4])]
+    assert renderer.split_jobs(jobs, 4) == [('a', [0, 2]), ('a', [3]), ('b', [1]), ('b', [4])]
+
+
+def test_serial_render_parses_each_run_once(tmp_path, mocker):
+    runs = copy_runs(tmp_path, 2)
+    spy = mocker.spy(ResultReact, '__init__')
+    close_spy = mocker.spy(ResultReact, 'close')
+    jobs = [PlotJob(TIME_PLOT, 'pH', 0, format_of_date='day'), PlotJob(PARAM_PLOT, ['pH', 't_ca+2'], 0)]
+    open_figures = plt.get_fignums()
+    file_paths = BatchRenderer('toughreact', 'kdd_conc.tec', dpi=20, executor='serial').render(jobs, runs)
+    assert spy.call_count == 2
+    assert close_spy.call_count == 2
+    assert plt.get_fignums() == open_figures
+    assert len(file_paths) == 4
+    assert file_paths[0] == [os.path.join(runs[0], 'time pH block 0.png')]
+    assert file_paths[3] == [os.path.join(runs[1], 'param pH t_ca+2 block 0.png')]
+    assert all(os.path.isfile(paths[0]) for paths in file_paths)
+
+
+def test_process_render(tmp_path):
+    runs = copy_runs(tmp_path, 2)
+    jobs = [PlotJob(TIME_PLOT, 'pH', 0, file_location=run) for run in runs]
+    file_paths = BatchRenderer('toughreact', 'kdd_conc.tec', max_workers=2, dpi=20).render(jobs)
+    assert file_paths == [[os.path.join(run, 'time pH block 0.png')] for run in runs]
+    assert all(os.path.isfile(paths[0]) for paths in file_paths)
+
+
+def test_jobs_of_one_run_get_their_own_images(tmp_path):
+    times = [0.0, 86400.0, 172800.0]
+    write_element_output(str(tmp_path), [0.0, 1.0], [-1.0, -1.0], times,
+                         values=lambda time_index, element: [1e5 + times[time_index] + element])
+    runs = [str(tmp_path)]
+    jobs = [PlotJob(TIME_PLOT, 'PRES', 0), PlotJob(TIME_PLOT, 'PRES', 1)]
+    file_paths = BatchRenderer('tmvoc', 'OUTPUT_ELEME.csv', max_workers=2, dpi=20).render(jobs, runs)
+    assert file_paths == [[os.path.join(runs[0], 'time PRES block 0.png')],
+                          [os.path.join(runs[0], 'time PRES block 1.png')]]
+    assert all(os.path.isfile(paths[0]) for paths in file_paths)
+    jobs = [PlotJob(TIME_PLOT, 'PRES', 0), PlotJob(TIME_PLOT, 'PRES', 0, format_of_date='day')]
+    with pytest.raises(ValueError):
+        BatchRenderer('tmvoc', 'OUTPUT_ELEME.csv', executor='serial').render(jobs, runs)
+    jobs[1].output_name = 'PRES in days'
+    file_paths = BatchRenderer('tmvoc', 'OUTPUT_ELEME.csv', dpi=20, executor='serial').render(jobs, runs)
+    assert file_paths[1] == [os.path.join(runs[0], 'PRES in days.png')]
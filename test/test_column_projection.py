@@ -0,0 +1,57 @@
+import os
+import numpy as np
+import pytest
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.results.result_tough_3 import ResultTough3
+
+
+def test_projected_store_matches_full_parse():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    full_store = ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    store = ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv'), ['flow_g', 'X', 'FLOW_G'])
+    assert store.parameters == ['FLOW_G', 'X']
+    assert store.values.shape == (22, 85, 2)
+    assert store.elements == full_store.elements
+    assert np.array_equal(store.times, full_store.times)
+    assert np.array_equal(store.get_column('FLOW_G'), full_store.get_column('FLOW_G'))
+    assert np.array_equal(store.get_column('X'), full_store.get_column('X'))
+    with pytest.raises(ValueError):
+        store.get_column('FLOW_L')
+
+
+def test_projected_store_without_fixed_width_rows(tmp_path):
+    file_path = os.path.join(str(tmp_path), 'OUTPUT_ELEME.csv')
+    with open(file_path, 'w') as result_file:
+        result_file.write('"ELEM","X","PRES","SAT_G"\n')
+        result_file.write('"","(M)","(PA)",""\n')
+        for time in [0.0, 10.0]:
+            result_file.write('"TIME [sec]  ' + str(time) + '"\n')
+            result_file.write('"  A1",0.5,' + str(100000.0 + time) + ',0.25\n')
+            result_file.write('"  A2",1.5,1e5,0.5\n')
+    full_store = ResultStore.from_file(file_path)
+    store = ResultStore.from_file(file_path, ['SAT_G', 'PRES'])
+    assert store.elements == full_store.elements
+    assert np.array_equal(store.values, full_store.values[:, :, [2, 1]])
+
+
+def test_reader_with_usecols(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv', usecols=['X', 'Y', 'Z', 'FLOW_G'],
+                           use_sidecar=False)
+    full_results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv', use_sidecar=False)
+    assert results.get_timeseries_data('FLOW_G', 3) == full_results.get_timeseries_data('FLOW_G', 3)
+    assert results.get_layer_data('X', 1, 200, 'FLOW_G') == full_results.get_layer_data('X', 1, 200, 'FLOW_G')
+    sidecar_path = results.export(os.path.join(str(tmp_path), 'OUTPUT_CONNE.csv.npz'))
+    with np.load(sidecar_path) as archive:
+        assert len(archive['headers']) == len(full_results.get_store().headers)
+
+
+def test_projected_store_without_final_new_line(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    with open(os.path.join(file_path, 'OUTPUT_CONNE.csv'), 'rb') as result_file:
+        content = result_file.read().rstrip(b'\r\n')
+    with open(os.path.join(str(tmp_path), 'OUTPUT_CONNE.csv'), 'wb') as result_file:
+        result_file.write(content)
+    full_store = ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    store = ResultStore.from_file(os.path.join(str(tmp_path), 'OUTPUT_CONNE.csv'), ['FLOW_G'])
+    assert np.array_equal(store.get_column('FLOW_G'), full_store.get_column('FLOW_G'))
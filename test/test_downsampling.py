@@ -0,0 +1,66 @@
+import os
+import numpy as np
+import pytest
+from pytoughreact.utilities.downsampling import downsample, lttb_indices, min_max_indices, get_downsampled_timeseries
+from pytoughreact.utilities.t2_utilities import T2Utilities
+from pytoughreact.results.result_tough_react import ResultReact
+from pytoughreact.results.result_store import ResultStore
+
+
+def test_lttb_keeps_ends_and_spikes():
+    times = np.linspace(0.0, 1.0e6, 100001)
+    values = np.zeros_like(times)
+    values[54321] = 10.0
+    indices = lttb_indices(times, values, 200)
+    assert len(indices) == 200
+    assert indices[0] == 0 and indices[-1] == len(times) - 1
+    assert np.all(np.diff(indices) > 0)
+    assert 54321 in indices
+    assert lttb_indices(times[:10], values[:10], 50).tolist() == list(range(10))
+
+
+def test_min_max_keeps_extremes():
+    values = np.sin(np.linspace(0.0, 20.0, 5000))
+    values[1234] = -7.0
+    values[4321] = 9.0
+    indices = min_max_indices(np.arange(5000), values, 100)
+    assert len(indices) <= 100
+    assert 1234 in indices and 4321 in indices
+    assert indices[0] == 0 and indices[-1] == 4999
+
+
+def test_downsample_keeps_times_aligned():
+    times = np.arange(1000.0)
+    values = times ** 2
+    for method in ['lttb', 'minmax']:
+        kept_times, kept_values = downsample(times, values, 50, method)
+        assert np.array_equal(kept_values, kept_times ** 2)
+    with pytest.raises(ValueError):
+        downsample(times, values, 50, 'average')
+    with pytest.raises(ValueError):
+        downsample(times, values[:-1], 50)
+
+
+def test_chop_list_without_global_state():
+    utilities = T2Utilities()
+    assert utilities.chop_list(list(range(20)), 15) == [0, 15]
+    assert utilities.chop_list(list(range(3000)), 15) == list(range(0, 3000, 135))
+
+
+def test_reader_downsampled_timeseries():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultReact('toughreact', file_path, 'kdd_conc.tec')
+    times, values = results.get_downsampled_timeseries('pH', 0, 40)
+    store = results.get_store()
+    assert len(times) == 40
+    assert times[0] == store.times[0] and times[-1] == store.times[-1]
+    positions = np.searchsorted(store.times, times)
+    assert np.array_equal(values, store.get_column('pH')[positions, 0])
+
+
+def test_store_downsampled_timeseries_by_name():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    store = ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    times, values = get_downsampled_timeseries(store, 'FLOW_G', 'a 1', 10, 'minmax')
+    assert np.array_equal(times, get_downsampled_timeseries(store, 'FLOW_G', 0, 10, 'minmax')[0])
+    assert np.array_equal(values, downsample(store.times, store.get_column('FLOW_G')[:, 0], 10, 'minmax')[1])
@@ -0,0 +1,65 @@
+import os
+import numpy as np
+import pandas as pd
+from pytoughreact.results.simple_experiment_data import Experiment
+
+
+def write_experiment(directory, times, columns):
+    data_table = pd.DataFrame({'Time': ['day'] + list(times)})
+    for name, values in columns.items():
+        data_table[name] = ['-'] + list(values)
+    data_table.to_csv(os.path.join(directory, 'expt.csv'), index=False)
+
+
+def test_experiment_parsed_once(tmp_path, mocker):
+    write_experiment(str(tmp_path), [1.0, 2.0], {'PRES': [1e5, 2e5]})
+    spy = mocker.spy(pd, 'read_csv')
+    for i in range(3):
+        experiment = Experiment(str(tmp_path), 'expt.csv')
+        assert experiment.get_times().tolist() == [1.0, 2.0]
+        assert experiment.get_timeseries_data('PRES').tolist() == [1e5, 2e5]
+    assert spy.call_count == 1
+    data_table = experiment.read_file()
+    data_table['PRES'] = 0
+    assert experiment.get_timeseries_data('PRES').tolist() == [1e5, 2e5]
+    write_experiment(str(tmp_path), [1.0, 2.0, 3.0], {'PRES': [1e5, 2e5, 3e5]})
+    os.utime(os.path.join(str(tmp_path), 'expt.csv'), ns=(0, 10 ** 18))
+    assert experiment.get_times().tolist() == [1.0, 2.0, 3.0]
+
+
+def test_interpolate_columns_matches_numpy():
+    source_times = np.array([3.0, 0.0, 1.0, 5.0])
+    source_values = np.column_stack([source_times ** 2, -source_times, [1.0, np.nan, 2.0, 4.0]])
+    times = np.linspace(-1, 6, 29)
+    values = Experiment.interpolate_columns(source_times, source_values, times)
+    order = np.argsort(source_times)
+    inside = (times >= 0) & (times <= 5)
+    for column in range(2):
+        expected = np.interp(times, source_times[order], source_values[order, column])
+        assert np.allclose(values[inside, column], expected[inside])
+        assert np.isnan(values[~inside, column]).all()
+    valid = (times >= 1) & (times <= 5)
+    assert np.allclose(values[valid, 2], np.interp(times[valid], [1.0, 3.0, 5.0], [2.0, 1.0, 4.0]))
+    assert np.isnan(values[~valid, 2]).all()
+
+
+def test_misfit_metrics(tmp_path, mocker):
+    observed_times = np.array([1.0, 2.0, 3.0, 4.0])
+    write_experiment(str(tmp_path), observed_times, {'PRES': [1.0, 2.0, 3.0, 4.0], 'SG': [0.1, 0.2, 0.3, 0.4]})
+    experiment = Experiment(str(tmp_path), 'expt.csv')
+    simulated_times = np.linspace(0, 3.5, 8)
+    simulated = np.column_stack([simulated_times + 1.0, simulated_times / 10 * 2])
+    residuals = experiment.get_residuals(simulated_times, simulated, ['PRES', 'SG'])
+    assert np.allclose(residuals[:3], [[1.0, 0.1], [1.0, 0.2], [1.0, 0.3]])
+    assert np.isnan(residuals[3]).all()
+    spy = mocker.spy(Experiment, 'interpolate_columns')
+    misfit = experiment.get_misfit(simulated_times, simulated, ['PRES', 'SG'])
+    assert spy.call_count == 1
+    assert np.isclose(misfit.loc['PRES', 'RMSE'], 1.0)
+    assert np.isclose(misfit.loc['PRES', 'NRMSE'], 0.5)
+    assert np.isclose(misfit.loc['SG', 'RMSE'], np.sqrt(np.mean(np.array([0.1, 0.2, 0.3]) ** 2)))
+    assert np.isclose(misfit.loc['SG', 'MEAN_LOG_RESIDUAL'], np.log10(2.0))
+    assert np.isclose(misfit.loc['SG', 'LOG_RMSE'], np.log10(2.0))
+    aligned = experiment.interpolate_to(simulated_times, ['PRES'])
+    assert np.isnan(aligned[:2, 0]).all()
+    assert np.allclose(aligned[2:, 0], simulated_times[2:])
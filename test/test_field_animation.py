@@ -0,0 +1,74 @@
+import os
+import numpy as np
+import pytest
+import matplotlib.pyplot as plt
+from pytoughreact.plotting.field_animation import FieldAnimation, FieldFrames, CELLS, RASTER
+from pytoughreact.plotting.mesh_raster import MeshRaster
+from pytoughreact.plotting.plot_geometry import clear_plot_geometries
+from pytoughreact.results.result_store import ResultStore
+from test.result_writers import write_element_output
+
+
+def test_frames_parse_file_once(tmp_path, mocker):
+    x, z = [values.ravel() for values in np.meshgrid([1.0, 2.0, 4.0], [-1.0, -3.0])]
+    write_element_output(str(tmp_path), x, z, [0.0, 10.0, 20.0])
+    spy = mocker.spy(ResultStore, 'from_file')
+    field_frames = FieldAnimation('tmvoc', str(tmp_path), 'OUTPUT_ELEME.csv', 'PRES').get_frames()
+    assert spy.call_count == 1
+    assert field_frames.kind == CELLS
+    assert field_frames.frames.shape == (3, 2, 3)
+    assert np.array_equal(field_frames.frames[2], [[1e5 + 24, 1e5 + 25, 1e5 + 27], [1e5 + 22, 1e5 + 23, 1e5 + 25]])
+    assert field_frames.vmin == 1e5 + 2
+    assert field_frames.vmax == 1e5 + 27
+
+
+def test_irregular_frames_use_one_raster(tmp_path, mocker):
+    rng = np.random.default_rng(1)
+    write_element_output(str(tmp_path), rng.uniform(0, 10, 40), -rng.uniform(0, 5, 40), [0.0, 10.0])
+    clear_plot_geometries()
+    spy = mocker.spy(MeshRaster, '__init__')
+    animation = FieldAnimation('tmvoc', str(tmp_path), 'OUTPUT_ELEME.csv', 'PRES', times=[10.0])
+    field_frames = animation.get_frames()
+    assert spy.call_count == 1
+    assert field_frames.kind == RASTER
+    assert len(field_frames) == 1
+    assert field_frames.frames.shape == (1, 40)
+    fig, artists = field_frames.build_figure()
+    assert artists[0].get_array().shape == field_frames.mesh_raster.shape
+    plt.close(fig)
+
+
+def test_update_changes_only_image_data():
+    frames = np.arange(12, dtype=np.float64).reshape(2, 2, 3)
+    field_frames = FieldFrames(CELLS, frames, ['first', 'second'], 'PRES', 'X', 'Z',
+                               horizontal_axis=np.arange(3.0), vertical_axis=np.arange(2.0))
+    fig, artists = field_frames.build_figure()
+    field_frames.update(artists, 1)
+    assert np.array_equal(artists[0].get_array().reshape(2, 3), frames[1])
+    assert artists[1].get_text() == 'second'
+    assert artists[0].norm.vmin == 0 and artists[0].norm.vmax == 11
+    plt.close(fig)
+
+
+def test_save_gif_and_frames(tmp_path):
+    x, z = [values.ravel() for values in np.meshgrid([1.0, 2.0, 4.0], [-1.0, -3.0])]
+    write_element_output(str(tmp_path), x, z, [0.0, 10.0, 20.0])
+    animation = FieldAnimation('tmvoc', str(tmp_path), 'OUTPUT_ELEME.csv', 'PRES', dpi=20)
+    open_figures = plt.get_fignums()
+    gif_path = animation.save(os.path.join(str(tmp_path), 'pressure.gif'))
+    file_paths = animation.save_frames(max_workers=2, executor='serial')
+    assert os.path.isfile(gif_path)
+    assert file_paths == [os.path.join(str(tmp_path), 'PRES_' + str(number) + '.png') for number in range(3)]
+    assert all(os.path.isfile(file_path) for file_path in file_paths)
+    assert plt.get_fignums() == open_figures
+    with pytest.raises(ValueError):
+        animation.save(os.path.join(str(tmp_path), 'pressure.avi'))
+
+
+def test_save_frames_in_processes(tmp_path):
+    x, z = [values.ravel() for values in np.meshgrid([1.0, 2.0], [-1.0, -3.0])]
+    write_element_output(str(tmp_path), x, z, [0.0, 10.0, 20.0, 30.0])
+    animation = FieldAnimation('tmvoc', str(tmp_path), 'OUTPUT_ELEME.csv', 'PRES', dpi=20)
+    file_paths = animation.save_frames(str(tmp_path), 'pressure', max_workers=2)
+    assert len(file_paths) == 4
+    assert all(os.path.isfile(file_path) for file_path in file_paths)
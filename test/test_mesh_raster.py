@@ -0,0 +1,46 @@
+import os
+import numpy as np
+import matplotlib.axes
+from pytoughreact.plotting.mesh_raster import MeshRaster
+from pytoughreact.plotting.plot_geometry import clear_plot_geometries
+from pytoughreact.plotting.plot_tough_routine import PlotTough
+from test.result_writers import write_element_output
+
+
+def test_mesh_raster_reproduces_linear_field():
+    rng = np.random.default_rng(0)
+    x = np.concatenate([[0.0, 10.0, 0.0, 10.0], rng.uniform(0, 10, 200)])
+    y = np.concatenate([[0.0, 0.0, 5.0, 5.0], rng.uniform(0, 5, 200)])
+    mesh_raster = MeshRaster(x, y, columns=40, rows=30)
+    raster = mesh_raster.interpolate(3 * x - 2 * y + 1)
+    pixel_x, pixel_y = np.meshgrid(np.linspace(0, 10, 40), np.linspace(0, 5, 30))
+    assert raster.shape == (30, 40)
+    assert mesh_raster.extent == [0.0, 10.0, 0.0, 5.0]
+    inside = ~np.isnan(raster)
+    assert inside.mean() > 0.99
+    assert np.allclose(raster[inside], (3 * pixel_x - 2 * pixel_y + 1)[inside])
+
+
+def test_plot_2d_structured_uses_cells(tmp_path, mocker):
+    x, z = [values.ravel() for values in np.meshgrid([1.0, 2.0, 4.0], [-1.0, -3.0])]
+    write_element_output(str(tmp_path), x, z)
+    spy = mocker.spy(matplotlib.axes.Axes, 'pcolormesh')
+    clear_plot_geometries()
+    raster_spy = mocker.spy(MeshRaster, '__init__')
+    plot = PlotTough('tmvoc', str(tmp_path), 'OUTPUT_ELEME.csv', headless=True, dpi=20)
+    plot.plot_2d_one('X', 'Z', 'PRES', 0)
+    assert np.array_equal(spy.call_args_list[0][0][3], [[1e5 + 4, 1e5 + 5, 1e5 + 7], [1e5 + 2, 1e5 + 3, 1e5 + 5]])
+    assert raster_spy.call_count == 0
+    assert len(plot.saved_files) == 1
+
+
+def test_plot_2d_irregular_builds_raster_once(tmp_path, mocker):
+    rng = np.random.default_rng(2)
+    write_element_output(str(tmp_path), rng.uniform(0, 10, 50), -rng.uniform(0, 5, 50))
+    clear_plot_geometries()
+    raster_spy = mocker.spy(MeshRaster, '__init__')
+    plot = PlotTough('tmvoc', str(tmp_path), 'OUTPUT_ELEME.csv', headless=True, dpi=20)
+    plot.plot_2d_one('X', 'Z', 'PRES', 0)
+    plot.plot_2d_one('X', 'Z', 'PRES', 0)
+    assert raster_spy.call_count == 1
+    assert os.path.isfile(plot.saved_files[-1])
@@ -0,0 +1,43 @@
+import os
+import shutil
+import numpy as np
+from pytoughreact.results.multi_result_loader import MultiResultLoader
+from pytoughreact.results.multi_result_tough_3 import MultiResultTough3
+from pytoughreact.results.multi_result_tough_react import MultiResultReact
+from pytoughreact.results.result_store import ResultStore
+
+
+def test_multi_result_loader_tough_3(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    locations = []
+    for run_name in ['run_0', 'run_1', 'run_2']:
+        os.mkdir(os.path.join(str(tmp_path), run_name))
+        shutil.copy(os.path.join(file_path, 'OUTPUT_CONNE.csv'), os.path.join(str(tmp_path), run_name))
+        locations.append(os.path.join(str(tmp_path), run_name))
+    store = ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    for executor in ['thread', 'process']:
+        loader = MultiResultLoader('tmvoc', locations, 'OUTPUT_CONNE.csv', max_workers=2, executor=executor)
+        data_table = loader.load_timeseries(['FLOW_G', 'X'], 3)
+        assert list(data_table.columns) == ['run', 'file_location', 'time', 'FLOW_G', 'X']
+        assert len(data_table) == 3 * 22
+        run_table = data_table[data_table['run'] == 2]
+        assert np.array_equal(run_table['time'].values, store.times)
+        assert np.array_equal(run_table['FLOW_G'].values, store.get_column('FLOW_G')[:, 3])
+
+
+def test_multi_result_parse_once_per_run(mocker):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    spy = mocker.spy(ResultStore, 'from_file')
+    multi = MultiResultTough3('tmvoc', [file_path, file_path], ['OUTPUT_CONNE.csv', 'OUTPUT_CONNE.csv'],
+                              ['FLOW_G', 'FLOW', 'X'])
+    data_table = multi.load_timeseries(0, executor='thread')
+    assert spy.call_count == 2
+    assert sorted(set(data_table['run'])) == [0, 1]
+
+
+def test_multi_result_react_load_timeseries():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    multi = MultiResultReact('toughreact', [file_path], ['kdd_conc.tec'], ['pH', 'T(C)'])
+    data_table = multi.load_timeseries(0, max_workers=1, executor='thread')
+    assert len(data_table) == 865
+    assert data_table['pH'].iloc[0] == 4.8825
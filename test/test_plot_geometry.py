@@ -0,0 +1,64 @@
+import os
+import numpy as np
+import pandas as pd
+from pytoughreact.plotting.mesh_raster import MeshRaster
+from pytoughreact.plotting.plot_geometry import PlotGeometry, get_plot_geometry, clear_plot_geometries
+from pytoughreact.plotting.plot_tough_routine import PlotTough
+from pytoughreact.results.structured_grid import StructuredGrid
+from pytoughreact.utilities.t2_utilities import T2Utilities
+from test.result_writers import write_element_output
+
+
+def test_geometry_matches_grid_numbers():
+    x, z = [values.ravel() for values in np.meshgrid(np.arange(25.0) * 4, -np.arange(12.0) * 2)]
+    geometry = PlotGeometry(x, z)
+    modifier = T2Utilities()
+    data_frame = pd.DataFrame({'X': x, 'Z': z})
+    x_values, x_total = modifier.get_grid_number(data_frame, 'X')
+    z_values, z_total = modifier.get_grid_number(data_frame, 'Z')
+    assert geometry.shape == (z_total, x_total)
+    assert np.array_equal(geometry.horizontal_levels, x_values)
+    assert np.array_equal(geometry.vertical_levels, z_values)
+    assert np.array_equal(geometry.x_ticks, np.arange(0, 25, 6))
+    assert np.array_equal(geometry.z_ticks, np.arange(0, 12, 6))
+    assert np.allclose(geometry.x_tick_labels, modifier.crange(0, 96, 24))
+    assert np.allclose(geometry.z_tick_labels, [0, 22])
+    assert geometry.figure_height == 10
+
+
+def test_geometry_shared_between_runs(tmp_path, mocker):
+    clear_plot_geometries()
+    rng = np.random.default_rng(3)
+    x, z = rng.uniform(0, 10, 30), -rng.uniform(0, 5, 30)
+    for run in ['run0', 'run1']:
+        os.mkdir(os.path.join(str(tmp_path), run))
+        write_element_output(os.path.join(str(tmp_path), run), x, z)
+    spy = mocker.spy(MeshRaster, '__init__')
+    for run in ['run0', 'run1']:
+        PlotTough('tmvoc', os.path.join(str(tmp_path), run), 'OUTPUT_ELEME.csv', headless=True,
+                  dpi=20).plot_2d_one('X', 'Z', 'PRES', 0)
+    assert spy.call_count == 1
+
+
+def test_geometry_cached_on_disk(tmp_path, mocker):
+    clear_plot_geometries()
+    rng = np.random.default_rng(4)
+    grid = StructuredGrid(rng.uniform(0, 10, 30), np.zeros(30), -rng.uniform(0, 5, 30))
+    values = rng.uniform(0, 1, 30)
+    raster = get_plot_geometry(grid, 'X', 'Z', str(tmp_path)).get_mesh_raster().interpolate(values)
+    assert len(os.listdir(str(tmp_path))) == 1
+    clear_plot_geometries()
+    spy = mocker.spy(MeshRaster, '__init__')
+    geometry = get_plot_geometry(grid, 'X', 'Z', str(tmp_path))
+    assert np.array_equal(geometry.get_mesh_raster().interpolate(values), raster, equal_nan=True)
+    assert spy.call_count == 0
+
+
+def test_plot_2d_with_grid_uses_geometry(tmp_path, mocker):
+    x, z = [values.ravel() for values in np.meshgrid([1.0, 2.0, 4.0], [-1.0, -3.0])]
+    write_element_output(str(tmp_path), x, z)
+    spy = mocker.spy(T2Utilities, 'get_grid_number')
+    plot = PlotTough('tmvoc', str(tmp_path), 'OUTPUT_ELEME.csv', headless=True, dpi=20)
+    plot.plot_2d_with_grid('X', 'Z', 'PRES', 0)
+    assert spy.call_count == 0
+    assert os.path.isfile(plot.saved_files[0])
@@ -0,0 +1,58 @@
+import os
+import numpy as np
+import matplotlib.pyplot as plt
+from pytoughreact.plotting.plot_multiple_files_routine import PlotMultiFiles
+from pytoughreact.results.multi_result_loader import stack_columns
+from pytoughreact.results.multi_result_tough_3 import MultiResultTough3
+from pytoughreact.results.result_store import ResultStore
+from test.result_writers import write_element_output
+
+PROPS = ['PRES', 'SAT_G', 'SAT_L', 'TEMP', 'X_W', 'X_A', 'DEN_G', 'DEN_L']
+
+
+def write_runs(directory, run_count, time_count):
+    locations = []
+    for run_number in range(run_count):
+        location = os.path.join(directory, 'run' + str(run_number))
+        os.mkdir(location)
+        write_element_output(location, [float(element) for element in range(4)], [-1.0] * 4,
+                             [time_number * 86400.0 for time_number in range(time_count)], headers=PROPS,
+                             values=lambda time_number, element, run_number=run_number: [
+                                 run_number + time_number + element + prop_number / 10
+                                 for prop_number in range(len(PROPS))])
+        locations.append(location)
+    return locations
+
+
+def test_stack_columns_pads_short_columns():
+    data_table = stack_columns(['a', 'b'], [[1.0, 2.0, 3.0], np.array([4.0])])
+    assert list(data_table.columns) == ['a', 'b']
+    assert np.array_equal(data_table['a'].values, [1.0, 2.0, 3.0])
+    assert data_table['b'].iloc[0] == 4.0
+    assert np.isnan(data_table['b'].iloc[1:]).all()
+
+
+def test_multi_element_data_layout(tmp_path):
+    locations = write_runs(str(tmp_path), 2, 3)
+    multi = MultiResultTough3('tmvoc', locations, ['OUTPUT_ELEME.csv'] * 2, PROPS[:2])
+    data_table = multi.get_multi_element_data(1, 'day')
+    assert list(data_table.columns) == ['PREStime00', 'PRESresult00', 'SAT_Gtime01', 'SAT_Gresult01',
+                                        'PREStime10', 'PRESresult10', 'SAT_Gtime11', 'SAT_Gresult11']
+    assert np.array_equal(data_table['PREStime10'].values, [0.0, 1.0, 2.0])
+    assert np.allclose(data_table['SAT_Gresult11'].values, [2.1, 3.1, 4.1])
+
+
+def test_plots_parse_each_file_once(tmp_path, mocker):
+    locations = write_runs(str(tmp_path), 3, 4)
+    spy = mocker.spy(ResultStore, 'from_file')
+    legend = ['run' + str(run_number) for run_number in range(3)]
+    plot = PlotMultiFiles('tmvoc', locations, ['OUTPUT_ELEME.csv'] * 3, PROPS, headless=True, dpi=20)
+    open_figures = plt.get_fignums()
+    plot.plot_multi_element_multi_file(0, legend, 'day')
+    plot.plot_multi_element_multi_file(2, legend, 'day', plot_kind='file')
+    assert spy.call_count == 3
+    assert plt.get_fignums() == open_figures
+    assert len(plot.saved_files) == 2
+    plot.close()
+    plot.plot_multi_element_multi_file(0, legend, 'day')
+    assert spy.call_count == 6
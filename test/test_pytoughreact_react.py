@@ -375,7 +375,8 @@ def test_write_react():
     assert result == 'successful'
 
 
-def test_read_react():
+def test_read_react(monkeypatch):
+    monkeypatch.chdir(os.path.dirname(os.path.realpath(__file__)))
     test_case = ReactTestCase()
     write_output = test_case.set_up_read()
     result = write_output.status
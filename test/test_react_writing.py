@@ -359,7 +359,8 @@ def test_read_file():
     assert output == ''
 
 
-def test_check_for_thermodynamic_database():
+def test_check_for_thermodynamic_database(monkeypatch):
+    monkeypatch.chdir(os.path.dirname(os.path.realpath(__file__)))
     test_case = T2ReactWritingTestCases()
     test_case_react = T2React(filename='flow.inp')
     write_solute = test_case.set_up_read()
@@ -379,7 +380,8 @@ def test_check_for_thermodynamic_database_raise_exception():
         assert True
 
 
-def test_react_run(mocker):
+def test_react_run(mocker, monkeypatch):
+    monkeypatch.chdir(os.path.dirname(os.path.realpath(__file__)))
     test_case = T2ReactWritingTestCases()
     test_case_react, test_chemical, test_solute = test_case.set_up_write()
     mocker.patch('pytoughreact.writers.react_writing.T2React.check_for_executable', return_value=True)
@@ -387,7 +389,8 @@ def test_react_run(mocker):
     test_case_react.run(test_solute)
 
 
-def test_react_run_specify_directory(mocker):
+def test_react_run_specify_directory(mocker, monkeypatch):
+    monkeypatch.chdir(os.path.dirname(os.path.realpath(__file__)))
     test_case = T2ReactWritingTestCases()
     test_case_react = T2React(filename='flow.inp')
     write_solute = test_case.set_up_read()
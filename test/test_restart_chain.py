@@ -0,0 +1,90 @@
+import os
+import shutil
+import numpy as np
+import pytest
+from pytoughreact.results.restart_chain import RestartChain
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.results.result_tough_react import ResultReact
+from pytoughreact.plotting.plot_tough_routine import PlotTough
+
+
+def write_segments(directory, boundaries):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    with open(os.path.join(file_path, 'OUTPUT_CONNE.csv')) as result_file:
+        lines = result_file.readlines()
+    block_starts = [index for index, line in enumerate(lines) if line.startswith('"TIME')] + [len(lines)]
+    locations = []
+    for segment_number, (first_block, last_block) in enumerate(boundaries):
+        location = os.path.join(directory, 'run_' + str(segment_number))
+        os.makedirs(location)
+        with open(os.path.join(location, 'OUTPUT_CONNE.csv'), 'w') as segment_file:
+            segment_file.writelines(lines[:block_starts[0]])
+            segment_file.writelines(lines[block_starts[first_block]:block_starts[last_block + 1]])
+        locations.append(location)
+    return locations
+
+
+def test_restart_chain_stitches_overlapping_runs(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    locations = write_segments(str(tmp_path), [(0, 7), (7, 15), (12, 21)])
+    chain = RestartChain('tmvoc', locations, 'OUTPUT_CONNE.csv', executor='thread')
+    full_store = ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    assert chain.get_times() == full_store.times.tolist()
+    assert chain.segments.tolist() == [0] * 8 + [1] * 8 + [2] * 6
+    assert chain.get_timeseries_data('FLOW_G', 4) == full_store.get_column('FLOW_G')[:, 4].tolist()
+    assert chain.get_timeseries_batch([0, 3], ['FLOW', 'FLOW_G']).shape == (22, 2, 2)
+    assert np.array_equal(chain.get_element_data(full_store.times[10], 'FLOW'), full_store.get_column('FLOW')[10])
+    assert chain.get_elements() == full_store.elements
+    store = chain.get_store()
+    assert chain.get_store() is store
+
+
+def test_restart_chain_rejects_different_grids(tmp_path):
+    locations = write_segments(str(tmp_path), [(0, 3), (3, 6)])
+    with open(os.path.join(locations[1], 'OUTPUT_CONNE.csv')) as segment_file:
+        lines = segment_file.readlines()
+    with open(os.path.join(locations[1], 'OUTPUT_CONNE.csv'), 'w') as segment_file:
+        segment_file.writelines([line.replace('"               a 1"', '"               z 1"') for line in lines])
+    chain = RestartChain('tmvoc', locations, 'OUTPUT_CONNE.csv', executor='thread')
+    with pytest.raises(ValueError):
+        chain.get_times()
+
+
+def test_plot_restart_data(tmp_path):
+    locations = write_segments(str(tmp_path), [(0, 10), (10, 21)])
+    plot = PlotTough('tmvoc', locations[0], 'OUTPUT_CONNE.csv', restart_files=locations[1:])
+    assert len(plot._get_restart_data_time('day')) == 22
+    assert len(plot._get_restart_data_element('FLOW_G', 0)) == 22
+    assert plot._get_restart_chain() is plot._get_restart_chain()
+
+
+def test_plot_tough3_restart_data_keeps_every_time(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    locations = write_segments(str(tmp_path), [(0, 10), (10, 21)])
+    plot = PlotTough('tough3', locations[0], 'OUTPUT_CONNE.csv', restart_files=locations[1:])
+    full_store = ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    assert plot._get_restart_data_time('second') == full_store.times.tolist()
+    assert plot._get_restart_data_element('FLOW_G', 0) == full_store.get_column('FLOW_G')[:, 0].tolist()
+
+
+def test_plot_react_restart_data_keeps_run_sampling(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    with open(os.path.join(file_path, 'kdd_conc.tec')) as result_file:
+        lines = result_file.readlines()
+    zone_starts = [index for index, line in enumerate(lines) if line.startswith('Zone')] + [len(lines)]
+    locations = []
+    for segment_number, (first_zone, last_zone) in enumerate([(0, 400), (400, 864)]):
+        location = os.path.join(str(tmp_path), 'run_' + str(segment_number))
+        os.makedirs(location)
+        with open(os.path.join(location, 'kdd_conc.tec'), 'w') as segment_file:
+            segment_file.writelines(lines[:zone_starts[0]])
+            segment_file.writelines(lines[zone_starts[first_zone]:zone_starts[last_zone + 1]])
+        shutil.copy(os.path.join(file_path, 'MESH'), location)
+        locations.append(location)
+    plot = PlotTough('toughreact', locations[0], 'kdd_conc.tec', restart_files=locations[1:])
+    restart_time = plot._get_restart_data_time('day')
+    first_run_time = ResultReact('toughreact', locations[0], 'kdd_conc.tec').convert_times('day')
+    assert len(restart_time) == len(plot._get_restart_data_element('pH', 0))
+    assert restart_time[:len(first_run_time)] == first_run_time
+    assert len(restart_time) < 30
+    assert restart_time == sorted(restart_time)
@@ -0,0 +1,73 @@
+import os
+import shutil
+import numpy as np
+import pytest
+from pytoughreact.results.result_connections import ResultConnections
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.results.result_stream import ResultStream
+
+
+def test_connection_results():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultConnections('tmvoc', file_path)
+    connections = results.get_connections()
+    assert len(connections) == 85
+    assert connections[0] == ('a 1', 'b 1')
+    assert len(results.get_times()) == 22
+    store = ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    assert results.get_timeseries_data('FLOW_G', ('a 1', 'b 1')) == store.get_column('FLOW_G')[:, 0].tolist()
+    reversed_data = results.get_timeseries_data('FLOW_G', ('b 1', 'a 1'))
+    assert reversed_data == (-store.get_column('FLOW_G')[:, 0]).tolist()
+    batch = results.get_timeseries_batch([('b 1', 'c 1'), 0], ['FLOW', 'FLOW_G'])
+    assert batch.shape == (22, 2, 2)
+    assert np.array_equal(batch[:, 0, 1], store.get_column('FLOW_G')[:, 1])
+    assert results.get_connection_data(200, 'FLOW_G').shape == (85,)
+    with pytest.raises(ValueError):
+        results.get_connection_indices([('a 1', 'z 9')])
+
+
+def test_surface_and_region_flux():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultConnections('tmvoc', file_path, usecols=['FLOW', 'FLOW_G'])
+    store = ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    surface = [('a 1', 'b 1'), ('c 1', 'b 1')]
+    surface_flux = results.get_surface_flux(surface, ['FLOW_G', 'FLOW'])
+    assert surface_flux.shape == (22, 2)
+    assert np.allclose(surface_flux[:, 0], store.get_column('FLOW_G')[:, 0] - store.get_column('FLOW_G')[:, 1])
+    region = ['a 1', 'b 1']
+    boundary = results.get_boundary_connections(region)
+    assert ('b 1', 'c 1') in boundary
+    assert all(inside in region and outside not in region for inside, outside in boundary)
+    region_flux = results.get_region_flux(region, ['FLOW'])
+    assert np.allclose(region_flux, results.get_surface_flux(boundary, ['FLOW']))
+    assert np.all(results.get_region_flux([], ['FLOW']) == 0)
+
+
+def test_connections_read_from_sidecar(tmp_path, mocker):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'OUTPUT_CONNE.csv'), str(tmp_path))
+    expected = ResultConnections('tmvoc', str(tmp_path)).get_connections()
+    ResultConnections('tmvoc', str(tmp_path)).export()
+    spy = mocker.spy(ResultStream, 'get_block')
+    assert ResultConnections('tmvoc', str(tmp_path)).get_connections() == expected
+    assert ResultConnections('tmvoc', str(tmp_path), use_sidecar=False, usecols=['FLOW']).get_connections() == expected
+    assert spy.call_count == 0
+
+
+def test_connection_store_closed_when_replaced(tmp_path, mocker):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'OUTPUT_CONNE.csv'), str(tmp_path))
+    ResultConnections('tmvoc', str(tmp_path)).export()
+    results = ResultConnections('tmvoc', str(tmp_path))
+    sidecar_store = results.get_store()
+    assert sidecar_store._columns is not None
+    close_spy = mocker.spy(sidecar_store, 'close')
+    source_path = os.path.join(str(tmp_path), 'OUTPUT_CONNE.csv')
+    with open(source_path, 'a') as result_file:
+        result_file.write('\n')
+    assert results.get_store() is not sidecar_store
+    assert close_spy.call_count == 1
+    assert len(results.get_connections()) == 85
+    results.close()
+    assert results._connections is None
+    assert len(results.get_times()) == 22
@@ -0,0 +1,72 @@
+import os
+import numpy as np
+from pytoughreact.results.result_follower import ResultFollower
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.results.result_tough_react import ResultReact
+
+
+def split_at_markers(file_path, marker):
+    with open(file_path, 'rb') as result_file:
+        content = result_file.read()
+    positions = []
+    position = content.find(marker)
+    while position >= 0:
+        positions.append(position)
+        position = content.find(marker, position + 1)
+    return content, positions
+
+
+def test_follow_csv_as_it_grows(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    content, positions = split_at_markers(os.path.join(file_path, 'OUTPUT_CONNE.csv'), b'"TIME')
+    target = os.path.join(str(tmp_path), 'OUTPUT_CONNE.csv')
+    follower = ResultTough3('tmvoc', str(tmp_path), 'OUTPUT_CONNE.csv').get_follower()
+    assert follower.poll() == []
+    with open(target, 'wb') as result_file:
+        result_file.write(content[:positions[1] + 5])
+    assert follower.poll() == []
+    with open(target, 'ab') as result_file:
+        result_file.write(content[positions[1] + 5:positions[3] - 20])
+    blocks = follower.poll()
+    assert len(blocks) == 2
+    with open(target, 'ab') as result_file:
+        result_file.write(content[positions[3] - 20:positions[3]])
+    assert len(follower.poll()) == 1
+    with open(target, 'ab') as result_file:
+        result_file.write(content[positions[3]:])
+    blocks = follower.poll()
+    store = ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    assert len(follower.times) == len(store.times)
+    assert follower.times == store.times.tolist()
+    assert len(follower.elements) == 85
+    assert np.array_equal(blocks[-1][1], store.values[-1])
+    assert follower.poll() == []
+
+
+def test_follow_tecplot_restarts_on_truncation(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    content, positions = split_at_markers(os.path.join(file_path, 'kdd_conc.tec'), b'Zone')
+    target = os.path.join(str(tmp_path), 'kdd_conc.tec')
+    with open(target, 'wb') as result_file:
+        result_file.write(content)
+    follower = ResultFollower(target)
+    assert follower.file_type == 'tecplot'
+    assert len(follower.poll()) == len(positions)
+    assert follower.poll(final=True) == []
+    results = ResultReact('toughreact', file_path, 'kdd_conc.tec')
+    assert follower.times == results.get_zone_index().times.tolist()
+    assert follower.headers == results.get_parameters()
+    with open(target, 'wb') as result_file:
+        result_file.write(content[:positions[2]])
+    assert len(follower.poll(final=True)) == 2
+    assert follower.times == results.get_zone_index().times.tolist()[:2]
+
+
+def test_watch_calls_back_each_block(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    follower = ResultFollower(os.path.join(file_path, 'kdd_conc.tec'))
+    times = []
+    number_of_blocks = follower.watch(lambda time, values: times.append(time), interval=0.01, timeout=0.0)
+    assert number_of_blocks == len(times)
+    assert times == follower.times
@@ -0,0 +1,104 @@
+import os
+import csv
+import numpy as np
+import pytest
+from pytoughreact.results.result_generation import ResultGeneration
+from pytoughreact.results.result_tough_3 import ResultTough3
+
+
+def trapezoid(values, times):
+    return float(np.sum(np.diff(times) * 0.5 * (values[1:] + values[:-1])))
+
+
+def write_flat_file(directory, times, rates, enthalpy):
+    with open(os.path.join(directory, 'GOFT_INJ_1.csv'), 'w') as generation_file:
+        generation_file.write('"TIME(S)","GEN","ENTHALPY"\n')
+        for time, rate, value in zip(times, rates, enthalpy):
+            generation_file.write(' {:.6E}, {:.6E}, {:.6E}\n'.format(time, rate, value))
+
+
+def write_keyed_file(directory, times, rates):
+    with open(os.path.join(directory, 'GENER.csv'), 'w') as generation_file:
+        generation_file.write('"TIME(S)","ELEM","SOURCE","GEN"\n')
+        for time_index, time in enumerate(times):
+            for source_index, source in enumerate(['INJ 1', 'PRO 1']):
+                generation_file.write(' {:.6E},"A1{:d}  0","{}", {:.6E}\n'.format(
+                    time, source_index, source, rates[time_index, source_index]))
+
+
+def legacy_generation_data(file_path, param):
+    with open(file_path) as csv_file:
+        file_as_list = list(csv.reader(csv_file, delimiter=',', quotechar='"'))
+    heading = [i.upper().lstrip() for i in file_as_list[0]]
+    index_param = heading.index(param.upper())
+    return [float(row[index_param]) for row in file_as_list[1:]], [float(row[0]) for row in file_as_list[1:]]
+
+
+def test_flat_file_matches_legacy_reader(tmp_path):
+    times = np.linspace(0, 1000, 11)
+    write_flat_file(str(tmp_path), times, np.sin(times / 100), times * 2)
+    results = ResultTough3('tough3', str(tmp_path), 'GOFT_INJ_1.csv', generation=True)
+    legacy_rates, legacy_times = legacy_generation_data(os.path.join(str(tmp_path), 'GOFT_INJ_1.csv'), 'GEN')
+    assert results.get_generation_data('gen') == legacy_rates
+    assert results.get_times() == legacy_times
+    assert results.convert_times('day') == (np.asarray(legacy_times) / 86400).tolist()
+    assert results.get_generation().get_generators() == ['GOFT_INJ_1']
+
+
+def test_file_parsed_once(tmp_path, mocker):
+    times = np.linspace(0, 1000, 11)
+    write_flat_file(str(tmp_path), times, np.ones(11), times)
+    results = ResultTough3('tough3', str(tmp_path), 'GOFT_INJ_1.csv', generation=True)
+    spy = mocker.spy(ResultGeneration, '_read_rows')
+    results.get_generation_data('GEN')
+    results.get_generation_data('ENTHALPY')
+    results.get_times()
+    assert spy.call_count == 1
+
+
+def test_keyed_file_per_generator(tmp_path):
+    times = np.array([0.0, 10.0, 30.0, 60.0])
+    rates = np.column_stack([np.array([1.0, 2.0, 2.0, 1.0]), np.array([-1.0, -1.0, -3.0, -3.0])])
+    write_keyed_file(str(tmp_path), times, rates)
+    generation = ResultGeneration('tough3', str(tmp_path), 'GENER.csv')
+    assert generation.get_generators() == ['INJ 1', 'PRO 1']
+    assert generation.get_times() == times.tolist()
+    assert generation.get_timeseries_data('GEN', 'PRO 1') == rates[:, 1].tolist()
+    assert generation.get_timeseries_data('GEN', 'A10  0') == rates[:, 0].tolist()
+    injection = generation.get_cumulative_injection('GEN')
+    production = generation.get_cumulative_production('GEN')
+    assert np.allclose(injection[:, 0], np.concatenate([[0.0], np.cumsum(np.diff(times) * 0.5 *
+                                                                         (rates[1:, 0] + rates[:-1, 0]))]))
+    assert np.allclose(injection[:, 1], 0.0)
+    assert np.isclose(production[-1, 1], trapezoid(-rates[:, 1], times))
+    summary = generation.get_summary('GEN')
+    assert np.isclose(summary.loc['PRO 1', 'NET'], trapezoid(rates[:, 1], times))
+    assert summary.loc['INJ 1', 'ELEMENT'] == 'A10  0'
+    with pytest.raises(ValueError):
+        generation.get_timeseries_data('GEN', 'XXX 9')
+
+
+def test_sign_change_split_at_crossing(tmp_path):
+    times = np.array([0.0, 10.0])
+    write_flat_file(str(tmp_path), times, np.array([1.0, -3.0]), times)
+    generation = ResultGeneration('tough3', str(tmp_path), 'GOFT_INJ_1.csv')
+    assert np.isclose(generation.get_cumulative_injection('GEN')[-1, 0], 1.25)
+    assert np.isclose(generation.get_cumulative_production('GEN')[-1, 0], 11.25)
+    assert np.isclose(generation.get_cumulative_net('GEN')[-1, 0], trapezoid(np.array([1.0, -3.0]), times))
+
+
+def test_block_file_and_reparse_on_change(tmp_path):
+    file_path = os.path.join(str(tmp_path), 'OUTPUT_GENER.csv')
+    lines = ['"ELEM","SOURCE","GEN","ENTHALPY"\n']
+    for time in [0.0, 100.0, 200.0]:
+        lines.append('"TIME [sec]  {:.6E}"\n'.format(time))
+        lines.append('"A11 0","INJ 1", 2.0, 1.0E5\n')
+        lines.append('"A12 0","PRO 1", -1.0, 1.0E5\n')
+    with open(file_path, 'w') as generation_file:
+        generation_file.writelines(lines)
+    generation = ResultGeneration('tough3', str(tmp_path), 'OUTPUT_GENER.csv')
+    assert generation.get_generators() == ['INJ 1', 'PRO 1']
+    assert np.allclose(generation.get_cumulative_net('GEN')[-1], [400.0, -200.0])
+    with open(file_path, 'w') as generation_file:
+        generation_file.writelines(lines[:-3])
+    assert generation.get_times() == [0.0, 100.0]
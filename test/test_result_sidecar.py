@@ -0,0 +1,82 @@
+import os
+import shutil
+import time
+from pytoughreact.results.result_sidecar import ResultSidecar
+from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.results.result_tough_react import ResultReact
+
+
+def test_sidecar_tough_3_round_trip(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'OUTPUT_CONNE.csv'), str(tmp_path))
+    results = ResultTough3('tmvoc', str(tmp_path), 'OUTPUT_CONNE.csv')
+    sidecar_path = results.export()
+    assert os.path.isfile(sidecar_path)
+    reopened = ResultTough3('tmvoc', str(tmp_path), 'OUTPUT_CONNE.csv')
+    store = reopened.get_store()
+    assert store._values is None
+    assert reopened.get_timeseries_data('FLOW_G', 3) == results.get_timeseries_data('FLOW_G', 3)
+    assert reopened.get_element_data(700, 'X') == results.get_element_data(700, 'X')
+    assert store.get_coordinates().shape == (85, 3)
+
+
+def test_sidecar_ignored_when_source_changes(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'OUTPUT_CONNE.csv'), str(tmp_path))
+    source_path = os.path.join(str(tmp_path), 'OUTPUT_CONNE.csv')
+    ResultTough3('tmvoc', str(tmp_path), 'OUTPUT_CONNE.csv').export()
+    assert ResultSidecar(source_path).is_fresh()
+    time.sleep(0.01)
+    with open(source_path, 'a') as result_file:
+        result_file.write('\n')
+    assert not ResultSidecar(source_path).is_fresh()
+
+
+def test_sidecar_tough_react_round_trip(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    for file_name in ['kdd_conc.tec', 'MESH']:
+        shutil.copy(os.path.join(file_path, file_name), str(tmp_path))
+    results = ResultReact('toughreact', str(tmp_path), 'kdd_conc.tec')
+    results.export()
+    reopened = ResultReact('toughreact', str(tmp_path), 'kdd_conc.tec')
+    assert reopened._data is None
+    assert reopened._store is None
+    assert reopened.get_times() == results.get_times()
+    assert reopened.get_timeseries_data('pH', 0) == results.get_timeseries_data('pH', 0)
+    assert list(reopened.get_element_data(5000, 'pH')) == list(results.get_element_data(5000, 'pH'))
+    assert reopened.get_parameters() == results.get_parameters()
+    store = reopened.get_store()
+    assert store._columns is not None
+    reopened.close()
+    assert reopened._store is None
+    assert store._columns.archive.fid is None or store._columns.archive.fid.closed
+
+
+def test_sidecar_element_data_is_not_shared(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    for file_name in ['kdd_conc.tec', 'MESH']:
+        shutil.copy(os.path.join(file_path, file_name), str(tmp_path))
+    ResultReact('toughreact', str(tmp_path), 'kdd_conc.tec').export()
+    results = ResultReact('toughreact', str(tmp_path), 'kdd_conc.tec')
+    element_data = results.get_element_data(5000, 'pH')
+    expected = element_data[0]
+    element_data[0] = -999.0
+    assert results.get_element_data(5000, 'pH')[0] == expected
+    assert not results.get_store().get_element_values(5000, 'pH').flags.writeable
+
+
+def test_corrupt_sidecar_falls_back_to_text_output(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'OUTPUT_CONNE.csv'), str(tmp_path))
+    source_path = os.path.join(str(tmp_path), 'OUTPUT_CONNE.csv')
+    sidecar_path = ResultTough3('tmvoc', str(tmp_path), 'OUTPUT_CONNE.csv').export()
+    with open(sidecar_path, 'rb') as sidecar_file:
+        content = sidecar_file.read()
+    for corrupt in [b'', content[:len(content) // 2], b'not an archive']:
+        with open(sidecar_path, 'wb') as sidecar_file:
+            sidecar_file.write(corrupt)
+        os.utime(sidecar_path, ns=(0, os.stat(source_path).st_mtime_ns + 1))
+        assert not ResultSidecar(source_path).is_fresh()
+        results = ResultTough3('tmvoc', str(tmp_path), 'OUTPUT_CONNE.csv')
+        assert results.get_store()._values is not None
+        assert len(results.get_times()) == 22
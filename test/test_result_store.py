@@ -0,0 +1,80 @@
+import os
+import shutil
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.results.result_tough_react import ResultReact
+
+
+def test_result_store_shape():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    store = ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    assert store.values.shape == (22, 85, 10)
+    assert store.key_count == 2
+    assert store.parameters[0] == 'X'
+    assert store.values.flags['C_CONTIGUOUS']
+    assert len(store.times) == 22
+
+
+def test_result_store_parsed_once(mocker):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv')
+    spy = mocker.spy(ResultStore, 'from_file')
+    results.get_times()
+    results.get_elements()
+    results.get_timeseries_data('FLOW_G', 0)
+    results.get_element_data(200, 'FLOW_G')
+    assert spy.call_count == 1
+
+
+def test_result_store_invalidated_on_change(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'OUTPUT_CONNE.csv'), tmp_path)
+    results = ResultTough3('tmvoc', str(tmp_path), 'OUTPUT_CONNE.csv')
+    first_store = results.get_store()
+    assert results.get_store() is first_store
+    with open(os.path.join(str(tmp_path), 'OUTPUT_CONNE.csv')) as result_file:
+        lines = result_file.readlines()
+    last_time = max(i for i, line in enumerate(lines) if line.startswith('"TIME'))
+    with open(os.path.join(str(tmp_path), 'OUTPUT_CONNE.csv'), 'w') as result_file:
+        result_file.writelines(lines[:last_time])
+    assert results.get_store() is not first_store
+    assert len(results.get_times()) == 21
+
+
+def test_readers_keep_working_directory(tmp_path, monkeypatch):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    monkeypatch.chdir(str(tmp_path))
+    results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv')
+    react_results = ResultReact('toughreact', file_path, 'kdd_conc.tec')
+    assert len(results.get_times()) == 22
+    assert len(react_results.get_elements()) == 1
+    assert len(react_results.get_timeseries_data('pH', 0)) > 0
+    assert os.getcwd() == str(tmp_path)
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_result_dictionary_keeps_raw_rows():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    result_dict = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv').get_result_dictionary()
+    assert list(result_dict.keys()) == ResultStore.from_file(os.path.join(file_path, 'OUTPUT_CONNE.csv')).times.tolist()
+    first_row = result_dict[100.0][0]
+    assert first_row[:3] == ['               a 1', '               b 1', '  0.10000000000E+003']
+    assert all(len(rows) == 85 for rows in result_dict.values())
+
+
+def test_result_dictionary_read_once_per_file_version(tmp_path, mocker):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'OUTPUT_CONNE.csv'), tmp_path)
+    results = ResultTough3('tmvoc', str(tmp_path), 'OUTPUT_CONNE.csv')
+    spy = mocker.spy(results, 'read_file')
+    result_dict = results.get_result_dictionary()
+    result_dict[100.0][0][0] = 'changed'
+    assert results.get_result_dictionary()[100.0][0][0] == '               a 1'
+    assert spy.call_count == 1
+    with open(os.path.join(str(tmp_path), 'OUTPUT_CONNE.csv')) as result_file:
+        lines = result_file.readlines()
+    last_time = max(i for i, line in enumerate(lines) if line.startswith('"TIME'))
+    with open(os.path.join(str(tmp_path), 'OUTPUT_CONNE.csv'), 'w') as result_file:
+        result_file.writelines(lines[:last_time])
+    assert len(results.get_result_dictionary()) == 21
+    assert spy.call_count == 2
@@ -0,0 +1,58 @@
+import os
+import numpy as np
+from pytoughreact.results.result_stream import ResultStream
+from pytoughreact.results.result_tough_3 import ResultTough3
+
+
+def test_result_stream_records():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    stream = ResultStream(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    steps = list(stream)
+    assert len(steps) == 22
+    time, records = steps[0]
+    assert time == 100.0
+    assert len(records) == 85
+    assert records.dtype['FLOW_G'] == np.float64
+    assert records.ELEM2[0].strip() == 'b 1'
+
+
+def test_result_stream_timeseries_matches_store():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    stream = ResultStream(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv')
+    times, values = stream.get_timeseries('FDIFF_Toluen_L', 3)
+    assert list(times) == results.get_times()
+    assert list(values) == results.get_timeseries_data('FDIFF_Toluen_L', 3)
+
+
+def test_result_stream_negative_element_matches_store():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    stream = ResultStream(os.path.join(file_path, 'OUTPUT_CONNE.csv'))
+    results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv')
+    for element in [-1, -85]:
+        times, values = stream.get_timeseries('FLOW_G', element)
+        assert list(values) == results.get_timeseries_data('FLOW_G', element)
+        assert list(values) == list(stream.get_timeseries('FLOW_G', 85 + element)[1])
+
+
+def test_result_tough_3_streaming_mode():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv', streaming=True)
+    data = results.get_element_data(700, 'FLOW_G')
+    assert len(data) == 85
+    assert results._store is None
+
+
+def test_streaming_element_data_reads_file_once(mocker):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv', streaming=True)
+    store = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv').get_store()
+    times = store.times[[10, 3, 10, 0]]
+    results.get_stream().get_times()
+    spy = mocker.spy(ResultStream, 'iter_lines')
+    data = results.get_element_data(times, 'FLOW_G')
+    assert spy.call_count == 1
+    assert np.array_equal(data, store.get_column('FLOW_G')[[10, 3, 10, 0]])
+    blocks = results.get_stream().get_blocks([21, 0])
+    assert np.array_equal(blocks[21][2], store.values[21])
+    assert blocks[0][1] == ResultStream(os.path.join(file_path, 'OUTPUT_CONNE.csv')).get_block(0)[1]
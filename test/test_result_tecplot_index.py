@@ -0,0 +1,49 @@
+import os
+import shutil
+import numpy as np
+import t2listing
+from pytoughreact.results.result_tecplot_index import TecplotIndex
+
+
+def test_tecplot_index_matches_t2listing(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'kdd_conc.tec'), str(tmp_path))
+    tecplot_path = os.path.join(str(tmp_path), 'kdd_conc.tec')
+    zone_index = TecplotIndex(tecplot_path).open()
+    data = t2listing.toughreact_tecplot(tecplot_path, ['A'])
+    assert np.array_equal(zone_index.times, data.times)
+    assert zone_index.headers == data.element.column_name
+    for time_index in [0, 10, len(data.times) - 1]:
+        data.index = time_index
+        assert np.array_equal(zone_index.get_zone(time_index)[:, zone_index.get_parameter_index('pH')],
+                              data.element['pH'])
+    data.close()
+
+
+def test_tecplot_index_persisted(tmp_path, mocker):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'kdd_conc.tec'), str(tmp_path))
+    tecplot_path = os.path.join(str(tmp_path), 'kdd_conc.tec')
+    first_index = TecplotIndex(tecplot_path).open()
+    assert os.path.isfile(tecplot_path + '.idx')
+    spy = mocker.spy(TecplotIndex, 'build')
+    second_index = TecplotIndex(tecplot_path).open()
+    assert spy.call_count == 0
+    assert np.array_equal(second_index.offsets, first_index.offsets)
+    assert np.array_equal(second_index.get_zone(-1), first_index.get_zone(len(first_index.times) - 1))
+
+
+def test_truncated_tecplot_index_is_rebuilt(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'kdd_conc.tec'), str(tmp_path))
+    tecplot_path = os.path.join(str(tmp_path), 'kdd_conc.tec')
+    times = TecplotIndex(tecplot_path).open().times
+    with open(tecplot_path + '.idx', 'rb') as index_file:
+        content = index_file.read()
+    for truncated in [b'', content[:len(content) // 2]]:
+        with open(tecplot_path + '.idx', 'wb') as index_file:
+            index_file.write(truncated)
+        assert not TecplotIndex(tecplot_path).is_fresh()
+        assert np.array_equal(TecplotIndex(tecplot_path).open().times, times)
+        assert TecplotIndex(tecplot_path).is_fresh()
+    assert [name for name in os.listdir(str(tmp_path)) if name.endswith('.idx')] == ['kdd_conc.tec.idx']
@@ -0,0 +1,103 @@
+import os
+import numpy as np
+import pytest
+from pytoughreact.results.structured_grid import StructuredGrid
+from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.results.result_tough_react import ResultReact
+from test.result_writers import write_element_output
+
+
+def write_structured_output(directory, x_values, y_values, z_values, times):
+    points = [(x, y, z) for z in z_values for y in y_values for x in x_values]
+    x, y, z = [list(values) for values in zip(*points)]
+    return write_element_output(directory, x, z, times, y=y, units=['(PA)'],
+                                values=lambda time_index, number: [times[time_index] + number])
+
+
+def test_structured_grid_views():
+    points = [(x, y, z) for z in [-1.0, -2.0, -3.0] for y in [10.0, 20.0] for x in [1.0, 2.0, 3.0, 4.0]]
+    x, y, z = [np.array(values) for values in zip(*points)]
+    grid = StructuredGrid(x, y, z)
+    values = np.arange(len(points), dtype=np.float64)
+    assert grid.is_structured
+    assert grid.shape == (3, 2, 4)
+    grid_values = grid.reshape(values)
+    assert np.shares_memory(grid_values, values)
+    for k in range(3):
+        for j in range(2):
+            for i in range(4):
+                element_index = grid.get_element_index(i, j, k)
+                assert points[element_index] == (grid.x_axis[i], grid.y_axis[j], grid.z_axis[k])
+                assert grid_values[k, j, i] == values[element_index]
+    assert np.shares_memory(grid.get_layer(values, 'x', 2), values)
+    assert grid.get_layer(values, 'Z', 1).tolist() == [[16, 17, 18, 19], [20, 21, 22, 23]]
+    assert grid.get_grid_indices(3.0, 20.0, -3.0) == (2, 1, 0)
+    with pytest.raises(ValueError):
+        grid.get_layer(values, 'y', 3)
+    with pytest.raises(ValueError):
+        grid.get_grid_indices(2.5, 20.0, -3.0)
+
+
+def test_structured_grid_other_orders():
+    points = [(x, y, z) for x in [1.0, 2.0] for y in [10.0, 20.0, 30.0] for z in [-1.0, -2.0]]
+    x, y, z = [np.array(values) for values in zip(*points)]
+    grid = StructuredGrid(x, y, z)
+    values = np.stack([np.arange(len(points)), -np.arange(len(points))])
+    grid_values = grid.reshape(values)
+    assert grid_values.shape == (2, 2, 3, 2)
+    for k in range(2):
+        for j in range(3):
+            for i in range(2):
+                element_index = grid.get_element_index(i, j, k)
+                assert points[element_index] == (grid.x_axis[i], grid.y_axis[j], grid.z_axis[k])
+                assert grid_values[1, k, j, i] == -element_index
+
+
+def test_unstructured_grid():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv')
+    grid = results.get_grid()
+    assert results.get_grid() is grid
+    assert not grid.is_structured
+    with pytest.raises(ValueError):
+        grid.reshape(np.zeros(len(grid.coordinates)))
+
+
+def test_tough3_grid_data(tmp_path):
+    write_structured_output(str(tmp_path), [0.5, 1.5, 2.5], [0.5], [-0.5, -1.5, -2.5, -3.5], [0.0, 100.0])
+    results = ResultTough3('tough3', str(tmp_path), 'OUTPUT_ELEME.csv')
+    assert results.get_number_of_layers('x') == 3
+    assert results.get_number_of_layers('z') == 4
+    assert results.get_layer_data('z', 4, 100.0, 'PRES') == [109.0, 110.0, 111.0]
+    assert results.get_layer_data('x', 2, 100.0, 'PRES') == [101.0, 104.0, 107.0, 110.0]
+    grid_data = results.get_grid_data('PRES', 100.0)
+    assert grid_data.shape == (4, 1, 3)
+    assert grid_data[0, 0].tolist() == [109.0, 110.0, 111.0]
+    assert results.get_grid_data('PRES', [0.0, 100.0], 'x', 1).shape == (2, 4, 1)
+    unique_x_data = results.get_unique_x_data(100.0)
+    unique_x_data[0] = -1.0
+    assert results.get_unique_x_data(100.0) == [0.5, 1.5, 2.5]
+    assert not results.get_grid().first_x_row.flags.writeable
+    assert results.get_grid().coordinates[0, 0] == 0.5
+
+
+def test_react_grid_data():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultReact('toughreact', file_path, 'kdd_conc.tec')
+    grid = results.get_grid()
+    assert grid.is_structured
+    assert results.get_grid_data('pH', 0).shape == (1, 1, 1)
+
+
+def test_plane_of_shuffled_2d_grid():
+    points = [(x, 0.0, z) for z in [-1.0, -2.5, -4.0] for x in [1.0, 2.0, 4.0, 8.0]]
+    order = np.random.default_rng(1).permutation(len(points))
+    x, y, z = [np.array(values)[order] for values in zip(*points)]
+    grid = StructuredGrid(x, y, z)
+    values = x * 10 + z
+    plane = grid.get_plane(values, 'X', 'Z')
+    assert plane.shape == (3, 4)
+    assert np.array_equal(plane, grid.x_axis[np.newaxis, :] * 10 + grid.z_axis[:, np.newaxis])
+    assert grid.get_plane(values[1:], 'X', 'Y') is None
+    incomplete = StructuredGrid(x[1:], y[1:], z[1:])
+    assert incomplete.get_plane(values[1:], 'X', 'Z') is None
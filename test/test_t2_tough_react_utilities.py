@@ -0,0 +1,22 @@
+import os
+import shutil
+from pytoughreact.utilities.t2_tough_react_utilities import T2UtilitiesToughReact
+
+
+def test_get_elements_without_temp_files(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, '..', 'examples', 'example_bio', 'MESH'), str(tmp_path))
+    elements = T2UtilitiesToughReact(str(tmp_path), 'CONNE').get_elements()
+    assert len(elements) == 50
+    assert elements[0] == '  a 1'
+    assert sorted(os.listdir(str(tmp_path))) == ['MESH']
+
+
+def test_get_elements_parsed_once(tmp_path, mocker):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'MESH'), str(tmp_path))
+    utility = T2UtilitiesToughReact(str(tmp_path), 'CONNE')
+    first_elements = utility.get_elements()
+    open_spy = mocker.patch('builtins.open', side_effect=AssertionError('MESH read twice'))
+    assert utility.get_elements() == first_elements
+    assert open_spy.call_count == 0
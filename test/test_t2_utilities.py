@@ -0,0 +1,36 @@
+import numpy as np
+from pytoughreact.utilities.t2_utilities import T2Utilities
+from pytoughreact.results.result_tough_3 import ResultTough3
+
+
+def test_remove_repetiting():
+    times = [0.0, 5.0, 5.0, 5.5, 10.0, 0.0, 20.0, 20.2]
+    values = [1, 2, 3, 4, 5, 6, 7, 8]
+    assert T2Utilities().remove_repetiting(times, values) == ([0.0, 5.0, 10.0, 20.0], [1, 2, 5, 7])
+
+
+def test_trim_data_points_in_place():
+    times = [30.0, 1.0, 50.0, 2.0]
+    values = [1, 2, 3, 4]
+    trimmed_times, trimmed_values = T2Utilities().trim_data_points(times, values, 10.0)
+    assert trimmed_times == [30.0, 1.0, 2.0]
+    assert trimmed_values == [1, 2, 4]
+    assert times is trimmed_times
+
+
+def test_duplicate_and_delete_index():
+    utilities = T2Utilities()
+    sequence = [3.0, 1.0, 3.0, 2.0, 1.0, 3.0]
+    assert utilities.duplicate_index(sequence) == [4, 2, 5]
+    assert utilities.del_index(list(sequence), [4, 2, 5]) == [3.0, 1.0, 2.0]
+    results = ResultTough3('tmvoc', None, 'OUTPUT_CONNE.csv')
+    assert results.remove_non_increasing([1.0, 2.0, 2.0, 3.0], [5.0, 6.0, 6.0, 7.0]) == \
+        ([1.0, 2.0, 3.0], [5.0, 6.0, 7.0])
+
+
+def test_remove_repetiting_large_history():
+    times = np.repeat(np.arange(0.0, 2.0e5, 2.0), 5)
+    values = np.arange(len(times), dtype=np.float64)
+    final_times, final_values = T2Utilities().remove_repetiting(times.tolist(), values.tolist())
+    assert final_times == np.arange(0.0, 2.0e5, 2.0).tolist()
+    assert final_values == values[::5].tolist()
@@ -0,0 +1,44 @@
+import os
+import shutil
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.results.t2result import T2Result
+from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.utilities.t2_tough_react_utilities import T2UtilitiesToughReact
+
+
+def test_t2result_parses_once(mocker):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    spy = mocker.spy(ResultStore, 'from_file')
+    with T2Result('tmvoc', 'OUTPUT_CONNE.csv', file_path) as results:
+        assert results.read_file() is results.read_file()
+        times = results.get_times('day')
+        assert len(results.get_time_series_data('FLOW_G', 0)) == len(times)
+        assert len(results.get_grid_data(200, 'FLOW_G')) == 85
+    assert spy.call_count == 1
+    assert results._reader is None
+    results.get_times()
+    assert spy.call_count == 2
+
+
+def test_t2result_react_reuses_reader(mocker):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    spy = mocker.spy(T2UtilitiesToughReact, 'get_elements')
+    results = T2Result('toughreact', 'kdd_conc.tec', file_path)
+    results.get_grid_data(5000, 'pH')
+    results.get_grid_data(10000, 'pH')
+    assert len(results.get_time_series_data('pH', 0)) == len(results.get_times())
+    assert spy.call_count == 1
+    results.close()
+
+
+def test_t2result_close_releases_sidecar(tmp_path):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    shutil.copy(os.path.join(file_path, 'OUTPUT_CONNE.csv'), str(tmp_path))
+    ResultTough3('tmvoc', str(tmp_path), 'OUTPUT_CONNE.csv').export()
+    results = T2Result('tmvoc', 'OUTPUT_CONNE.csv', str(tmp_path))
+    expected = ResultTough3('tmvoc', str(tmp_path), 'OUTPUT_CONNE.csv', use_sidecar=False).get_timeseries_data(
+        'FLOW_G', 3)
+    assert results.get_time_series_data('FLOW_G', 3) == expected
+    archive = results.read_file().get_store()._columns.archive
+    results.close()
+    assert archive.zip is None
@@ -0,0 +1,49 @@
+import os
+import numpy as np
+import pytest
+from pytoughreact.results.time_axis import TimeAxis
+from pytoughreact.results.result_store import ResultStore
+from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.results.result_tough_react import ResultReact
+from pytoughreact.utilities.t2_utilities import T2Utilities
+
+
+def test_time_axis_units():
+    time_axis = TimeAxis([0.0, 3600.0, 86400.0, 3.154e+7])
+    assert time_axis.convert('second').tolist() == [0.0, 3600.0, 86400.0, 3.154e+7]
+    assert time_axis.convert('Hour').tolist() == [0.0, 1.0, 24.0, 3.154e+7 / 3600]
+    assert time_axis.convert('day')[2] == 1.0
+    assert time_axis.convert('year')[3] == 1.0
+    assert time_axis.convert(1800.0).tolist()[1] == 2.0
+    assert time_axis.convert('day') is time_axis.convert(86400)
+    assert not time_axis.convert('day').flags.writeable
+    with pytest.raises(ValueError):
+        time_axis.convert('fortnight')
+    with pytest.raises(ValueError):
+        time_axis.convert(0)
+
+
+def test_convert_times_matches_loop():
+    times = [0.0, 10.0, 12345.678, 9.9e9]
+    for unit, unit_seconds in [('year', 3.154e+7), ('day', 86400), ('hour', 3600), ('minute', 60), ('second', 1)]:
+        assert T2Utilities().convert_times(times, unit) == [time / unit_seconds for time in times]
+
+
+def test_reader_time_axis_is_cached(mocker):
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv')
+    spy = mocker.spy(ResultStore, 'from_file')
+    years = results.convert_times('year')
+    days = results.convert_times('day')
+    assert spy.call_count == 1
+    assert results.get_time_axis() is results.get_time_axis()
+    assert np.allclose(np.asarray(days) / 365.0, np.asarray(years) * 3.154e+7 / 86400 / 365.0)
+    react_results = ResultReact('toughreact', file_path, 'kdd_conc.tec')
+    time_axis = react_results.get_time_axis()
+    assert react_results.get_time_axis() is time_axis
+    assert len(time_axis) == len(react_results.get_zone_index().times)
+    convert_spy = mocker.spy(T2Utilities, 'convert_times')
+    days = react_results.convert_times('day')
+    assert convert_spy.call_count == 0
+    assert days == [time / 86400 for time in react_results.get_times()]
+    assert len(days) == len(react_results.get_timeseries_data('pH', 0))
@@ -0,0 +1,50 @@
+import os
+import numpy as np
+import pytest
+from pytoughreact.results.time_index import TimeIndex
+from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.results.result_tough_react import ResultReact
+
+
+def test_time_index_policies():
+    time_index = TimeIndex([0.0, 10.0, 20.0, 40.0])
+    assert time_index.lookup(14.0) == 1
+    assert time_index.lookup(16.0) == 2
+    assert time_index.lookup(-5.0) == 0
+    assert time_index.lookup(100.0) == 3
+    assert time_index.lookup(16.0, 'floor') == 1
+    assert time_index.lookup(11.0, 'ceil') == 2
+    assert time_index.lookup(20.0, 'exact') == 2
+    assert list(time_index.lookup([5.1, 30.0, 39.0], 'ceil')) == [1, 3, 3]
+    with pytest.raises(ValueError):
+        time_index.lookup(15.0, 'exact')
+    with pytest.raises(ValueError):
+        time_index.lookup(-1.0, 'floor')
+    with pytest.raises(ValueError):
+        time_index.lookup(41.0, 'ceil')
+
+
+def test_time_index_matches_linear_scan():
+    times = np.array([3.0, 1.0, 7.0, 7.0, 12.0])
+    queries = np.linspace(-2.0, 15.0, 70)
+    expected = [int(np.argmin(np.abs(times - query))) for query in queries]
+    sorted_index = TimeIndex(np.sort(times))
+    assert list(sorted_index.lookup(queries)) == [int(np.argmin(np.abs(np.sort(times) - query)))
+                                                  for query in queries]
+    assert [float(times[index]) for index in TimeIndex(times).lookup(queries)] == \
+        [float(times[index]) for index in expected]
+
+
+def test_element_data_for_several_times():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv')
+    times = results.get_store().times
+    stacked = results.get_element_data(times[[0, 5, 21]], 'FLOW_G')
+    assert stacked.shape == (3, 85)
+    assert stacked[1].tolist() == results.get_element_data(times[5], 'FLOW_G')
+    streamed = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv', streaming=True)
+    assert np.array_equal(streamed.get_element_data(times[[0, 5, 21]], 'FLOW_G'), stacked)
+    react_results = ResultReact('toughreact', file_path, 'kdd_conc.tec')
+    react_stacked = react_results.get_element_data([0.0, 10.0, 5000.0], 'pH', policy='floor')
+    assert react_stacked.shape == (3, 1)
+    assert react_stacked[2][0] == react_results.get_element_data(5000.0, 'pH', policy='floor')[0]
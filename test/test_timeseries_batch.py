@@ -0,0 +1,27 @@
+import os
+import numpy as np
+from pytoughreact.results.result_tough_3 import ResultTough3
+from pytoughreact.results.result_tough_react import ResultReact
+
+
+def test_timeseries_batch_tough_3():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv')
+    batch = results.get_timeseries_batch([0, 7, 84], ['FLOW_G', 'X'])
+    assert batch.shape == (22, 3, 2)
+    assert batch[:, 1, 0].tolist() == results.get_timeseries_data('FLOW_G', 7)
+    streamed = ResultTough3('tmvoc', file_path, 'OUTPUT_CONNE.csv', streaming=True)
+    assert np.array_equal(streamed.get_timeseries_batch([0, 7, 84], ['FLOW_G', 'X']), batch)
+    data_table = results.get_timeseries_batch([0, 7, 84], ['FLOW_G', 'X'], as_dataframe=True)
+    assert data_table.shape == (66, 2)
+    assert data_table.loc[(results.get_store().times[3], 84), 'X'] == batch[3, 2, 1]
+
+
+def test_timeseries_batch_tough_react():
+    file_path = os.path.dirname(os.path.realpath(__file__))
+    results = ResultReact('toughreact', file_path, 'kdd_conc.tec')
+    element = results.get_elements()[0]
+    batch = results.get_timeseries_batch([element], ['pH', 'T(C)'])
+    assert batch.shape == (865, 1, 2)
+    times, history = results.data.history([(element, 'pH')])
+    assert np.array_equal(batch[:, 0, 0], history)